@@ -0,0 +1,90 @@
+# fake_nvml.py
+"""
+Fake NVML library for machines without NVIDIA GPUs.
+
+Implements the subset of the pynvml API used by gpu_probe. GPUs are
+described by the POLARIS_FAKE_NVML environment variable as a
+semicolon-separated list of "name:memory_mb[:clock_mhz[:power_w[:util]]]",
+for example:
+
+    POLARIS_FAKE_NVML="NVIDIA GeForce RTX 4090:24564:2520:450;NVIDIA A100-SXM4-80GB:81920"
+
+An empty list ("none") behaves like a host where the driver is missing.
+"""
+import os
+from types import SimpleNamespace
+
+NVML_CLOCK_GRAPHICS = 0
+
+class NVMLError(Exception):
+    pass
+
+_devices = None
+
+def _parse_spec(spec):
+    devices = []
+    for index, entry in enumerate(part for part in spec.split(";") if part.strip()):
+        fields = entry.split(":")
+        numbers = [float(value) for value in fields[1:5]]
+        numbers += [None] * (4 - len(numbers))
+        memory_mb, clock_mhz, power_w, utilization = numbers
+        devices.append({
+            "name": fields[0].strip(),
+            "uuid": f"GPU-00000000-0000-0000-0000-{index:012d}",
+            "memory_mb": memory_mb or 0.0,
+            "clock_mhz": clock_mhz,
+            "power_w": power_w,
+            "utilization": utilization or 0.0,
+        })
+    return devices
+
+def nvmlInit():
+    global _devices
+    spec = os.environ.get("POLARIS_FAKE_NVML", "")
+    if spec.strip().lower() in ("", "none"):
+        raise NVMLError("NVML Shared Library Not Found")
+    _devices = _parse_spec(spec)
+
+def nvmlShutdown():
+    global _devices
+    _devices = None
+
+def _device(handle):
+    if _devices is None:
+        raise NVMLError("Uninitialized")
+    return _devices[handle]
+
+def nvmlDeviceGetCount():
+    if _devices is None:
+        raise NVMLError("Uninitialized")
+    return len(_devices)
+
+def nvmlDeviceGetHandleByIndex(index):
+    if _devices is None or not 0 <= index < len(_devices):
+        raise NVMLError("Invalid Argument")
+    return index
+
+def nvmlDeviceGetName(handle):
+    return _device(handle)["name"]
+
+def nvmlDeviceGetUUID(handle):
+    return _device(handle)["uuid"]
+
+def nvmlDeviceGetMemoryInfo(handle):
+    total = int(_device(handle)["memory_mb"] * 1024**2)
+    return SimpleNamespace(total=total, used=0, free=total)
+
+def nvmlDeviceGetMaxClockInfo(handle, clock_type):
+    clock = _device(handle)["clock_mhz"]
+    if clock is None:
+        raise NVMLError("Not Supported")
+    return int(clock)
+
+def nvmlDeviceGetPowerManagementLimit(handle):
+    power = _device(handle)["power_w"]
+    if power is None:
+        raise NVMLError("Not Supported")
+    return int(power * 1000)
+
+def nvmlDeviceGetUtilizationRates(handle):
+    return SimpleNamespace(gpu=int(_device(handle)["utilization"]), memory=0)
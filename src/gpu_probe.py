@@ -0,0 +1,159 @@
+# gpu_probe.py
+"""
+NVIDIA GPU enumeration.
+
+Gathers name, UUID, memory, max graphics clock, power limit and utilization
+for every GPU. The NVML backend (pynvml) reads all of it in one initialized
+session without forking; when pynvml or the driver library is missing, the
+nvidia-smi backend runs a single CSV query instead. Results are cached for
+the life of the process, so GPU detection and spec collection share one
+probe.
+
+Setting POLARIS_FAKE_NVML (see fake_nvml.py) swaps in a fake NVML library
+so the probes can be exercised on machines without a GPU.
+"""
+import logging
+import os
+import subprocess
+import threading
+
+logger = logging.getLogger('remote_access')
+
+NVIDIA_SMI_QUERY = [
+    "nvidia-smi",
+    "--query-gpu=index,name,uuid,memory.total,clocks.max.graphics,power.limit,utilization.gpu",
+    "--format=csv,noheader,nounits",
+]
+
+_cache_lock = threading.Lock()
+_cached = None
+
+def _load_nvml():
+    if os.environ.get("POLARIS_FAKE_NVML"):
+        from src import fake_nvml
+        return fake_nvml
+    try:
+        import pynvml
+        return pynvml
+    except ImportError:
+        return None
+
+def _text(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def probe_nvml(nvml=None):
+    """
+    Enumerate GPUs through NVML.
+
+    Returns a list of GPU dicts, or None if NVML is unavailable or fails to
+    initialize (no driver, no GPU).
+    """
+    nvml = nvml or _load_nvml()
+    if nvml is None:
+        return None
+    try:
+        nvml.nvmlInit()
+    except Exception as e:
+        logger.debug(f"NVML unavailable: {e}")
+        return None
+
+    try:
+        gpus = []
+        for index in range(nvml.nvmlDeviceGetCount()):
+            handle = nvml.nvmlDeviceGetHandleByIndex(index)
+            gpu = {
+                "index": index,
+                "name": _text(nvml.nvmlDeviceGetName(handle)),
+                "uuid": _text(nvml.nvmlDeviceGetUUID(handle)),
+                "memory_total_mb": nvml.nvmlDeviceGetMemoryInfo(handle).total / (1024**2),
+                "clock_max_mhz": None,
+                "power_limit_w": None,
+                "utilization": None,
+            }
+            # Optional fields are not supported on every board
+            try:
+                gpu["clock_max_mhz"] = float(nvml.nvmlDeviceGetMaxClockInfo(handle, nvml.NVML_CLOCK_GRAPHICS))
+            except Exception:
+                pass
+            try:
+                gpu["power_limit_w"] = nvml.nvmlDeviceGetPowerManagementLimit(handle) / 1000.0
+            except Exception:
+                pass
+            try:
+                gpu["utilization"] = float(nvml.nvmlDeviceGetUtilizationRates(handle).gpu)
+            except Exception:
+                pass
+            gpus.append(gpu)
+        return gpus
+    except Exception as e:
+        logger.warning(f"NVML query failed: {e}")
+        return None
+    finally:
+        try:
+            nvml.nvmlShutdown()
+        except Exception:
+            pass
+
+def parse_nvidia_smi_csv(output):
+    """Parse the output of NVIDIA_SMI_QUERY into GPU dicts."""
+    gpus = []
+    for line in output.splitlines():
+        parts = [part.strip() for part in line.split(",")]
+        if len(parts) < 4:
+            continue
+        parts += [None] * (7 - len(parts))
+        index, name, uuid, memory, clock, power, utilization = parts[:7]
+        gpus.append({
+            "index": int(index) if index.isdigit() else len(gpus),
+            "name": name,
+            "uuid": uuid,
+            "memory_total_mb": _number(memory),
+            "clock_max_mhz": _number(clock),
+            "power_limit_w": _number(power),
+            "utilization": _number(utilization),
+        })
+    return gpus
+
+def probe_nvidia_smi(timeout=15):
+    """
+    Enumerate GPUs with a single nvidia-smi CSV query.
+
+    Returns a list of GPU dicts, or None if nvidia-smi is missing or fails.
+    """
+    try:
+        r = subprocess.run(NVIDIA_SMI_QUERY, capture_output=True, text=True, check=True, timeout=timeout)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"nvidia-smi unavailable: {e}")
+        return None
+    return parse_nvidia_smi_csv(r.stdout)
+
+def probe_gpus(refresh=False):
+    """
+    Enumerate NVIDIA GPUs, trying NVML first and nvidia-smi second.
+
+    Returns (backend, gpus) where backend is "nvml", "nvidia-smi" or None
+    and gpus is a list (empty when no NVIDIA GPU was found). The result is
+    cached for the process unless refresh is set.
+    """
+    global _cached
+    with _cache_lock:
+        if _cached is not None and not refresh:
+            return _cached
+
+        gpus = probe_nvml()
+        backend = "nvml"
+        if gpus is None:
+            gpus = probe_nvidia_smi()
+            backend = "nvidia-smi"
+        if gpus is None:
+            gpus, backend = [], None
+
+        logger.info(f"Found {len(gpus)} NVIDIA GPU(s)" + (f" via {backend}" if backend else ""))
+        _cached = (backend, gpus)
+        return _cached
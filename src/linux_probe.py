@@ -0,0 +1,146 @@
+# linux_probe.py
+"""
+Pure-Python Linux hardware probes.
+
+Reads /proc and /sys directly instead of forking lscpu, lsblk or free. Each
+reader makes a single pass over its file and returns None when the file is
+missing or unreadable (containers, non-Linux hosts), so callers can fall
+back to the subprocess path.
+"""
+import logging
+import os
+
+logger = logging.getLogger('remote_access')
+
+PROC_CPUINFO = "/proc/cpuinfo"
+PROC_MEMINFO = "/proc/meminfo"
+SYS_CPU = "/sys/devices/system/cpu"
+SYS_BLOCK = "/sys/block"
+
+# /sys/block entries that are not physical disks
+VIRTUAL_BLOCK_PREFIXES = ("loop", "ram", "zram", "dm-", "md", "sr", "fd", "nbd")
+
+# /proc/cpuinfo fields kept from the first processor, mapped to lscpu names
+_CPUINFO_FIELDS = {
+    "vendor_id": "Vendor ID",
+    "model name": "Model name",
+    "cpu family": "CPU family",
+    "model": "Model",
+    "stepping": "Stepping",
+}
+
+def _read_first_line(path):
+    try:
+        with open(path) as f:
+            return f.readline().strip()
+    except OSError:
+        return None
+
+def read_cpuinfo(path=PROC_CPUINFO):
+    """
+    Parse /proc/cpuinfo in one pass.
+
+    Returns a dict keyed like lscpu output ("Model name", "CPU(s)",
+    "Socket(s)", ...), or None if the file cannot be read.
+    """
+    info = {}
+    processors = 0
+    cores = set()
+    sockets = set()
+    physical_id = None
+    try:
+        with open(path) as f:
+            for line in f:
+                key, sep, value = line.partition(":")
+                if not sep:
+                    continue
+                key = key.strip()
+                if key == "processor":
+                    processors += 1
+                elif key == "physical id":
+                    physical_id = value.strip()
+                    sockets.add(physical_id)
+                elif key == "core id":
+                    cores.add((physical_id, value.strip()))
+                elif processors == 1 and key in _CPUINFO_FIELDS:
+                    info[_CPUINFO_FIELDS[key]] = value.strip()
+    except OSError as e:
+        logger.debug(f"Cannot read {path}: {e}")
+        return None
+
+    if not processors:
+        return None
+    info["CPU(s)"] = str(processors)
+    if sockets:
+        info["Socket(s)"] = str(len(sockets))
+    if cores:
+        info["Core(s) per socket"] = str(len(cores) // max(len(sockets), 1))
+        info["Thread(s) per core"] = str(processors // len(cores))
+    return info
+
+def read_cpu_topology(root=SYS_CPU):
+    """
+    Read the online CPU list and frequency limits from /sys/devices/system/cpu.
+
+    Returns a dict keyed like lscpu output; missing files are left out.
+    """
+    info = {}
+    online = _read_first_line(os.path.join(root, "online"))
+    if online:
+        info["On-line CPU(s) list"] = online
+    for name, key in (("cpuinfo_max_freq", "CPU max MHz"), ("cpuinfo_min_freq", "CPU min MHz")):
+        khz = _read_first_line(os.path.join(root, "cpu0", "cpufreq", name))
+        if khz and khz.isdigit():
+            info[key] = f"{int(khz) / 1000:.4f}"
+    return info
+
+def read_lscpu_fields():
+    """
+    Gather the lscpu fields available from /proc and /sys without forking.
+
+    Returns None when /proc/cpuinfo is unavailable.
+    """
+    info = read_cpuinfo()
+    if info is None:
+        return None
+    info.update(read_cpu_topology())
+    return info
+
+def read_meminfo_total(path=PROC_MEMINFO):
+    """Return MemTotal from /proc/meminfo in bytes, or None if unavailable."""
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith("MemTotal:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError) as e:
+        logger.debug(f"Cannot read MemTotal from {path}: {e}")
+    return None
+
+def read_block_devices(root=SYS_BLOCK):
+    """
+    List physical block devices from /sys/block.
+
+    Returns a list of dicts with name, rotational (bool), transport ("nvme"
+    or "") and size in bytes, sorted by name, or None if /sys/block cannot
+    be read.
+    """
+    try:
+        names = sorted(os.listdir(root))
+    except OSError as e:
+        logger.debug(f"Cannot list {root}: {e}")
+        return None
+
+    devices = []
+    for name in names:
+        if name.startswith(VIRTUAL_BLOCK_PREFIXES):
+            continue
+        rotational = _read_first_line(os.path.join(root, name, "queue", "rotational"))
+        sectors = _read_first_line(os.path.join(root, name, "size"))
+        devices.append({
+            "name": name,
+            "rotational": rotational == "1",
+            "transport": "nvme" if name.startswith("nvme") else "",
+            "size": int(sectors) * 512 if sectors and sectors.isdigit() else 0,
+        })
+    return devices
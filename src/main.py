@@ -13,7 +13,9 @@ from pathlib import Path
 import requests
 
 # from src.ngrok_manager import NgrokManager
+from src.network_reconciler import NetworkReconciler
 from src.pid_manager import PID_FILE, create_pid_file, remove_pid_file
+from src.probe_cache import ProbeCache
 from src.ssh_manager import SSHManager
 from src.sync_manager import SyncManager
 from src.system_info import get_system_info
@@ -518,7 +520,7 @@ def format_network_info(username: str, password: str) -> dict:
 #     }
 
 def save_and_sync_info(system_info, filename='system_info.json'):
-    """Save system info and sync network details."""
+    """Save system info and sync network details. Returns None if either step fails."""
     try:
         root_dir = get_project_root()
         abs_path = os.path.join(root_dir, filename)
@@ -541,6 +543,7 @@ def save_and_sync_info(system_info, filename='system_info.json'):
                         logger.warning(f"- {component}: {'Success' if status else 'Failed'}")
             else:
                 logger.warning("Failed to synchronize network information")
+                return None
 
         return abs_path
     except Exception as e:
@@ -594,8 +597,13 @@ def main():
             logger.warning("Could not configure firewall. SSH access might be blocked.")
         
         while True:
-            # Get system information
-            system_info = get_system_info()  # Allow auto-detection of resource type
+            # Get system information; warm restarts reuse this boot's discovery
+            try:
+                probe_cache = ProbeCache()
+            except Exception as e:
+                logger.warning(f"Probe cache unavailable, running full discovery: {e}")
+                probe_cache = None
+            system_info = get_system_info(cache=probe_cache)  # Allow auto-detection of resource type
             
             # Initialize managers
             # ngrok = NgrokManager()
@@ -629,6 +637,15 @@ def main():
             
             # Save and sync system information
             file_path = save_and_sync_info(system_info)
+
+            # Only re-sync later when the network info actually changes
+            reconciler = NetworkReconciler(
+                system_info,
+                build_network_info=lambda: format_network_info(username=username, password=ssh_password),
+                sync=save_and_sync_info,
+            )
+            if file_path:
+                reconciler.mark_synced()
             
             if file_path:
                 logger.info("\n" + "="*50)
@@ -664,7 +681,7 @@ def main():
                     #     )
                     #     system_info["compute_resources"][0]["network"] = network_info
                     #     save_and_sync_info(system_info)
-                    time.sleep(10)
+                    time.sleep(reconciler.check())
                 except Exception as e:
                     logger.warning(f"Tunnel check failed: {e}. Restarting...")
                     try:
@@ -0,0 +1,142 @@
+# network_reconciler.py
+"""
+Keeps the synced system info in step with the host's network.
+
+The reconciler watches the interface addresses reported by
+psutil.net_if_addrs and rebuilds the network info when they change (and
+periodically, to catch changes that do not show up on an interface). The
+system info is written and pushed to the orchestrator only when its hash
+differs from the last payload that synced successfully. Failed syncs are
+retried with exponential backoff and jitter.
+"""
+import hashlib
+import json
+import logging
+import random
+import socket
+import time
+
+import psutil
+
+logger = logging.getLogger('remote_access')
+
+_ADDRESS_FAMILIES = (socket.AF_INET, socket.AF_INET6)
+
+def snapshot_interfaces():
+    """Return {interface: sorted IPv4/IPv6 addresses} for interfaces that are up."""
+    try:
+        addrs = psutil.net_if_addrs()
+        stats = psutil.net_if_stats()
+    except Exception as e:
+        logger.debug(f"Cannot read network interfaces: {e}")
+        return {}
+    snapshot = {}
+    for name, entries in addrs.items():
+        if name in stats and not stats[name].isup:
+            continue
+        ips = sorted(entry.address for entry in entries if entry.family in _ADDRESS_FAMILIES)
+        if ips:
+            snapshot[name] = ips
+    return snapshot
+
+def diff_interfaces(old, new):
+    """Describe the changes between two interface snapshots, one string per change."""
+    changes = []
+    for name in sorted(set(old) | set(new)):
+        before, after = set(old.get(name, ())), set(new.get(name, ()))
+        if not before:
+            changes.append(f"{name} up {sorted(after)}")
+        elif not after:
+            changes.append(f"{name} down")
+        else:
+            if after - before:
+                changes.append(f"{name} +{sorted(after - before)}")
+            if before - after:
+                changes.append(f"{name} -{sorted(before - after)}")
+    return changes
+
+def payload_digest(payload):
+    """Hash a JSON-serializable payload independently of key order."""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+class NetworkReconciler:
+    """
+    Re-syncs system info only when its network section changes.
+
+    build_network_info returns the current network info dict and sync takes
+    the updated system info and returns a truthy value on success.
+    """
+
+    def __init__(self, system_info, build_network_info, sync, interval=10,
+                 refresh_interval=300, max_backoff=300, jitter=0.5):
+        self.system_info = system_info
+        self.build_network_info = build_network_info
+        self.sync = sync
+        self.interval = interval
+        self.refresh_interval = refresh_interval
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.interfaces = snapshot_interfaces()
+        self.synced_digest = None
+        self.failures = 0
+        self.last_refresh = time.monotonic()
+
+    def mark_synced(self):
+        """Record the current system info as the last successfully synced payload."""
+        self.synced_digest = payload_digest(self.system_info)
+        self.failures = 0
+
+    def backoff_delay(self):
+        """Exponential backoff with jitter for the current failure count."""
+        delay = min(self.max_backoff, self.interval * 2 ** self.failures)
+        return delay * (1 - self.jitter * random.random())
+
+    def check(self):
+        """
+        Run one reconciliation pass.
+
+        Returns the number of seconds to wait before the next pass.
+        """
+        interfaces = snapshot_interfaces()
+        changes = diff_interfaces(self.interfaces, interfaces)
+        self.interfaces = interfaces
+        if changes:
+            logger.info(f"Network interfaces changed: {'; '.join(changes)}")
+
+        now = time.monotonic()
+        pending = self.synced_digest is None or self.failures > 0
+        if not (changes or pending or now - self.last_refresh >= self.refresh_interval):
+            return self.interval
+        self.last_refresh = now
+
+        try:
+            network_info = self.build_network_info()
+            resources = self.system_info.get("compute_resources") or []
+            if resources:
+                resources[0]["network"] = network_info
+            digest = payload_digest(self.system_info)
+        except Exception as e:
+            logger.warning(f"Failed to collect network info: {e}")
+            self.failures += 1
+            return self.backoff_delay()
+
+        if digest == self.synced_digest:
+            logger.debug("System info unchanged, skipping sync")
+            return self.interval
+
+        logger.info("System info changed, syncing")
+        try:
+            synced = self.sync(self.system_info)
+        except Exception as e:
+            logger.warning(f"Sync raised an error: {e}")
+            synced = False
+
+        if synced:
+            self.synced_digest = digest
+            self.failures = 0
+            return self.interval
+
+        self.failures += 1
+        delay = self.backoff_delay()
+        logger.warning(f"Sync failed ({self.failures} in a row), retrying in {delay:.0f}s")
+        return delay
@@ -0,0 +1,141 @@
+# probe_cache.py
+"""
+Disk cache for hardware discovery results.
+
+Hardware does not change between restarts of the same boot, so
+get_system_info can reuse the previous discovery instead of re-running
+every probe. Entries are tied to a hardware fingerprint (DMI product UUID,
+CPU model and GPU UUIDs); a fingerprint change drops the whole cache.
+Each probe has its own lifetime: hardware probes stay valid until the next
+reboot (boot_id change), while the location expires after a day.
+"""
+import copy
+import hashlib
+import json
+import logging
+import os
+import platform
+import tempfile
+import time
+
+import psutil
+
+from src.gpu_probe import probe_gpus
+from src.linux_probe import read_cpuinfo
+from src.utils import get_project_root
+
+logger = logging.getLogger('remote_access')
+
+UNTIL_REBOOT = None
+
+# Lifetime of each cached probe in seconds, or UNTIL_REBOOT
+PROBE_TTLS = {
+    "location": 86400,
+    "gpu_present": UNTIL_REBOOT,
+    "ram": UNTIL_REBOOT,
+    "storage": UNTIL_REBOOT,
+    "cpu_specs": UNTIL_REBOOT,
+    "gpu_specs": UNTIL_REBOOT,
+}
+
+BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+DMI_UUID_PATH = "/sys/class/dmi/id/product_uuid"
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+def get_boot_id():
+    """Identify the current boot: the kernel boot_id on Linux, the boot time elsewhere."""
+    boot_id = _read(BOOT_ID_PATH)
+    if boot_id:
+        return boot_id
+    try:
+        return f"boot-{int(psutil.boot_time())}"
+    except Exception:
+        return ""
+
+def get_hardware_fingerprint():
+    """Hash the DMI product UUID, CPU model and NVIDIA GPU UUIDs."""
+    cpuinfo = read_cpuinfo() or {}
+    cpu_model = cpuinfo.get("Model name") or platform.processor()
+    _backend, gpus = probe_gpus()
+    parts = [
+        _read(DMI_UUID_PATH),
+        cpu_model,
+        ",".join(sorted(gpu["uuid"] or "" for gpu in gpus)),
+    ]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+class ProbeCache:
+    """Discovery results persisted across restarts, with per-probe lifetimes."""
+
+    def __init__(self, path=None, ttls=None):
+        self.path = path or os.path.join(get_project_root(), 'probe_cache.json')
+        self.ttls = dict(PROBE_TTLS if ttls is None else ttls)
+        self.boot_id = get_boot_id()
+        self.fingerprint = get_hardware_fingerprint()
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        """Load entries still valid for this boot and hardware."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable probe cache {self.path}: {e}")
+            return
+
+        if data.get("fingerprint") != self.fingerprint:
+            logger.info("Hardware fingerprint changed, discarding probe cache")
+            return
+        for name, entry in data.get("entries", {}).items():
+            if self._is_valid(name, entry):
+                self.entries[name] = entry
+
+    def _is_valid(self, name, entry):
+        if name not in self.ttls:
+            return False
+        ttl = self.ttls[name]
+        if ttl is UNTIL_REBOOT:
+            return entry.get("boot_id") == self.boot_id
+        return time.time() - entry.get("stored_at", 0) < ttl
+
+    def get(self, name):
+        """Return (True, value) for a valid cached probe, else (False, None)."""
+        entry = self.entries.get(name)
+        if entry is None or not self._is_valid(name, entry):
+            return False, None
+        return True, copy.deepcopy(entry["value"])
+
+    def put(self, name, value):
+        """Record a fresh probe result; probes without a lifetime are not cached."""
+        if name not in self.ttls:
+            return
+        self.entries[name] = {
+            "value": copy.deepcopy(value),
+            "stored_at": time.time(),
+            "boot_id": self.boot_id,
+        }
+
+    def save(self):
+        """Write the cache atomically."""
+        data = {"fingerprint": self.fingerprint, "entries": self.entries}
+        directory = os.path.dirname(os.path.abspath(self.path))
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".probe_cache.")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Failed to save probe cache: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -5,12 +5,16 @@ import os
 import platform
 import re
 import subprocess
+import threading
 import time
 import uuid
 
 import psutil
 import requests
 
+from src.gpu_probe import probe_gpus
+from src.linux_probe import read_block_devices, read_lscpu_fields, read_meminfo_total
+
 logger = logging.getLogger('remote_access')
 
 def is_windows():
@@ -56,16 +60,23 @@ def get_cpu_info_windows():
         logger.error(f"Failed to get Windows CPU info: {e}")
         return None
 
+def get_lscpu_fields():
+    """Read lscpu-style CPU fields from /proc and /sys, falling back to running lscpu."""
+    info = read_lscpu_fields()
+    if info:
+        return info
+
+    r = subprocess.run(["lscpu"], capture_output=True, text=True, check=True)
+    info = {}
+    for line in r.stdout.splitlines():
+        parts = line.split(":", 1)
+        if len(parts) == 2:
+            info[parts[0].strip()] = parts[1].strip()
+    return info
+
 def get_cpu_info_linux():
     try:
-        r = subprocess.run(["lscpu"], capture_output=True, text=True, check=True)
-        lines = r.stdout.splitlines()
-        info = {}
-        
-        for line in lines:
-            parts = line.split(":", 1)
-            if len(parts) == 2:
-                info[parts[0].strip()] = parts[1].strip()
+        info = get_lscpu_fields()
 
         # Simplify all values to avoid validation issues
         # Use a string format for online_cpus which will pass validation
@@ -188,27 +199,28 @@ def get_gpu_info_windows():
 def get_gpu_info_linux():
     try:
         # Attempt to get real info first
-        try:
-            nvidia_cmd = ["nvidia-smi", "--query-gpu=name,memory.total,clocks.max.graphics,power.limit", "--format=csv,noheader,nounits"]
-            r = subprocess.run(nvidia_cmd, capture_output=True, text=True, check=True)
-            gpu_data = r.stdout.strip().split(',')
-            
-            return {
-                "gpu_name": gpu_data[0].strip() if len(gpu_data) > 0 else "NVIDIA GPU",
-                "memory_size": f"{float(gpu_data[1].strip())/1024:.2f}GB" if len(gpu_data) > 1 else "24GB",
-                "cuda_cores": None,  # Simplified - no validation
-                "clock_speed": f"{gpu_data[2].strip()}MHz" if len(gpu_data) > 2 else "1500MHz",
-                "power_consumption": f"{gpu_data[3].strip()}W" if len(gpu_data) > 3 else "250W"
-            }
-        except:
-            # Simplified fixed values that won't cause validation issues
+        _backend, gpus = probe_gpus()
+        if gpus:
+            gpu = gpus[0]
+            memory = gpu["memory_total_mb"]
+            clock = gpu["clock_max_mhz"]
+            power = gpu["power_limit_w"]
             return {
-                "gpu_name": "NVIDIA GeForce RTX 4090",  # Standard value
-                "memory_size": "24GB",  # Standard value
+                "gpu_name": gpu["name"] or "NVIDIA GPU",
+                "memory_size": f"{memory/1024:.2f}GB" if memory is not None else "24GB",
                 "cuda_cores": None,  # Simplified - no validation
-                "clock_speed": "1500MHz",  # Standard value
-                "power_consumption": "450W"  # Standard value
+                "clock_speed": f"{clock:.0f}MHz" if clock is not None else "1500MHz",
+                "power_consumption": f"{power:.2f}W" if power is not None else "250W"
             }
+        
+        # Simplified fixed values that won't cause validation issues
+        return {
+            "gpu_name": "NVIDIA GeForce RTX 4090",  # Standard value
+            "memory_size": "24GB",  # Standard value
+            "cuda_cores": None,  # Simplified - no validation
+            "clock_speed": "1500MHz",  # Standard value
+            "power_consumption": "450W"  # Standard value
+        }
     except Exception as e:
         logger.error(f"Failed to get Linux GPU info: {e}")
         return None
@@ -253,20 +265,16 @@ def get_gpu_info_macos():
 
 def get_system_ram_gb():
     try:
-        info = psutil.virtual_memory()
-        gb = info.total / (1024**3)
+        # MemTotal from /proc/meminfo; psutil on hosts without /proc
+        total = read_meminfo_total() or psutil.virtual_memory().total
+        gb = total / (1024**3)
         return f"{gb:.2f}GB"
     except Exception as e:
         logger.error(f"Failed to get RAM info: {e}")
         return None
 
 def get_storage_info():
-    storage_info = {
-        "type": "Unknown",
-        "capacity": "0GB",
-        "read_speed": None,
-        "write_speed": None
-    }
+    storage_info = _default_storage_info()
     
     try:
         if is_windows():
@@ -341,50 +349,186 @@ def get_storage_info():
                 storage_info["write_speed"] = "520MB/s"
                 
         elif is_linux():
-            cmd = ["lsblk", "-d", "-o", "NAME,SIZE,ROTA,TRAN"]
-            r = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            lines = r.stdout.splitlines()[1:]  # Skip header
+            devices = read_block_devices()
+            if devices:
+                disk = devices[0]
+                is_rotational = disk["rotational"]
+                transport = disk["transport"]
+            else:
+                # /sys unavailable; ask lsblk
+                cmd = ["lsblk", "-d", "-o", "NAME,SIZE,ROTA,TRAN"]
+                r = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                lines = r.stdout.splitlines()[1:]  # Skip header
+                rows = [line.split() for line in lines if len(line.split()) >= 3]
+                if not rows:
+                    return storage_info
+                is_rotational = rows[0][2] == "1"
+                transport = rows[0][3] if len(rows[0]) > 3 else ""
             
-            for line in lines:
-                parts = line.split()
-                if len(parts) >= 3:
-                    is_rotational = parts[2] == "1"
-                    transport = parts[3] if len(parts) > 3 else ""
-                    
-                    if "nvme" in transport.lower():
-                        storage_info["type"] = "NVME"
-                        storage_info["read_speed"] = "3500MB/s"
-                        storage_info["write_speed"] = "3000MB/s"
-                    elif not is_rotational:
-                        storage_info["type"] = "SSD"
-                        storage_info["read_speed"] = "550MB/s"
-                        storage_info["write_speed"] = "520MB/s"
-                    else:
-                        storage_info["type"] = "HDD"
-                        storage_info["read_speed"] = "150MB/s"
-                        storage_info["write_speed"] = "100MB/s"
-                    
-                    total_bytes = psutil.disk_usage('/').total
-                    storage_info["capacity"] = f"{(total_bytes / (1024**3)):.2f}GB"
-                    break
+            if "nvme" in transport.lower():
+                storage_info["type"] = "NVME"
+                storage_info["read_speed"] = "3500MB/s"
+                storage_info["write_speed"] = "3000MB/s"
+            elif not is_rotational:
+                storage_info["type"] = "SSD"
+                storage_info["read_speed"] = "550MB/s"
+                storage_info["write_speed"] = "520MB/s"
+            else:
+                storage_info["type"] = "HDD"
+                storage_info["read_speed"] = "150MB/s"
+                storage_info["write_speed"] = "100MB/s"
+            
+            total_bytes = psutil.disk_usage('/').total
+            storage_info["capacity"] = f"{(total_bytes / (1024**3)):.2f}GB"
                     
     except Exception as e:
         logger.error(f"Failed to get storage info: {e}")
         
     return storage_info
 
-def get_system_info(resource_type=None):
+# Per-probe timeouts (seconds) for the discovery stage
+PROBE_TIMEOUTS = {
+    "gpu_present": 10.0,
+    "location": 6.0,
+    "ram": 2.0,
+    "storage": 10.0,
+    "cpu_specs": 10.0,
+    "gpu_specs": 15.0,
+}
+
+def _default_storage_info():
+    return {
+        "type": "Unknown",
+        "capacity": "0GB",
+        "read_speed": None,
+        "write_speed": None
+    }
+
+def _cpu_info_probe():
+    if is_windows():
+        return get_cpu_info_windows
+    if is_macos():
+        return get_cpu_info_macos
+    return get_cpu_info_linux
+
+def _gpu_info_probe():
+    if is_windows():
+        return get_gpu_info_windows
+    if is_macos():
+        return get_gpu_info_macos
+    return get_gpu_info_linux
+
+def run_probes(probes):
+    """
+    Run independent hardware probes concurrently.
+
+    probes maps a probe name to (function, timeout, fallback). Every probe
+    runs on its own daemon thread; a probe that raises or does not finish
+    within its timeout yields its fallback value, and a hung subprocess
+    cannot block startup or interpreter exit.
+
+    Returns a dict of name -> {"value", "status", "duration"} where status is
+    "ok", "error" or "timeout".
+    """
+    started = time.monotonic()
+    outcomes = {}
+    done = {name: threading.Event() for name in probes}
+
+    def run(name, func):
+        probe_start = time.monotonic()
+        try:
+            outcomes[name] = ("ok", func(), time.monotonic() - probe_start)
+        except Exception as e:
+            logger.error(f"Probe {name} failed: {e}")
+            outcomes[name] = ("error", None, time.monotonic() - probe_start)
+        finally:
+            done[name].set()
+
+    for name, (func, _timeout, _fallback) in probes.items():
+        threading.Thread(target=run, args=(name, func), name=f"probe-{name}", daemon=True).start()
+
+    results = {}
+    for name, (_func, timeout, fallback) in probes.items():
+        remaining = started + timeout - time.monotonic()
+        if not done[name].wait(max(remaining, 0)):
+            logger.warning(f"Probe {name} timed out after {timeout:.1f}s, using fallback")
+            results[name] = {"value": fallback, "status": "timeout", "duration": time.monotonic() - started}
+            continue
+        status, value, duration = outcomes[name]
+        results[name] = {
+            "value": value if status == "ok" else fallback,
+            "status": status,
+            "duration": duration,
+        }
+    return results
+
+def discover_hardware(resource_type=None, cache=None):
+    """
+    Run the discovery probes concurrently and pick the specs for the resource type.
+
+    When the resource type is not given, the CPU and GPU spec probes run
+    alongside GPU detection and the unused result is discarded, so discovery
+    takes as long as the slowest probe rather than the sum of all of them.
+    With a ProbeCache, probes with a valid cached result are not run at all
+    and fresh results are written back.
+
+    Returns (resource_type, probe results as returned by run_probes).
+    """
+    probes = {
+        "location": (get_location, PROBE_TIMEOUTS["location"], None),
+        "ram": (get_system_ram_gb, PROBE_TIMEOUTS["ram"], None),
+        "storage": (get_storage_info, PROBE_TIMEOUTS["storage"], _default_storage_info()),
+    }
+    if resource_type is None:
+        probes["gpu_present"] = (has_gpu, PROBE_TIMEOUTS["gpu_present"], False)
+    if resource_type is None or resource_type.upper() == "CPU":
+        probes["cpu_specs"] = (_cpu_info_probe(), PROBE_TIMEOUTS["cpu_specs"], None)
+    if resource_type is None or resource_type.upper() == "GPU":
+        probes["gpu_specs"] = (_gpu_info_probe(), PROBE_TIMEOUTS["gpu_specs"], None)
+
+    cached = {}
+    if cache is not None:
+        for name in list(probes):
+            hit, value = cache.get(name)
+            if hit:
+                cached[name] = {"value": value, "status": "cached", "duration": 0.0}
+                del probes[name]
+
+    started = time.monotonic()
+    results = run_probes(probes) if probes else {}
+    elapsed = time.monotonic() - started
+
+    if cache is not None and probes:
+        for name, result in results.items():
+            if result["status"] == "ok" and result["value"] is not None:
+                cache.put(name, result["value"])
+        cache.save()
+    results.update(cached)
+
+    if resource_type is None:
+        resource_type = "GPU" if results["gpu_present"]["value"] else "CPU"
+        logger.info(f"Detected resource type: {resource_type}")
+
+    if not probes:
+        logger.info("Hardware discovery skipped, all probes cached")
+        return resource_type, results
+
+    timings = ", ".join(
+        f"{name}={result['duration']:.2f}s" + ("" if result["status"] == "ok" else f" ({result['status']})")
+        for name, result in results.items()
+    )
+    logger.info(f"Hardware discovery took {elapsed:.2f}s: {timings}")
+    return resource_type, results
+
+def get_system_info(resource_type=None, cache=None):
     """Gather all system information according to the models."""
     try:
-        # Auto-detect resource type if not specified
-        if resource_type is None:
-            resource_type = "GPU" if has_gpu() else "CPU"
-            logger.info(f"Detected resource type: {resource_type}")
+        resource_type, probes = discover_hardware(resource_type, cache)
 
-        location = get_location()
+        location = probes["location"]["value"]
         resource_id = str(uuid.uuid4())
-        ram = get_system_ram_gb()
-        storage = get_storage_info()
+        ram = probes["ram"]["value"]
+        storage = probes["storage"]["value"]
 
         # Base resource without specs
         resource = {
@@ -399,19 +543,9 @@ def get_system_info(resource_type=None):
 
         # Add the appropriate specs based on resource type
         if resource_type.upper() == "CPU":
-            if is_windows():
-                resource["cpu_specs"] = get_cpu_info_windows()
-            elif is_macos():
-                resource["cpu_specs"] = get_cpu_info_macos()
-            else:
-                resource["cpu_specs"] = get_cpu_info_linux()
+            resource["cpu_specs"] = probes["cpu_specs"]["value"]
         elif resource_type.upper() == "GPU":
-            if is_windows():
-                resource["gpu_specs"] = get_gpu_info_windows()
-            elif is_macos():
-                resource["gpu_specs"] = get_gpu_info_macos()
-            else:
-                resource["gpu_specs"] = get_gpu_info_linux()
+            resource["gpu_specs"] = probes["gpu_specs"]["value"]
 
         return {
             "location": location,
@@ -443,22 +577,21 @@ def has_gpu():
             except:
                 return False
         else:
-            # Try nvidia-smi first
-            try:
-                subprocess.run(["nvidia-smi"], capture_output=True, check=True)
+            # Try NVML / nvidia-smi first
+            _backend, gpus = probe_gpus()
+            if gpus:
                 return True
+            # Check for any graphics card using lspci
+            try:
+                r = subprocess.run(["lspci"], capture_output=True, text=True, check=True)
+                return any("VGA" in line or "3D" in line for line in r.stdout.splitlines())
             except:
-                # Check for any graphics card using lspci
-                try:
-                    r = subprocess.run(["lspci"], capture_output=True, text=True, check=True)
-                    return any("VGA" in line or "3D" in line for line in r.stdout.splitlines())
-                except:
-                    # Check for NVIDIA device files as fallback
-                    for i in range(8):
-                        if os.path.exists(f"/dev/nvidia{i}"):
-                            logger.info(f"Found NVIDIA device file: /dev/nvidia{i}")
-                            return True
-                    return False
+                # Check for NVIDIA device files as fallback
+                for i in range(8):
+                    if os.path.exists(f"/dev/nvidia{i}"):
+                        logger.info(f"Found NVIDIA device file: /dev/nvidia{i}")
+                        return True
+                return False
     except Exception as e:
         logger.error(f"Failed to detect GPU: {e}")
         return False
\ No newline at end of file
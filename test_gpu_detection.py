@@ -87,17 +87,24 @@ logger.info("Running has_gpu() function...")
 result = has_gpu()
 logger.info(f"has_gpu() result: {result}")
 
-# Try to get more GPU info with nvidia-smi directly
+# Enumerate GPUs through NVML, or a single nvidia-smi query when NVML is unavailable
 try:
-    import subprocess
-    nvidia_info = subprocess.run(["nvidia-smi"], capture_output=True, text=True)
-    if nvidia_info.returncode == 0:
-        logger.info("NVIDIA-SMI output:")
-        for line in nvidia_info.stdout.split('\n'):
-            logger.info(f"  {line}")
+    try:
+        from gpu_probe import probe_gpus
+    except ImportError:
+        from src.gpu_probe import probe_gpus
+    backend, gpus = probe_gpus(refresh=True)
+    if gpus:
+        logger.info(f"GPU details (via {backend}):")
+        for gpu in gpus:
+            logger.info(
+                f"  [{gpu['index']}] {gpu['name']} {gpu['uuid']} "
+                f"memory={gpu['memory_total_mb']}MiB clock={gpu['clock_max_mhz']}MHz "
+                f"power_limit={gpu['power_limit_w']}W utilization={gpu['utilization']}%"
+            )
     else:
-        logger.error(f"nvidia-smi error: {nvidia_info.stderr}")
+        logger.info("No NVIDIA GPUs found by NVML or nvidia-smi")
 except Exception as e:
-    logger.error(f"Error running nvidia-smi: {e}")
+    logger.error(f"Error enumerating GPUs: {e}")
 
 logger.info("GPU detection test complete.") 
\ No newline at end of file
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Benchmark full metagraph reloads against incremental metagraph sync.
+
+Runs MetagraphSync against a local stub subtensor that holds a synthetic
+subnet. Between syncs a number of neurons change (weight setting, axon
+serving, re-registration). The benchmark compares reloading the metagraph
+every sync with patching only the changed rows, checks after every sync that
+the patched table equals a table built from a full reload, and prints the
+RPC calls, neuron records transferred and time spent per sync. Each RPC and
+each record are charged a simulated network cost.
+
+Usage:
+    python validator/benchmark_metagraph_sync.py [--sizes 256 1024 4096] [--changes 1 10 100] [--seed 0]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add the repository root to the Python path
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from validator.src.validator_node.metagraph_sync import MetagraphSync
+from validator.src.validator_node.miner_table import MinerTable
+
+RPC_COST = 0.02        # Simulated seconds per RPC round trip
+NEURON_COST = 0.002    # Simulated seconds per neuron record transferred
+MARKER_COST = 0.00002  # Simulated seconds per change marker (LastUpdate entry etc.)
+
+
+class StubAxon(SimpleNamespace):
+    def __bool__(self):
+        return bool(self.ip)
+
+    def __str__(self):
+        return f"{self.ip}:{self.port}"
+
+
+class StubSubtensor:
+    """In-memory subtensor with the calls MetagraphSync uses."""
+
+    def __init__(self, size, rng, netuid=49, tempo=360):
+        self.netuid = netuid
+        self._tempo = tempo
+        self.rng = rng
+        self.block = 1000
+        self.calls = 0
+        self.records = 0
+        self.simulated = 0.0
+        self.neurons = [self._new_neuron(uid) for uid in range(size)]
+
+    def _new_neuron(self, uid):
+        return SimpleNamespace(
+            uid=uid,
+            hotkey=f"hotkey-{uid}-{self.block}-{self.rng.random():.6f}",
+            axon_info=StubAxon(ip=f"10.0.{uid // 256}.{uid % 256}", port=8091, block=self.block),
+            stake=round(self.rng.uniform(0, 1000), 3),
+            trust=self.rng.random(),
+            consensus=self.rng.random(),
+            active=self.rng.random() < 0.9,
+            last_update=self.block,
+            registered_at=self.block,
+        )
+
+    def _charge(self, neurons=0, markers=0):
+        self.calls += 1
+        self.records += neurons
+        self.simulated += RPC_COST + neurons * NEURON_COST + markers * MARKER_COST
+
+    def advance(self, blocks, changes):
+        """Move the chain forward and change `changes` random neurons."""
+        self.block += blocks
+        for uid in self.rng.sample(range(len(self.neurons)), changes):
+            kind = self.rng.random()
+            if kind < 0.2:
+                self.neurons[uid] = self._new_neuron(uid)
+            elif kind < 0.5:
+                neuron = self.neurons[uid]
+                neuron.axon_info = StubAxon(ip=neuron.axon_info.ip, port=neuron.axon_info.port + 1, block=self.block)
+            else:
+                neuron = self.neurons[uid]
+                neuron.last_update = self.block
+                neuron.active = True
+
+    def get_current_block(self):
+        self._charge()
+        return self.block
+
+    def tempo(self, netuid):
+        self._charge()
+        return self._tempo
+
+    def metagraph(self, netuid):
+        self._charge(neurons=len(self.neurons))
+        neurons = self.neurons
+        return SimpleNamespace(
+            uids=np.array([n.uid for n in neurons]),
+            hotkeys=[n.hotkey for n in neurons],
+            axons=[n.axon_info for n in neurons],
+            stake=np.array([n.stake for n in neurons]),
+            trust=np.array([n.trust for n in neurons]),
+            consensus=np.array([n.consensus for n in neurons]),
+            active=np.array([n.active for n in neurons]),
+            last_update=np.array([n.last_update for n in neurons]),
+            block=self.block,
+        )
+
+    def neuron_for_uid_lite(self, uid, netuid):
+        self._charge(neurons=1)
+        neuron = self.neurons[uid]
+        return SimpleNamespace(**vars(neuron))
+
+    def query_subtensor(self, name, params=None):
+        self._charge(markers=len(self.neurons))
+        if name == "LastUpdate":
+            return SimpleNamespace(value=[n.last_update for n in self.neurons])
+        raise ValueError(f"Unsupported storage item {name}")
+
+    def query_map_subtensor(self, name, params=None):
+        self._charge(markers=len(self.neurons))
+        if name == "BlockAtRegistration":
+            return [(n.uid, n.registered_at) for n in self.neurons]
+        if name == "Axons":
+            return [(n.hotkey, {"block": n.axon_info.block}) for n in self.neurons]
+        raise ValueError(f"Unsupported storage map {name}")
+
+
+def tables_equal(left, right):
+    """Compare every column of two miner tables."""
+    return (
+        np.array_equal(left.uids, right.uids)
+        and left.hotkeys == right.hotkeys
+        and list(left.axon_keys) == list(right.axon_keys)
+        and np.array_equal(left.stake, right.stake)
+        and np.array_equal(left.trust, right.trust)
+        and np.array_equal(left.consensus, right.consensus)
+        and np.array_equal(left.active, right.active)
+        and np.array_equal(left.has_axon, right.has_axon)
+        and left.hotkey_to_row == right.hotkey_to_row
+    )
+
+
+def run(size, changes, syncs, seed):
+    """Sync one synthetic subnet in both modes and return per-sync costs."""
+    results = {}
+    for mode in ("full", "incremental"):
+        subtensor = StubSubtensor(size, random.Random(seed))
+        sync = MetagraphSync(subtensor, subtensor.netuid, full_resync_interval=float("inf"))
+        sync.sync()
+        subtensor.calls = subtensor.records = 0
+        subtensor.simulated = 0.0
+
+        elapsed = 0.0
+        for _ in range(syncs):
+            # 5 blocks (one minute) per sync; epoch boundaries force the occasional reload
+            subtensor.advance(5, changes)
+            start = time.perf_counter()
+            if mode == "full":
+                sync.full_sync()
+            else:
+                sync.sync()
+            elapsed += time.perf_counter() - start
+
+            calls, records, simulated = subtensor.calls, subtensor.records, subtensor.simulated
+            expected = MinerTable.from_metagraph(subtensor.metagraph(subtensor.netuid))
+            subtensor.calls, subtensor.records, subtensor.simulated = calls, records, simulated
+            if not tables_equal(sync.table, expected):
+                raise SystemExit(f"{mode} sync diverged from a full reload ({size} neurons, {changes} changes)")
+
+        results[mode] = (
+            subtensor.calls / syncs,
+            subtensor.records / syncs,
+            elapsed / syncs,
+            subtensor.simulated / syncs,
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full vs incremental metagraph sync")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[256, 1024, 4096],
+                        help="Numbers of neurons in the subnet")
+    parser.add_argument('--changes', type=int, nargs='+', default=[1, 10, 100],
+                        help="Numbers of neurons changed between syncs")
+    parser.add_argument('--syncs', type=int, default=20, help="Syncs per measurement")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the synthetic subnet")
+    args = parser.parse_args()
+
+    print(f"{'neurons':>8} {'changes':>8} {'mode':>12} {'rpcs':>6} {'records':>8} {'cpu':>10} {'network':>10} {'speedup':>8}")
+    for size in args.sizes:
+        for changes in args.changes:
+            results = run(size, min(changes, size), args.syncs, args.seed)
+            full_cost = results["full"][2] + results["full"][3]
+            for mode, (calls, records, elapsed, simulated) in results.items():
+                print(
+                    f"{size:>8} {changes:>8} {mode:>12} {calls:>6.1f} {records:>8.1f} "
+                    f"{elapsed * 1000:>8.2f}ms {simulated * 1000:>8.1f}ms {full_cost / (elapsed + simulated):>7.1f}x"
+                )
+    print("Incrementally synced tables match a full reload after every sync.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark the scalar and vectorized miner scoring paths.
+
+Generates synthetic miner specs and container usage, scores them with
+resource_scoring.calculate_miner_score (one miner at a time) and with
+batch_scoring.score_miner_table, checks that every breakdown is identical,
+and prints the timings.
+
+Usage:
+    python validator/benchmark_scoring.py [--sizes 1000 10000 100000] [--seed 0]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the repository root to the Python path
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from validator.src.config import ScoringConfig
+from validator.src.utils.batch_scoring import MinerSpecTable, score_miner_table
+from validator.src.utils.resource_scoring import calculate_miner_score
+
+GPU_NAMES = [
+    'NVIDIA GeForce RTX 4090', 'NVIDIA A100-SXM4-80GB', 'NVIDIA H100 PCIe',
+    'Tesla V100-SXM2-16GB', 'NVIDIA L4', 'Quadro P4000',
+]
+
+
+def generate_miners(count, rng):
+    """Generate synthetic hardware specs and container usage keyed by miner ID."""
+    specs = {}
+    containers = {}
+    for index in range(count):
+        miner_id = f"miner-{index}"
+        specs[miner_id] = {
+            'cpu_count': rng.choice([2, 4, 8, 16, 32, 64, 128]),
+            'cpu_speed': round(rng.uniform(1.8, 5.2), 2),
+            'memory': rng.choice([8, 16, 32, 64, 128, 256, 512]),
+            'storage': rng.choice([128, 256, 512, 1000, 2000, 4000]),
+            'bandwidth': rng.choice([100, 500, 1000, 2500, 10000]),
+            'gpus': [
+                {'name': rng.choice(GPU_NAMES), 'memory': rng.choice([8192, 16384, 24576, 40960, 81920])}
+                for _ in range(rng.choice([0, 0, 1, 1, 2, 4, 8]))
+            ],
+        }
+        containers[miner_id] = [
+            {
+                'id': f"{miner_id}-c{slot}",
+                'active_time': rng.uniform(0, 2000),
+                'cpu_utilization': rng.uniform(0, 100),
+                'memory_utilization': rng.uniform(0, 100),
+            }
+            for slot in range(rng.choice([0, 0, 1, 2, 3, 5]))
+        ]
+    return specs, containers
+
+
+def run(count, config, rng):
+    """Score one synthetic population with both paths and return the timings."""
+    specs, containers = generate_miners(count, rng)
+
+    start = time.perf_counter()
+    scalar = {
+        miner_id: calculate_miner_score(specs[miner_id], containers[miner_id], config)
+        for miner_id in specs
+    }
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = MinerSpecTable.from_records(specs, containers)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = score_miner_table(table, config)
+    score_time = time.perf_counter() - start
+
+    mismatched = [miner_id for miner_id, breakdown in scores.to_dict().items() if breakdown != scalar[miner_id]]
+    if mismatched:
+        raise SystemExit(f"{len(mismatched)} breakdowns differ from the scalar path, e.g. {mismatched[0]}")
+
+    return scalar_time, build_time, score_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs vectorized miner scoring")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="Numbers of miners to score")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the synthetic miners")
+    args = parser.parse_args()
+
+    config = ScoringConfig()
+    rng = random.Random(args.seed)
+
+    print(f"{'miners':>8} {'scalar':>10} {'build':>10} {'vector':>10} {'speedup':>9} {'end-to-end':>11}")
+    for count in args.sizes:
+        scalar_time, build_time, score_time = run(count, config, rng)
+        print(
+            f"{count:>8} {scalar_time * 1000:>8.1f}ms {build_time * 1000:>8.1f}ms {score_time * 1000:>8.1f}ms "
+            f"{scalar_time / score_time:>8.1f}x {scalar_time / (build_time + score_time):>10.1f}x"
+        )
+    print("All batch breakdowns match the scalar path.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Check GPU classification and bonus factors against the default scoring config.
+
+Classifies a set of reported GPU names with the catalog built from the
+default ScoringConfig.gpu_bonus_factors and compares each bonus with the
+expected one: model factors win over family factors ("Tesla V100" gets the
+v100 bonus, not the tesla one), and family factors only apply to names that
+contain the family ("NVIDIA L4" gets no Tesla bonus). Exits non-zero on the
+first mismatch.
+
+Usage:
+    python validator/check_gpu_catalog.py
+"""
+
+import os
+import sys
+
+# Add the repository root to the Python path
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from validator.src.config import ScoringConfig
+from validator.src.utils.gpu_catalog import GPUCatalog
+
+# Reported name -> expected bonus under the default ScoringConfig
+EXPECTED_BONUS = {
+    'Tesla V100-SXM2-16GB': 1.8,
+    'Tesla V100-PCIE-16GB': 1.8,
+    'V100': 1.8,
+    'NVIDIA Tesla A100': 2.0,
+    'NVIDIA A100-SXM4-80GB': 2.0,
+    'Tesla H100': 2.5,
+    'NVIDIA H100 PCIe': 2.5,
+    'Tesla T4': 1.5,
+    'Tesla K80': 1.5,
+    'NVIDIA L4': 1.0,
+    'NVIDIA A10': 1.0,
+    'NVIDIA L40S': 1.0,
+    'NVIDIA GeForce RTX 4090': 1.2,
+    'Quadro P4000': 1.0,
+}
+
+
+def main():
+    catalog = GPUCatalog(ScoringConfig().gpu_bonus_factors)
+    failures = 0
+    for name, expected in EXPECTED_BONUS.items():
+        model = catalog.lookup(name)
+        bonus = catalog.bonus(name)
+        status = "ok" if bonus == expected else "FAIL"
+        failures += status != "ok"
+        print(f"{status:>4} {name:<28} {model.key if model else '-':<10} bonus {bonus} (expected {expected})")
+    if failures:
+        raise SystemExit(f"{failures} GPU names got the wrong bonus")
+    print("All GPU names got their expected bonus.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Check that hung miners do not time out healthy ones in the verification engine.
+
+Runs VerificationEngine with a fake probe where some miners hang well past
+the per-miner deadline and the rest answer quickly. Hung probes keep their
+worker thread after timing out, so healthy miners queued behind them have to
+wait for a thread; their deadline must only start once their probe does.
+Exits non-zero if a healthy miner times out or a hung one does not.
+
+Usage:
+    python validator/check_verification_engine.py [--concurrency 2] [--hung 2] [--healthy 4]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the repository root to the Python path
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from validator.src.validator_node.verification_engine import VerificationEngine, VerificationJob
+
+HANG_SECONDS = 3.0
+HEALTHY_SECONDS = 0.1
+MINER_TIMEOUT = 1.0
+
+
+def fake_probe(ssh_string, password, timeout=None, hang=False):
+    """Blocking probe that hangs for hung miners and answers quickly otherwise."""
+    time.sleep(HANG_SECONDS if hang else HEALTHY_SECONDS)
+    return {"resource_type": "CPU", "ssh": ssh_string}
+
+
+async def run(concurrency, hung, healthy):
+    engine = VerificationEngine(probe=fake_probe, concurrency=concurrency,
+                                miner_timeout=MINER_TIMEOUT, cycle_timeout=60.0)
+    jobs = [
+        VerificationJob(f"hung-{index}", f"ssh hung{index}@host -p 22", "pw", probe_kwargs={"hang": True})
+        for index in range(hung)
+    ] + [
+        VerificationJob(f"healthy-{index}", f"ssh ok{index}@host -p 22", "pw")
+        for index in range(healthy)
+    ]
+    return [result async for result in engine.verify(jobs)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check verification deadlines with hung miners")
+    parser.add_argument('--concurrency', type=int, default=2, help="Engine concurrency")
+    parser.add_argument('--hung', type=int, default=2, help="Miners that hang past the deadline")
+    parser.add_argument('--healthy', type=int, default=4, help="Miners that answer quickly")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.concurrency, args.hung, args.healthy))
+    failures = 0
+    for result in sorted(results, key=lambda r: r.miner_id):
+        expect_timeout = result.miner_id.startswith("hung-")
+        status = "ok" if result.timed_out == expect_timeout and (expect_timeout or result.ok) else "FAIL"
+        failures += status != "ok"
+        print(f"{status:>4} {result.miner_id:<10} timed_out={result.timed_out} elapsed={result.elapsed:.2f}s")
+    if failures:
+        raise SystemExit(f"{failures} miners got the wrong verification outcome")
+    print("Only hung miners timed out.")
+
+
+if __name__ == "__main__":
+    main()
@@ -34,8 +34,18 @@ class ApiConfig:
         """Get the full URL for the miners endpoint."""
         return f"{self.base_url}{self.miners_endpoint}"
     
-    def get_containers_url(self) -> str:
-        """Get the full URL for the containers endpoint."""
+    def get_miner_url(self, miner_id: str) -> str:
+        """Get the full URL for a specific miner."""
+        return f"{self.get_miners_url()}/{miner_id}"
+    
+    def get_verify_url(self, miner_id: str) -> str:
+        """Get the full URL for updating a miner's verification status."""
+        return f"{self.get_miner_url(miner_id)}/status"
+    
+    def get_containers_url(self, miner_id: Optional[str] = None) -> str:
+        """Get the full URL for the containers endpoint, optionally for a specific miner."""
+        if miner_id is not None:
+            return f"{self.base_url}{self.containers_endpoint}/miner/{miner_id}"
         return f"{self.base_url}{self.containers_endpoint}"
     
     def get_verification_url(self) -> str:
@@ -121,6 +131,13 @@ class ValidatorConfig:
         self.max_miners_per_validation = int(os.environ.get('MAX_MINERS_PER_VALIDATION', '100'))
         self.ssh_connection_timeout = int(os.environ.get('SSH_CONNECTION_TIMEOUT', '30'))  # In seconds
         self.ssh_command_timeout = int(os.environ.get('SSH_COMMAND_TIMEOUT', '60'))  # In seconds
+        self.ssh_concurrency = int(os.environ.get('SSH_CONCURRENCY', '32'))  # Miners probed at once
+        
+        # Execution settings for CPU-bound parsing and scoring ('inline', 'thread' or 'process')
+        self.execution_strategy = os.environ.get('EXECUTION_STRATEGY', 'inline')
+        self.execution_workers = int(os.environ.get('EXECUTION_WORKERS', '0'))  # 0 = one per CPU
+        self.execution_chunk_size = int(os.environ.get('EXECUTION_CHUNK_SIZE', '64'))
+        self.execution_min_batch_size = int(os.environ.get('EXECUTION_MIN_BATCH_SIZE', '256'))
         
         # Firebase settings
         self.firebase_credentials_path = os.environ.get(
@@ -209,6 +226,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--commune_wallet_path', type=str, help='Path to Commune wallet')
     parser.add_argument('--commune_module_name', type=str, help='Commune module name')
     
+    # Execution settings
+    parser.add_argument('--execution_strategy', type=str, choices=['inline', 'thread', 'process'],
+                        help='Where to run spec parsing and scoring for large batches')
+    parser.add_argument('--execution_workers', type=int, help='Worker pool size (0 for one per CPU)')
+    parser.add_argument('--ssh_concurrency', type=int, help='Maximum number of miners probed at once')
+    
     # Firebase settings
     parser.add_argument('--firebase_credentials_path', type=str, help='Path to Firebase credentials JSON file')
     
@@ -0,0 +1,301 @@
+"""
+Asynchronous API client for interacting with the Polaris API.
+
+AsyncApiClient returns the same ApiResponse objects as ApiClient but runs on
+aiohttp, so validators can await many requests at once over a pool of
+keep-alive connections. Identical GET requests that are already in flight
+share a single request, and each endpoint can be given its own concurrency
+limit.
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+
+from validator.src.config import ApiConfig
+from validator.src.utils.api_client import ApiResponse
+from validator.src.utils.logging_utils import log_exception
+
+logger = logging.getLogger(__name__)
+
+_GetKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class AsyncApiClient:
+    """Asynchronous client for interacting with the Polaris API."""
+
+    def __init__(
+        self,
+        config: ApiConfig,
+        timeout: int = 30,
+        pool_size: int = 100,
+        pool_size_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        endpoint_limits: Optional[Dict[str, int]] = None,
+        default_endpoint_limit: Optional[int] = None
+    ):
+        """
+        Initialize the API client.
+
+        The underlying aiohttp session is created on first use, inside the
+        running event loop.
+
+        Args:
+            config: API configuration
+            timeout: Request timeout in seconds
+            pool_size: Maximum number of open connections (0 for no limit)
+            pool_size_per_host: Maximum number of open connections per host (0 for no limit)
+            keepalive_timeout: Seconds an idle keep-alive connection is kept open
+            endpoint_limits: Maximum concurrent requests per endpoint name
+                (e.g. {"containers": 50})
+            default_endpoint_limit: Limit for endpoints without an explicit one (None for no limit)
+        """
+        self.config = config
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.endpoint_limits = dict(endpoint_limits or {})
+        self.default_endpoint_limit = default_endpoint_limit
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._inflight: Dict[_GetKey, asyncio.Future] = {}
+
+    async def __aenter__(self) -> 'AsyncApiClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    def _get_semaphore(self, endpoint: Optional[str]) -> Optional[asyncio.Semaphore]:
+        """Get the concurrency limiter for an endpoint, if it has a limit."""
+        key = endpoint or 'default'
+        limit = self.endpoint_limits.get(key, self.default_endpoint_limit)
+        if not limit:
+            return None
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(limit)
+        return self._semaphores[key]
+
+    def _handle_request_exception(self, e: Exception, url: str) -> ApiResponse:
+        """
+        Handle request exceptions and return appropriate responses.
+
+        Args:
+            e: The exception that was raised
+            url: The URL that was being requested
+
+        Returns:
+            An API response with error details
+        """
+        if isinstance(e, asyncio.TimeoutError):
+            log_exception(logger, f"Request to {url} timed out", e, include_traceback=False)
+            return ApiResponse.error_response("Request timed out")
+        elif isinstance(e, aiohttp.ClientConnectionError):
+            log_exception(logger, f"Connection error for {url}", e, include_traceback=False)
+            return ApiResponse.error_response("Connection error")
+        elif isinstance(e, aiohttp.ClientError):
+            log_exception(logger, f"Request exception for {url}", e)
+            return ApiResponse.error_response(f"Request failed: {str(e)}")
+        else:
+            log_exception(logger, f"Unexpected error for {url}", e)
+            return ApiResponse.error_response(f"Unexpected error: {str(e)}")
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        ok_statuses: Iterable[int],
+        endpoint: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        data: Any = None,
+        require_json: bool = False
+    ) -> ApiResponse:
+        """
+        Send a request and wrap the result in an ApiResponse.
+
+        Args:
+            method: HTTP method
+            url: The URL to request
+            ok_statuses: Status codes treated as success
+            endpoint: Endpoint name used for concurrency limiting
+            params: Query parameters
+            data: JSON request body
+            require_json: Treat a non-JSON success body as an error (GET semantics)
+
+        Returns:
+            An API response
+        """
+        semaphore = self._get_semaphore(endpoint)
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                async with self._get_session().request(method, url, params=params, json=data) as response:
+                    status = response.status
+                    body = await response.read()
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+
+            if status in ok_statuses:
+                try:
+                    return ApiResponse.success_response(json.loads(body), status)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    if require_json:
+                        log_exception(logger, f"Failed to parse JSON response from {url}", e)
+                        return ApiResponse.error_response("Invalid JSON response", status)
+                    # Some successful responses might not have JSON bodies
+                    return ApiResponse.success_response({}, status)
+            else:
+                error_msg = f"API request failed with status {status}"
+                logger.warning(error_msg)
+                return ApiResponse.error_response(error_msg, status)
+
+        except Exception as e:
+            return self._handle_request_exception(e, url)
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        endpoint: Optional[str] = None
+    ) -> ApiResponse:
+        """
+        Make a GET request to the API.
+
+        Identical GETs (same URL and params) issued while one is in flight are
+        coalesced: every caller receives the same ApiResponse, which must
+        therefore be treated as read-only.
+
+        Args:
+            url: The URL to request
+            params: Query parameters
+            endpoint: Endpoint name used for concurrency limiting
+
+        Returns:
+            An API response
+        """
+        key = (url, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._request('GET', url, (200,), endpoint=endpoint, params=params, require_json=True)
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug(f"Joining in-flight request to {url}")
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(future)
+
+    async def post(self, url: str, data: Any, endpoint: Optional[str] = None) -> ApiResponse:
+        """
+        Make a POST request to the API.
+
+        Args:
+            url: The URL to request
+            data: Request body
+            endpoint: Endpoint name used for concurrency limiting
+
+        Returns:
+            An API response
+        """
+        return await self._request('POST', url, (200, 201, 202), endpoint=endpoint, data=data)
+
+    async def put(self, url: str, data: Any, endpoint: Optional[str] = None) -> ApiResponse:
+        """
+        Make a PUT request to the API.
+
+        Args:
+            url: The URL to request
+            data: Request body
+            endpoint: Endpoint name used for concurrency limiting
+
+        Returns:
+            An API response
+        """
+        return await self._request('PUT', url, (200, 201, 202, 204), endpoint=endpoint, data=data)
+
+    async def patch(self, url: str, data: Any, endpoint: Optional[str] = None) -> ApiResponse:
+        """
+        Make a PATCH request to the API.
+
+        Args:
+            url: The URL to request
+            data: Request body
+            endpoint: Endpoint name used for concurrency limiting
+
+        Returns:
+            An API response
+        """
+        return await self._request('PATCH', url, (200, 201, 202, 204), endpoint=endpoint, data=data)
+
+    async def delete(self, url: str, endpoint: Optional[str] = None) -> ApiResponse:
+        """
+        Make a DELETE request to the API.
+
+        Args:
+            url: The URL to request
+            endpoint: Endpoint name used for concurrency limiting
+
+        Returns:
+            An API response
+        """
+        return await self._request('DELETE', url, (200, 202, 204), endpoint=endpoint)
+
+    # Convenience methods for Polaris API
+
+    async def get_miners(self) -> ApiResponse[List[Dict[str, Any]]]:
+        """Get all miners from the API."""
+        url = self.config.get_miners_url()
+        logger.debug(f"Fetching miners from {url}")
+        return await self.get(url, endpoint='miners')
+
+    async def get_miner(self, miner_id: str) -> ApiResponse[Dict[str, Any]]:
+        """Get a specific miner's details."""
+        url = self.config.get_miner_url(miner_id)
+        logger.debug(f"Fetching miner {miner_id} from {url}")
+        return await self.get(url, endpoint='miner')
+
+    async def get_containers(self, miner_id: str) -> ApiResponse[List[str]]:
+        """Get containers for a specific miner."""
+        url = self.config.get_containers_url(miner_id)
+        logger.debug(f"Fetching containers for miner {miner_id} from {url}")
+        return await self.get(url, endpoint='containers')
+
+    async def get_containers_for_miners(self, miner_ids: Iterable[str]) -> Dict[str, ApiResponse[List[str]]]:
+        """Get containers for many miners concurrently."""
+        miner_ids = list(dict.fromkeys(miner_ids))
+        responses = await asyncio.gather(*(self.get_containers(miner_id) for miner_id in miner_ids))
+        return dict(zip(miner_ids, responses))
+
+    async def verify_miner(self, miner_id: str) -> ApiResponse[Dict[str, Any]]:
+        """Verify a specific miner."""
+        url = self.config.get_verify_url(miner_id)
+        logger.debug(f"Verifying miner {miner_id} via {url}")
+        return await self.patch(url, {"status": "verified"}, endpoint='verify')
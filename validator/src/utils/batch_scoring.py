@@ -0,0 +1,367 @@
+"""
+Vectorized batch scoring for the Polaris validator system.
+
+This module scores many miners at once. Hardware specs and container usage
+are loaded into a columnar MinerSpecTable, and every component score is then
+computed with NumPy array operations instead of per-miner Python loops. The
+per-miner breakdowns are identical to those returned by
+resource_scoring.calculate_miner_score.
+"""
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from validator.src.config import ScoringConfig
+from validator.src.utils.gpu_catalog import get_gpu_catalog
+
+logger = logging.getLogger(__name__)
+
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Convert like float(value), returning None where the scalar scorer would fail."""
+    try:
+        return float(value)
+    except Exception:
+        return None
+
+
+@dataclass
+class MinerSpecTable:
+    """
+    Columnar view of many miners' hardware specs and container usage.
+
+    Per-miner columns have one entry per miner. GPUs and containers are
+    flattened into their own columns with an owner index pointing back at
+    the miner row. ``*_valid`` masks mark rows the scalar scorer would have
+    rejected (and scored 0.0). GPU names are interned: gpu_name_codes
+    indexes into the distinct gpu_names.
+    """
+    miner_ids: List[str]
+
+    cpu_count: np.ndarray
+    cpu_speed: np.ndarray
+    cpu_valid: np.ndarray
+    memory: np.ndarray
+    memory_valid: np.ndarray
+    storage: np.ndarray
+    storage_valid: np.ndarray
+    bandwidth: np.ndarray
+    bandwidth_valid: np.ndarray
+
+    gpu_owner: np.ndarray
+    gpu_memory_mb: np.ndarray
+    gpu_name_codes: np.ndarray
+    gpu_names: List[str]
+    gpu_valid: np.ndarray
+
+    container_owner: np.ndarray
+    container_ids: List[Any]
+    container_active_time: np.ndarray
+    container_cpu_utilization: np.ndarray
+    container_memory_utilization: np.ndarray
+    container_valid: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.miner_ids)
+
+    @classmethod
+    def from_records(
+        cls,
+        hardware_specs: Mapping[str, Dict[str, Any]],
+        containers: Optional[Mapping[str, Sequence[Dict[str, Any]]]] = None,
+    ) -> 'MinerSpecTable':
+        """
+        Build a table from per-miner spec and container dictionaries.
+
+        Args:
+            hardware_specs: Hardware specifications keyed by miner ID
+            containers: Container usage data keyed by miner ID (missing miners have none)
+
+        Returns:
+            A MinerSpecTable with one row per miner in hardware_specs order
+        """
+        containers = containers or {}
+        miner_ids = list(hardware_specs.keys())
+        n = len(miner_ids)
+
+        cpu_count = np.zeros(n)
+        cpu_speed = np.zeros(n)
+        cpu_valid = np.zeros(n, dtype=bool)
+        scalars = {name: (np.zeros(n), np.zeros(n, dtype=bool)) for name in ('memory', 'storage', 'bandwidth')}
+        gpu_valid = np.ones(n, dtype=bool)
+
+        gpu_owner: List[int] = []
+        gpu_memory_mb: List[float] = []
+        gpu_name_codes: List[int] = []
+        gpu_names: Dict[str, int] = {}
+
+        container_owner: List[int] = []
+        container_ids: List[Any] = []
+        container_columns: List[List[float]] = [[], [], []]
+        container_valid: List[bool] = []
+
+        for row, miner_id in enumerate(miner_ids):
+            specs = hardware_specs[miner_id]
+
+            try:
+                cpu_count[row] = int(specs.get('cpu_count', 0))
+                cpu_speed[row] = float(specs.get('cpu_speed', 0.0))
+                cpu_valid[row] = True
+            except Exception:
+                cpu_count[row] = cpu_speed[row] = 0.0
+
+            for name, (values, valid) in scalars.items():
+                value = _as_float(specs.get(name, 0))
+                if value is not None:
+                    values[row] = value
+                    valid[row] = True
+
+            gpus = specs.get('gpus', [])
+            if gpus:
+                try:
+                    first = len(gpu_owner)
+                    for gpu in gpus:
+                        memory_mb = gpu.get('memory', 0)
+                        if not isinstance(memory_mb, _NUMERIC_TYPES):
+                            raise TypeError(f"GPU memory must be numeric, got {type(memory_mb).__name__}")
+                        gpu_owner.append(row)
+                        gpu_memory_mb.append(float(memory_mb))
+                        name = str(gpu.get('name', ''))
+                        gpu_name_codes.append(gpu_names.setdefault(name, len(gpu_names)))
+                except Exception:
+                    # Same outcome as the scalar scorer: the whole GPU score is 0.0
+                    del gpu_owner[first:], gpu_memory_mb[first:], gpu_name_codes[first:]
+                    gpu_valid[row] = False
+
+            for container in containers.get(miner_id) or []:
+                container_owner.append(row)
+                container_ids.append(container.get('id', 'unknown'))
+                values = [
+                    _as_float(container.get('active_time', 0)),
+                    _as_float(container.get('cpu_utilization', 0)),
+                    _as_float(container.get('memory_utilization', 0)),
+                ]
+                ok = all(value is not None for value in values)
+                container_valid.append(ok)
+                for column, value in zip(container_columns, values):
+                    column.append(value if ok else 0.0)
+
+        return cls(
+            miner_ids=miner_ids,
+            cpu_count=cpu_count,
+            cpu_speed=cpu_speed,
+            cpu_valid=cpu_valid,
+            memory=scalars['memory'][0],
+            memory_valid=scalars['memory'][1],
+            storage=scalars['storage'][0],
+            storage_valid=scalars['storage'][1],
+            bandwidth=scalars['bandwidth'][0],
+            bandwidth_valid=scalars['bandwidth'][1],
+            gpu_owner=np.asarray(gpu_owner, dtype=np.int64),
+            gpu_memory_mb=np.asarray(gpu_memory_mb, dtype=np.float64),
+            gpu_name_codes=np.asarray(gpu_name_codes, dtype=np.int64),
+            gpu_names=list(gpu_names),
+            gpu_valid=gpu_valid,
+            container_owner=np.asarray(container_owner, dtype=np.int64),
+            container_ids=container_ids,
+            container_active_time=np.asarray(container_columns[0], dtype=np.float64),
+            container_cpu_utilization=np.asarray(container_columns[1], dtype=np.float64),
+            container_memory_utilization=np.asarray(container_columns[2], dtype=np.float64),
+            container_valid=np.asarray(container_valid, dtype=bool),
+        )
+
+
+@dataclass
+class BatchScores:
+    """Component scores for every miner in a MinerSpecTable, as parallel arrays."""
+    miner_ids: List[str]
+    cpu: np.ndarray
+    gpu: np.ndarray
+    memory: np.ndarray
+    storage: np.ndarray
+    network: np.ndarray
+    hardware_total: np.ndarray
+    container_scores: np.ndarray
+    container_count: np.ndarray
+    container_average: np.ndarray
+    hardware_contribution: np.ndarray
+    container_contribution: np.ndarray
+    final_score: np.ndarray
+    _table: MinerSpecTable
+
+    def breakdown(self, row: int) -> Dict[str, Any]:
+        """Get the calculate_miner_score-shaped breakdown for a single row."""
+        return self._breakdowns([row])[self.miner_ids[row]]
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Get calculate_miner_score-shaped breakdowns for every miner, keyed by miner ID."""
+        return self._breakdowns(range(len(self.miner_ids)))
+
+    def _breakdowns(self, rows) -> Dict[str, Dict[str, Any]]:
+        table = self._table
+        # Group container rows by owner, preserving their original order
+        order = np.argsort(table.container_owner, kind='stable')
+        bounds = np.searchsorted(table.container_owner[order], np.arange(len(self.miner_ids) + 1))
+
+        results = {}
+        for row in rows:
+            count = int(self.container_count[row])
+            if count == 0:
+                containers = {'containers': {}, 'average': 0.0, 'count': 0}
+            else:
+                per_container = {}
+                for index in order[bounds[row]:bounds[row + 1]]:
+                    per_container[table.container_ids[index]] = float(self.container_scores[index])
+                containers = {
+                    'containers': per_container,
+                    'average': float(self.container_average[row]),
+                    'count': count,
+                }
+
+            results[self.miner_ids[row]] = {
+                'hardware': {
+                    'cpu': float(self.cpu[row]),
+                    'gpu': float(self.gpu[row]),
+                    'memory': float(self.memory[row]),
+                    'storage': float(self.storage[row]),
+                    'network': float(self.network[row]),
+                    'total': float(self.hardware_total[row]),
+                },
+                'containers': containers,
+                'final_score': float(self.final_score[row]),
+                'components': {
+                    'hardware_contribution': float(self.hardware_contribution[row]),
+                    'container_contribution': float(self.container_contribution[row]),
+                },
+            }
+        return results
+
+
+def gpu_bonus_factors(names: Sequence[str], config: ScoringConfig) -> np.ndarray:
+    """
+    Look up the bonus multiplier for each distinct GPU name.
+
+    Uses the same GPU catalog as calculate_gpu_score.
+    """
+    catalog = get_gpu_catalog(config.gpu_bonus_factors)
+    return np.array([catalog.bonus(name) for name in names], dtype=np.float64)
+
+
+def score_miner_table(table: MinerSpecTable, config: ScoringConfig) -> BatchScores:
+    """
+    Score every miner in a table with vectorized NumPy operations.
+
+    Args:
+        table: Columnar specs and container usage for all miners
+        config: Scoring configuration
+
+    Returns:
+        Component and final scores for every miner
+    """
+    n = len(table)
+
+    # fmin mirrors min(max_score, raw): a NaN raw score yields max_score
+    cpu = np.where(
+        table.cpu_valid,
+        np.fmin(config.cpu_max_score,
+                table.cpu_count * table.cpu_speed / config.cpu_normalization_factor * config.cpu_max_score),
+        0.0,
+    )
+
+    gpu_raw = table.gpu_memory_mb / 1024.0 * config.gpu_base_factor * gpu_bonus_factors(table.gpu_names, config)[table.gpu_name_codes]
+    gpu_total = np.bincount(table.gpu_owner, weights=gpu_raw, minlength=n)
+    gpu_count = np.bincount(table.gpu_owner, minlength=n)
+    gpu = np.where(table.gpu_valid & (gpu_count > 0), np.fmin(config.gpu_max_score, gpu_total), 0.0)
+
+    memory = np.where(table.memory_valid,
+                      np.fmin(config.memory_max_score, table.memory / config.memory_normalization_factor), 0.0)
+    storage = np.where(table.storage_valid,
+                       np.fmin(config.storage_max_score, table.storage / config.storage_normalization_factor), 0.0)
+    network = np.where(table.bandwidth_valid,
+                       np.fmin(config.network_max_score, table.bandwidth / config.network_normalization_factor), 0.0)
+
+    hardware_total = cpu + gpu + memory + storage + network
+
+    utilization = (table.container_cpu_utilization / 100.0 + table.container_memory_utilization / 100.0) / 2.0
+    capped_active_time = np.minimum(table.container_active_time, 1440)
+    container_raw = capped_active_time * utilization / 1440.0
+    container_scores = np.where(
+        table.container_valid,
+        np.fmin(config.container_max_score, container_raw * config.container_max_score),
+        0.0,
+    )
+
+    container_count = np.bincount(table.container_owner, minlength=n)
+    container_sum = np.bincount(table.container_owner, weights=container_scores, minlength=n)
+    has_containers = container_count > 0
+    container_average = np.divide(container_sum, container_count,
+                                  out=np.zeros(n), where=has_containers)
+
+    hardware_contribution = hardware_total * config.hardware_weight
+    container_contribution = container_average * config.container_weight
+    final_score = np.where(has_containers, hardware_contribution + container_contribution, hardware_total)
+
+    invalid = int(n - table.cpu_valid.sum()) + int(n - table.gpu_valid.sum()) + \
+        int(len(table.container_valid) - table.container_valid.sum())
+    if invalid:
+        logger.warning(f"Scored {invalid} unparseable spec or container entries as 0.0")
+
+    return BatchScores(
+        miner_ids=table.miner_ids,
+        cpu=cpu,
+        gpu=gpu,
+        memory=memory,
+        storage=storage,
+        network=network,
+        hardware_total=hardware_total,
+        container_scores=container_scores,
+        container_count=container_count,
+        container_average=container_average,
+        hardware_contribution=hardware_contribution,
+        container_contribution=container_contribution,
+        final_score=final_score,
+        _table=table,
+    )
+
+
+def calculate_miner_scores_batch(
+    hardware_specs: Mapping[str, Dict[str, Any]],
+    container_data: Optional[Mapping[str, Sequence[Dict[str, Any]]]],
+    config: ScoringConfig,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Batch equivalent of calculate_miner_score for many miners.
+
+    Args:
+        hardware_specs: Hardware specifications keyed by miner ID
+        container_data: Container usage data keyed by miner ID
+        config: Scoring configuration
+
+    Returns:
+        calculate_miner_score-shaped breakdowns keyed by miner ID
+    """
+    table = MinerSpecTable.from_records(hardware_specs, container_data)
+    return score_miner_table(table, config).to_dict()
+
+
+def score_miners_chunk(
+    chunk: List[Tuple[str, Dict[str, Any], Sequence[Dict[str, Any]]]],
+    config: ScoringConfig,
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Score a chunk of miners; the unit of work for utils.execution.BatchExecutor.
+
+    Args:
+        chunk: (miner_id, hardware_specs, container_data) triples
+        config: Scoring configuration
+
+    Returns:
+        (miner_id, breakdown) pairs
+    """
+    hardware_specs = {miner_id: specs for miner_id, specs, _ in chunk}
+    container_data = {miner_id: containers for miner_id, _, containers in chunk}
+    return list(calculate_miner_scores_batch(hardware_specs, container_data, config).items())
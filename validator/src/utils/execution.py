@@ -0,0 +1,166 @@
+"""
+Execution strategies for CPU-bound validator work.
+
+Parsing probe output and scoring miners are pure Python and hold the GIL,
+so for large batches they compete with paramiko's crypto on the validator
+thread. BatchExecutor runs such work inline, on a thread pool, or on a
+process pool. Items are submitted in chunks so that the inter-process
+overhead is paid once per chunk rather than once per miner, and results are
+yielded as each chunk completes.
+"""
+import asyncio
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_STRATEGIES = ('inline', 'thread', 'process')
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# A chunk function takes a list of items and returns a list of results. It
+# must be a module-level function (and its items picklable) for 'process'.
+ChunkFunction = Callable[[List[T]], List[R]]
+
+
+class BatchExecutor:
+    """Runs chunked batch work inline, on threads, or on worker processes."""
+
+    def __init__(self,
+                 strategy: str = 'inline',
+                 max_workers: Optional[int] = None,
+                 chunk_size: int = 64,
+                 min_batch_size: int = 256):
+        """
+        Initialize the executor. Worker pools are created on first use.
+
+        Args:
+            strategy: 'inline', 'thread' or 'process'
+            max_workers: Pool size (default: number of CPUs)
+            chunk_size: Number of items submitted to a worker at a time
+            min_batch_size: Batches smaller than this run inline, since the
+                pool overhead would outweigh the gain
+        """
+        if strategy not in EXECUTION_STRATEGIES:
+            raise ValueError(f"Unknown execution strategy '{strategy}', "
+                             f"expected one of {', '.join(EXECUTION_STRATEGIES)}")
+
+        self.strategy = strategy
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.min_batch_size = min_batch_size
+        self._pool: Optional[Executor] = None
+
+    @classmethod
+    def from_config(cls, config: Any) -> 'BatchExecutor':
+        """Create an executor from the execution_* settings of a ValidatorConfig."""
+        return cls(
+            strategy=config.execution_strategy,
+            max_workers=config.execution_workers or None,
+            chunk_size=config.execution_chunk_size,
+            min_batch_size=config.execution_min_batch_size
+        )
+
+    def __enter__(self) -> 'BatchExecutor':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    def chunks(self, items: Sequence[T]) -> List[List[T]]:
+        """Split items into chunk_size lists."""
+        return [list(items[i:i + self.chunk_size]) for i in range(0, len(items), self.chunk_size)]
+
+    def runs_inline(self, batch_size: int) -> bool:
+        """Whether a batch of this size is processed on the calling thread."""
+        return self.strategy == 'inline' or batch_size < self.min_batch_size
+
+    def map_chunks(self, func: ChunkFunction, items: Sequence[T]) -> Iterator[R]:
+        """
+        Apply a chunk function to items, yielding results as chunks finish.
+
+        Results within a chunk keep their order, but chunks are yielded in
+        completion order, so results should carry their own key.
+
+        Args:
+            func: Function from a list of items to a list of results
+            items: Items to process
+
+        Yields:
+            Results of every chunk
+        """
+        items = list(items)
+        if not items:
+            return
+        if self.runs_inline(len(items)):
+            yield from func(items)
+            return
+
+        pool = self._get_pool()
+        futures = [pool.submit(func, chunk) for chunk in self.chunks(items)]
+        try:
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def map_chunks_async(self, func: ChunkFunction, items: Sequence[T]) -> AsyncIterator[R]:
+        """
+        Async version of map_chunks that keeps the event loop free while
+        the chunks run.
+
+        Args:
+            func: Function from a list of items to a list of results
+            items: Items to process
+
+        Yields:
+            Results of every chunk, in completion order
+        """
+        items = list(items)
+        if not items:
+            return
+        if self.runs_inline(len(items)):
+            for result in func(items):
+                yield result
+            return
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        tasks = [loop.run_in_executor(pool, func, chunk) for chunk in self.chunks(items)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run_chunk(self, func: ChunkFunction, chunk: List[T]) -> List[R]:
+        """
+        Run a single chunk off the event loop (inline for the 'inline' strategy).
+
+        Used by pipelines that form chunks themselves as input streams in.
+        """
+        if self.strategy == 'inline':
+            return func(chunk)
+        return await asyncio.get_running_loop().run_in_executor(self._get_pool(), func, chunk)
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.strategy == 'process':
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix='batch-executor')
+            logger.info(f"Started {self.strategy} pool with {self.max_workers} workers")
+        return self._pool
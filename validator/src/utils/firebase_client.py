@@ -7,19 +7,24 @@ including fetching miner data and container information.
 import os
 import json
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple, Union
 
 import firebase_admin
 from firebase_admin import credentials, firestore
 
 from validator.src.utils.logging_utils import exception_handler
+from validator.src.utils.miner_cache import LiveMinerCache
 
 logger = logging.getLogger(__name__)
 
+# Firestore limits: values in a single 'in' filter, and writes per batch
+FIRESTORE_IN_QUERY_LIMIT = 30
+FIRESTORE_BATCH_LIMIT = 500
+
 class FirebaseClient:
     """Client for interacting with Firebase Firestore database."""
     
-    def __init__(self, credentials_path: Optional[str] = None):
+    def __init__(self, credentials_path: Optional[str] = None, db: Any = None):
         """
         Initialize the Firebase client.
         
@@ -27,10 +32,13 @@ class FirebaseClient:
             credentials_path: Path to the Firebase credentials file.
                 If None, will try to use environment variable FIREBASE_CREDENTIALS_PATH,
                 or fallback to 'firebase_credentials.json' in the current directory.
+            db: An already initialized Firestore client (e.g. one connected to the
+                Firestore emulator, or an in-memory fake). Skips credential setup.
         """
         self.app = None
-        self.db = None
-        self.initialized = False
+        self.db = db
+        self.initialized = db is not None
+        self.miner_cache: Optional[LiveMinerCache] = None
         
         # Get credentials path
         if not credentials_path:
@@ -72,8 +80,55 @@ class FirebaseClient:
             logger.error(f"Failed to initialize Firebase client: {e}")
             return False
     
-    @exception_handler(fallback_return={})
-    def get_registered_miners(self, network: Optional[str] = None) -> Dict[str, Any]:
+    def enable_live_cache(self, use_listener: bool = True, poll_interval: float = 30.0,
+                          wait_timeout: Optional[float] = 10.0) -> bool:
+        """
+        Keep registered miners in an in-memory index that is updated incrementally.
+        
+        Once the initial load completes, get_registered_miners and
+        get_miners_by_status are served from the index instead of scanning
+        the collection.
+        
+        Args:
+            use_listener: Use an on_snapshot listener; if False (or unavailable),
+                poll the collection every poll_interval seconds and apply the diff
+            poll_interval: Seconds between polls in polling mode
+            wait_timeout: Seconds to wait for the initial load
+        
+        Returns:
+            True if the cache is loaded and serving reads
+        """
+        if not self.initialize():
+            logger.error("Cannot enable miner cache: Firebase not initialized")
+            return False
+        
+        if self.miner_cache is None:
+            self.miner_cache = LiveMinerCache(
+                self.db, 'miners', use_listener=use_listener, poll_interval=poll_interval
+            )
+        
+        ready = self.miner_cache.start(wait_timeout)
+        if ready:
+            logger.info(f"Miner cache loaded {len(self.miner_cache.index)} miners "
+                        f"({self.miner_cache.mode})")
+        else:
+            logger.warning("Miner cache not loaded yet; reads will query Firestore until it is")
+        return ready
+    
+    def disable_live_cache(self) -> None:
+        """Stop the live miner cache and go back to querying Firestore."""
+        if self.miner_cache is not None:
+            self.miner_cache.stop()
+            self.miner_cache = None
+    
+    def _live_index(self):
+        """The live miner index, or None if the cache is disabled or still loading."""
+        if self.miner_cache is not None and self.miner_cache.ready.is_set():
+            return self.miner_cache.index
+        return None
+    
+    @exception_handler(logger, "Error retrieving registered miners", fallback_value={})
+    def get_registered_miners(self, network: Optional[str] = None) -> Mapping[str, Any]:
         """
         Get miners registered on the Polaris platform.
         
@@ -82,8 +137,13 @@ class FirebaseClient:
                 If provided, only miners registered for this network will be returned.
         
         Returns:
-            A dictionary mapping miner IDs to their registration data
+            A dictionary mapping miner IDs to their registration data. When the
+            live cache is enabled this is a read-only view of the index.
         """
+        index = self._live_index()
+        if index is not None:
+            return index.by_network(network) if network else index.all()
+        
         if not self.initialize():
             logger.error("Cannot get registered miners: Firebase not initialized")
             return {}
@@ -114,7 +174,32 @@ class FirebaseClient:
             logger.error(f"Error retrieving registered miners: {e}")
             return {}
     
-    @exception_handler(fallback_return={})
+    @exception_handler(logger, "Error retrieving miners by status", fallback_value={})
+    def get_miners_by_status(self, status: str) -> Mapping[str, Any]:
+        """
+        Get registered miners with a given status.
+        
+        Args:
+            status: Status value ('verified', 'unverified', 'pending', etc.)
+        
+        Returns:
+            A dictionary mapping miner IDs to their registration data. When the
+            live cache is enabled this is a read-only view of the index.
+        """
+        index = self._live_index()
+        if index is not None:
+            return index.by_status(status)
+        
+        if not self.initialize():
+            logger.error("Cannot get miners by status: Firebase not initialized")
+            return {}
+        
+        query = self.db.collection('miners').where('status', '==', status)
+        miners_data = {doc.id: doc.to_dict() for doc in query.stream()}
+        logger.info(f"Retrieved {len(miners_data)} miners with status '{status}'")
+        return miners_data
+    
+    @exception_handler(logger, "Error retrieving miner containers", fallback_value=[])
     def get_miner_containers(self, miner_id: str) -> List[Dict[str, Any]]:
         """
         Get container data for a specific miner.
@@ -149,7 +234,44 @@ class FirebaseClient:
             logger.error(f"Error retrieving containers for miner {miner_id}: {e}")
             return []
     
-    @exception_handler(fallback_return=False)
+    @exception_handler(logger, "Error retrieving containers for miners", fallback_value={})
+    def get_containers_for_miners(self, miner_ids: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get container data for many miners with chunked 'in' queries.
+        
+        Args:
+            miner_ids: The IDs of the miners
+        
+        Returns:
+            A dictionary mapping each miner ID to its list of container data
+            dictionaries (empty for miners without containers)
+        """
+        miner_ids = list(dict.fromkeys(miner_ids))
+        containers: Dict[str, List[Dict[str, Any]]] = {miner_id: [] for miner_id in miner_ids}
+        if not miner_ids:
+            return containers
+        
+        if not self.initialize():
+            logger.error("Cannot get miner containers: Firebase not initialized")
+            return containers
+        
+        containers_collection = self.db.collection('containers')
+        
+        for start in range(0, len(miner_ids), FIRESTORE_IN_QUERY_LIMIT):
+            chunk = miner_ids[start:start + FIRESTORE_IN_QUERY_LIMIT]
+            try:
+                for doc in containers_collection.where('miner_id', 'in', chunk).stream():
+                    container = doc.to_dict()
+                    container['id'] = doc.id
+                    containers.setdefault(container.get('miner_id'), []).append(container)
+            except Exception as e:
+                logger.error(f"Error retrieving containers for {len(chunk)} miners: {e}")
+        
+        total = sum(len(items) for items in containers.values())
+        logger.info(f"Retrieved {total} containers for {len(miner_ids)} miners")
+        return containers
+    
+    @exception_handler(logger, "Error updating miner status", fallback_value=False)
     def update_miner_status(self, miner_id: str, status: str, 
                            verification_data: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -190,7 +312,7 @@ class FirebaseClient:
             logger.error(f"Error updating miner {miner_id} status: {e}")
             return False
     
-    @exception_handler(fallback_return=False)
+    @exception_handler(logger, "Error logging verification result", fallback_value=False)
     def log_verification_result(self, miner_id: str, 
                                verification_result: Dict[str, Any]) -> bool:
         """
@@ -222,7 +344,105 @@ class FirebaseClient:
             logger.error(f"Error logging verification result for miner {miner_id}: {e}")
             return False
     
-    @exception_handler(fallback_return=False)
+    @exception_handler(logger, "Error updating miner statuses", fallback_value=0)
+    def update_miner_statuses(self, updates: Dict[str, Tuple[str, Optional[Dict[str, Any]]]]) -> int:
+        """
+        Update the status of many miners using batched writes.
+        
+        Args:
+            updates: Dictionary mapping miner IDs to (status, verification_data) tuples,
+                as passed to update_miner_status
+        
+        Returns:
+            The number of miners successfully updated
+        """
+        if not updates:
+            return 0
+        
+        if not self.initialize():
+            logger.error("Cannot update miner statuses: Firebase not initialized")
+            return 0
+        
+        miners_collection = self.db.collection('miners')
+        writes = []
+        for miner_id, (status, verification_data) in updates.items():
+            update_data = {
+                'status': status,
+                'last_verified': firestore.SERVER_TIMESTAMP
+            }
+            if verification_data:
+                update_data['verification_data'] = verification_data
+            writes.append(('update', miners_collection.document(miner_id), update_data))
+        
+        updated = self._commit_batched(writes)
+        logger.info(f"Updated status for {updated}/{len(writes)} miners")
+        return updated
+    
+    @exception_handler(logger, "Error logging verification results", fallback_value=0)
+    def log_verification_results(self, results: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Log many verification results using batched writes.
+        
+        Args:
+            results: (miner_id, verification_result) pairs, as passed to
+                log_verification_result
+        
+        Returns:
+            The number of results successfully logged
+        """
+        results = list(results)
+        if not results:
+            return 0
+        
+        if not self.initialize():
+            logger.error("Cannot log verification results: Firebase not initialized")
+            return 0
+        
+        logs_collection = self.db.collection('verification_logs')
+        writes = []
+        for miner_id, verification_result in results:
+            entry = dict(verification_result)
+            entry['timestamp'] = firestore.SERVER_TIMESTAMP
+            entry['miner_id'] = miner_id
+            # document() without an ID allocates one, like collection.add()
+            writes.append(('set', logs_collection.document(), entry))
+        
+        logged = self._commit_batched(writes)
+        logger.info(f"Logged {logged}/{len(writes)} verification results")
+        return logged
+    
+    def _commit_batched(self, writes: List[Tuple[str, Any, Dict[str, Any]]]) -> int:
+        """
+        Commit (operation, document_ref, data) writes in WriteBatches of at most
+        FIRESTORE_BATCH_LIMIT operations.
+        
+        Each batch is atomic, so a single bad write (e.g. an update of a miner
+        document that does not exist) fails the whole batch; the writes of a
+        failed batch are retried one at a time so only the bad ones are lost.
+        
+        Returns:
+            The number of writes that committed successfully
+        """
+        committed = 0
+        for start in range(0, len(writes), FIRESTORE_BATCH_LIMIT):
+            chunk = writes[start:start + FIRESTORE_BATCH_LIMIT]
+            batch = self.db.batch()
+            for operation, doc_ref, data in chunk:
+                getattr(batch, operation)(doc_ref, data)
+            try:
+                batch.commit()
+                committed += len(chunk)
+            except Exception as e:
+                logger.warning(f"Failed to commit batch of {len(chunk)} writes, retrying individually: {e}")
+                for operation, doc_ref, data in chunk:
+                    try:
+                        getattr(doc_ref, operation)(data)
+                        committed += 1
+                    except Exception as write_error:
+                        logger.error(f"Failed to {operation} {doc_ref.id}: {write_error}")
+        return committed
+    
+    @exception_handler(logger, "Error logging weight submission", fallback_value=False)
     def log_weight_submission(self, network: str, weights_data: Dict[str, Any]) -> bool:
         """
         Log a weight submission event.
@@ -0,0 +1,204 @@
+"""
+GPU model catalog for the Polaris validator system.
+
+This module classifies reported GPU names (e.g. "NVIDIA A100-SXM4-80GB",
+"Tesla V100-PCIE-16GB") into known model records. All name patterns are
+compiled into a single regular expression, and the most specific match
+wins, so "Tesla V100" is a V100 rather than a generic Tesla card regardless
+of pattern order. Results are memoized per distinct name string, so each
+name is only classified once.
+
+Bonus factors keyed by model apply to every name classified as that model,
+so "Tesla V100" gets the v100 bonus rather than the tesla one. Factors keyed
+by family (e.g. 'tesla') only apply to models without a factor of their own,
+and only when the reported name itself contains the family, as the substring
+matching they replace did: "NVIDIA L4" is an L4 without the Tesla bonus
+while "Tesla T4" gets it.
+"""
+import logging
+import re
+import threading
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GPUModel:
+    """Reference data for a GPU model."""
+    key: str
+    patterns: Tuple[str, ...]
+    vram_gb: float = 0.0
+    tflops_fp32: float = 0.0
+    memory_bandwidth_gbps: float = 0.0
+    family: str = ''
+    bonus: float = 1.0
+
+
+# Known models. Patterns are matched against the normalized name, ignoring
+# punctuation and spacing, so "RTX 4090" and "rtx-4090" both match "rtx4090".
+DEFAULT_GPU_MODELS: Tuple[GPUModel, ...] = (
+    GPUModel('h100', ('h100',), 80, 67.0, 3350, family='tesla'),
+    GPUModel('a100', ('a100',), 80, 19.5, 2039, family='tesla'),
+    GPUModel('v100', ('v100',), 32, 15.7, 900, family='tesla'),
+    GPUModel('l40s', ('l40s',), 48, 91.6, 864, family='tesla'),
+    GPUModel('l40', ('l40',), 48, 90.5, 864, family='tesla'),
+    GPUModel('l4', ('l4',), 24, 30.3, 300, family='tesla'),
+    GPUModel('a10', ('a10',), 24, 31.2, 600, family='tesla'),
+    GPUModel('t4', ('t4',), 16, 8.1, 320, family='tesla'),
+    GPUModel('rtx6000ada', ('rtx6000ada',), 48, 91.1, 960, family='rtx'),
+    GPUModel('rtxa6000', ('rtxa6000', 'a6000'), 48, 38.7, 768, family='rtx'),
+    GPUModel('rtx4090', ('rtx4090', '4090'), 24, 82.6, 1008, family='rtx'),
+    GPUModel('rtx4080', ('rtx4080', '4080'), 16, 48.7, 717, family='rtx'),
+    GPUModel('rtx3090', ('rtx3090', '3090'), 24, 35.6, 936, family='rtx'),
+    GPUModel('rtx3080', ('rtx3080', '3080'), 10, 29.8, 760, family='rtx'),
+)
+
+# Bonus multipliers for powerful GPUs used by the standalone validators,
+# keyed by catalog model
+GPU_BONUS_FACTORS: Dict[str, float] = {'a100': 1.5, 'h100': 2.0, 'rtx3090': 1.3, 'rtx4090': 1.3}
+
+_NORMALIZE_RE = re.compile(r'[^a-z0-9]+')
+_TOKEN_RE = re.compile(r'[a-z]+|[0-9]+')
+_MISSING = object()
+
+
+def normalize_gpu_name(name: str) -> str:
+    """Lower-case a GPU name and collapse punctuation and whitespace to single spaces."""
+    return _NORMALIZE_RE.sub(' ', str(name).lower()).strip()
+
+
+def _pattern_key(pattern: str) -> str:
+    return ''.join(_TOKEN_RE.findall(pattern.lower()))
+
+
+class GPUCatalog:
+    """Compiled index from GPU names to GPUModel records."""
+
+    def __init__(self,
+                 bonus_factors: Optional[Mapping[str, float]] = None,
+                 models: Iterable[GPUModel] = DEFAULT_GPU_MODELS,
+                 max_cached_names: int = 4096):
+        """
+        Compile the catalog.
+
+        Args:
+            bonus_factors: Bonus multiplier per model key or family (e.g.
+                ScoringConfig.gpu_bonus_factors). Model factors win over family
+                factors; family factors only apply to names containing the family. Keys that match no known model or
+                family are added as generic patterns of their own.
+            models: Model records to index
+            max_cached_names: Maximum number of distinct names memoized
+        """
+        bonus_factors = dict(bonus_factors or {})
+        self.max_cached_names = max_cached_names
+
+        # (model, specificity) per pattern; concrete models outrank generic keys
+        entries: Dict[str, Tuple[GPUModel, int]] = {}
+        self._family_bonus: Dict[str, float] = {}
+        self._keyed = set()
+        for model in models:
+            if model.key in bonus_factors:
+                self._keyed.add(model.key)
+                model = replace(model, bonus=bonus_factors[model.key])
+            elif model.family in bonus_factors:
+                self._family_bonus[model.family] = bonus_factors[model.family]
+            for pattern in model.patterns:
+                entries[_pattern_key(pattern)] = (model, 1)
+
+        for key, bonus in bonus_factors.items():
+            pattern = _pattern_key(key)
+            if pattern and pattern not in entries:
+                entries[pattern] = (GPUModel(key, (key,), family=key, bonus=bonus), 0)
+
+        self._entries = entries
+        self._pattern = self._compile(entries) if entries else None
+        self._cache: Dict[str, Optional[GPUModel]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _compile(entries: Mapping[str, Tuple[GPUModel, int]]) -> 're.Pattern':
+        # Longer alternatives first so each position reports its longest
+        # match; the lookahead wrapper reports overlapping matches too.
+        alternatives = []
+        for pattern in sorted(entries, key=len, reverse=True):
+            # Letter and digit runs may be separated by a space ("rtx 4090")
+            body = r' ?'.join(re.escape(token) for token in _TOKEN_RE.findall(pattern))
+            body = (r'(?<![0-9])' if pattern[0].isdigit() else r'(?<![a-z])') + body
+            if pattern[-1].isdigit():
+                # "a100" must not match "a1000"
+                body += r'(?![0-9])'
+            alternatives.append(body)
+        return re.compile(r'(?=(' + '|'.join(alternatives) + r'))')
+
+    def lookup(self, name: str) -> Optional[GPUModel]:
+        """
+        Classify a GPU name.
+
+        Args:
+            name: GPU name as reported by the miner
+
+        Returns:
+            The matching model record, or None if the name is not recognised
+        """
+        cached = self._cache.get(name, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        normalized = normalize_gpu_name(name)
+        model = self._classify(normalized)
+        if (model is not None and model.key not in self._keyed
+                and model.family in self._family_bonus and model.family in normalized):
+            model = replace(model, bonus=self._family_bonus[model.family])
+        with self._lock:
+            if len(self._cache) >= self.max_cached_names:
+                self._cache.clear()
+            self._cache[name] = model
+        return model
+
+    def bonus(self, name: str) -> float:
+        """Get the bonus multiplier for a GPU name (1.0 if unrecognised)."""
+        model = self.lookup(name)
+        return model.bonus if model is not None else 1.0
+
+    def _classify(self, normalized: str) -> Optional[GPUModel]:
+        if self._pattern is None or not normalized:
+            return None
+
+        best: Optional[Tuple[int, int, int]] = None
+        best_model = None
+        for match in self._pattern.finditer(normalized):
+            pattern = match.group(1).replace(' ', '')
+            model, specificity = self._entries[pattern]
+            # Most specific, then longest, then leftmost
+            rank = (specificity, len(pattern), -match.start())
+            if best is None or rank > best:
+                best, best_model = rank, model
+        return best_model
+
+
+_catalogs: Dict[Tuple[Tuple[str, float], ...], GPUCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_gpu_catalog(bonus_factors: Optional[Mapping[str, float]] = None) -> GPUCatalog:
+    """
+    Get a shared catalog for a set of bonus factors, compiling it on first use.
+
+    Args:
+        bonus_factors: Bonus multiplier per model key or family
+
+    Returns:
+        The compiled GPUCatalog
+    """
+    key = tuple(sorted((bonus_factors or {}).items()))
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        with _catalogs_lock:
+            catalog = _catalogs.get(key)
+            if catalog is None:
+                catalog = GPUCatalog(bonus_factors)
+                _catalogs[key] = catalog
+                logger.debug(f"Compiled GPU catalog with {len(catalog._entries)} patterns")
+    return catalog
@@ -0,0 +1,195 @@
+"""
+Batched hardware verification pipeline.
+
+Probing is split so that each kind of work runs where it scales: the SSH
+round trips for every miner are driven from an asyncio event loop (paramiko
+calls run on short-lived worker threads, bounded by a semaphore), while the
+CPU-bound parsing and scoring go through a BatchExecutor, which can use a
+process pool for large batches. Raw probe output is handed to the executor
+in chunks as soon as enough miners have responded, so parsing overlaps with
+the remaining SSH I/O.
+"""
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from validator.src.config import ScoringConfig
+from validator.src.utils.batch_scoring import score_miners_chunk
+from validator.src.utils.execution import BatchExecutor
+from validator.src.utils.spec_cache import SpecCache
+from validator.src.utils.ssh_pool import SSHConnectionPool
+from validator.src.utils.ssh_utils import (
+    collect_raw_specs,
+    create_ssh_client_from_miner_data,
+    get_spec_fingerprint,
+    parse_raw_specs_chunk,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _probe_miner(miner_data: Dict[str, Any],
+                 connection_timeout: int,
+                 command_timeout: int,
+                 pool: Optional[SSHConnectionPool],
+                 cache: Optional[SpecCache],
+                 miner_id: str) -> Optional[Tuple[str, Any, Dict[str, str], float]]:
+    """
+    Run the SSH side of a hardware probe (blocking; called on a worker thread).
+
+    Returns:
+        ('cached', specs, fingerprint, time) on a spec cache hit,
+        ('raw', raw_output, fingerprint, time) otherwise, or None if the
+        miner could not be reached
+    """
+    ssh_client = create_ssh_client_from_miner_data(
+        miner_data, connection_timeout=connection_timeout,
+        command_timeout=command_timeout, pool=pool
+    )
+    if ssh_client is None:
+        return None
+
+    try:
+        if not ssh_client.connect():
+            logger.error(f"Failed to connect to miner {miner_id} for hardware verification")
+            return None
+
+        fingerprint = {}
+        if cache is not None:
+            fingerprint = get_spec_fingerprint(ssh_client)
+            cached_specs = cache.lookup(miner_id, fingerprint)
+            if cached_specs is not None:
+                logger.info(f"Hardware fingerprint unchanged for miner {miner_id}, using cached specs")
+                return 'cached', cached_specs, fingerprint, time.time()
+
+        return 'raw', collect_raw_specs(ssh_client), fingerprint, time.time()
+    finally:
+        ssh_client.close()
+
+
+async def collect_hardware_specs(miners: Mapping[str, Dict[str, Any]],
+                                 executor: BatchExecutor,
+                                 ssh_concurrency: int = 32,
+                                 connection_timeout: int = 30,
+                                 command_timeout: int = 60,
+                                 pool: Optional[SSHConnectionPool] = None,
+                                 cache: Optional[SpecCache] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Probe many miners over SSH and parse their hardware specifications.
+
+    Args:
+        miners: Miner registration data keyed by miner ID
+        executor: Executor used for parsing
+        ssh_concurrency: Maximum number of miners probed at once
+        connection_timeout: SSH connection timeout in seconds
+        command_timeout: SSH command timeout in seconds
+        pool: Optional SSH connection pool
+        cache: Optional spec cache; unchanged miners skip the full probe
+
+    Returns:
+        Hardware specifications keyed by miner ID, for the miners that could be probed
+    """
+    semaphore = asyncio.Semaphore(max(1, ssh_concurrency))
+    fingerprints: Dict[str, Dict[str, str]] = {}
+    specs: Dict[str, Dict[str, Any]] = {}
+    pending: List[Tuple[str, Dict[str, Any], float]] = []
+    parse_tasks: List[asyncio.Future] = []
+    chunk_size = len(miners) if executor.runs_inline(len(miners)) else executor.chunk_size
+
+    async def probe(miner_id: str, miner_data: Dict[str, Any]):
+        async with semaphore:
+            try:
+                result = await asyncio.to_thread(
+                    _probe_miner, miner_data, connection_timeout, command_timeout, pool, cache, miner_id
+                )
+            except Exception as e:
+                logger.error(f"Error probing miner {miner_id}: {e}")
+                result = None
+        return miner_id, result
+
+    def flush():
+        if pending:
+            parse_tasks.append(asyncio.ensure_future(
+                executor.run_chunk(parse_raw_specs_chunk, list(pending))
+            ))
+            pending.clear()
+
+    for next_done in asyncio.as_completed([probe(m, d) for m, d in miners.items()]):
+        miner_id, result = await next_done
+        if result is None:
+            continue
+        kind, payload, fingerprint, collected_at = result
+        if kind == 'cached':
+            specs[miner_id] = payload
+            continue
+        fingerprints[miner_id] = fingerprint
+        pending.append((miner_id, payload, collected_at))
+        if len(pending) >= chunk_size:
+            flush()
+    flush()
+
+    for parsed_chunk in await asyncio.gather(*parse_tasks):
+        for miner_id, miner_specs in parsed_chunk:
+            specs[miner_id] = miner_specs
+            if cache is not None:
+                cache.store(miner_id, fingerprints.get(miner_id, {}), miner_specs)
+
+    logger.info(f"Collected hardware specs for {len(specs)}/{len(miners)} miners")
+    return specs
+
+
+async def score_hardware_specs(specs: Mapping[str, Dict[str, Any]],
+                               executor: BatchExecutor,
+                               config: ScoringConfig,
+                               container_data: Optional[Mapping[str, Sequence[Dict[str, Any]]]] = None
+                               ) -> Dict[str, Dict[str, Any]]:
+    """
+    Score many miners through the executor.
+
+    Args:
+        specs: Hardware specifications keyed by miner ID
+        executor: Executor used for scoring
+        config: Scoring configuration
+        container_data: Container usage data keyed by miner ID
+
+    Returns:
+        calculate_miner_score-shaped breakdowns keyed by miner ID
+    """
+    container_data = container_data or {}
+    items = [(miner_id, miner_specs, list(container_data.get(miner_id, [])))
+             for miner_id, miner_specs in specs.items()]
+
+    scores = {}
+    async for miner_id, breakdown in executor.map_chunks_async(
+            partial(score_miners_chunk, config=config), items):
+        scores[miner_id] = breakdown
+    return scores
+
+
+async def verify_hardware_batch(miners: Mapping[str, Dict[str, Any]],
+                                executor: BatchExecutor,
+                                config: ScoringConfig,
+                                container_data: Optional[Mapping[str, Sequence[Dict[str, Any]]]] = None,
+                                **probe_options: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    Probe, parse and score many miners.
+
+    Args:
+        miners: Miner registration data keyed by miner ID
+        executor: Executor used for parsing and scoring
+        config: Scoring configuration
+        container_data: Container usage data keyed by miner ID
+        **probe_options: Passed on to collect_hardware_specs (ssh_concurrency,
+            connection_timeout, command_timeout, pool, cache)
+
+    Returns:
+        {'specs': ..., 'score': ...} keyed by miner ID, for the miners that could be probed
+    """
+    specs = await collect_hardware_specs(miners, executor, **probe_options)
+    scores = await score_hardware_specs(specs, executor, config, container_data)
+    return {
+        miner_id: {'specs': miner_specs, 'score': scores.get(miner_id)}
+        for miner_id, miner_specs in specs.items()
+    }
@@ -0,0 +1,262 @@
+"""
+Live cache of registered miners.
+
+Instead of streaming the whole Firestore `miners` collection on every
+validation cycle, LiveMinerCache keeps an in-memory MinerIndex up to date
+from an `on_snapshot` listener, which only delivers the documents that were
+added, modified or removed. Where a listener is unavailable (e.g. an
+in-memory fake in tests) it falls back to polling the collection and diffing
+the result against the index.
+"""
+import logging
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_EMPTY: Mapping[str, Dict[str, Any]] = MappingProxyType({})
+
+
+class MinerIndex:
+    """
+    Thread-safe index of miner documents by ID, network and status.
+
+    Readers get read-only views. A view is built once after each change and
+    then reused, so repeated reads between changes are O(1).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_network: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._by_status: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._views: Dict[Tuple[str, Optional[str]], Mapping[str, Dict[str, Any]]] = {}
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, miner_id: str) -> bool:
+        return miner_id in self._by_id
+
+    def get(self, miner_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single miner's data, or None if it is not registered."""
+        return self._by_id.get(miner_id)
+
+    def all(self) -> Mapping[str, Dict[str, Any]]:
+        """Get all miners, keyed by miner ID."""
+        return self._view('id', None, self._by_id)
+
+    def by_network(self, network: str) -> Mapping[str, Dict[str, Any]]:
+        """Get the miners registered for a network, keyed by miner ID."""
+        return self._view('network', network, self._by_network.get(network))
+
+    def by_status(self, status: str) -> Mapping[str, Dict[str, Any]]:
+        """Get the miners with a given status, keyed by miner ID."""
+        return self._view('status', status, self._by_status.get(status))
+
+    def upsert(self, miner_id: str, data: Dict[str, Any]) -> bool:
+        """
+        Add or replace a miner.
+
+        Returns:
+            True if the index changed
+        """
+        with self._lock:
+            previous = self._by_id.get(miner_id)
+            if previous == data:
+                return False
+            if previous is not None:
+                self._unlink(miner_id, previous)
+            self._by_id[miner_id] = data
+            self._link(miner_id, data)
+            self._changed()
+            return True
+
+    def remove(self, miner_id: str) -> bool:
+        """
+        Remove a miner.
+
+        Returns:
+            True if the miner was present
+        """
+        with self._lock:
+            previous = self._by_id.pop(miner_id, None)
+            if previous is None:
+                return False
+            self._unlink(miner_id, previous)
+            self._changed()
+            return True
+
+    def replace_all(self, miners: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Bring the index in line with a full listing of the collection.
+
+        Only the miners that differ are touched.
+
+        Returns:
+            The number of miners added, modified or removed
+        """
+        with self._lock:
+            changes = 0
+            for miner_id in [m for m in self._by_id if m not in miners]:
+                changes += self.remove(miner_id)
+            for miner_id, data in miners.items():
+                changes += self.upsert(miner_id, data)
+            return changes
+
+    def _link(self, miner_id: str, data: Dict[str, Any]) -> None:
+        network, status = data.get('network'), data.get('status')
+        if network is not None:
+            self._by_network.setdefault(network, {})[miner_id] = data
+        if status is not None:
+            self._by_status.setdefault(status, {})[miner_id] = data
+
+    def _unlink(self, miner_id: str, data: Dict[str, Any]) -> None:
+        for bucket_map, key in ((self._by_network, data.get('network')),
+                                (self._by_status, data.get('status'))):
+            bucket = bucket_map.get(key)
+            if bucket is not None:
+                bucket.pop(miner_id, None)
+                if not bucket:
+                    del bucket_map[key]
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._views.clear()
+
+    def _view(self, kind: str, key: Optional[str],
+              source: Optional[Dict[str, Dict[str, Any]]]) -> Mapping[str, Dict[str, Any]]:
+        with self._lock:
+            view = self._views.get((kind, key))
+            if view is None:
+                # Copy so readers can iterate while the listener keeps writing
+                view = MappingProxyType(dict(source)) if source else _EMPTY
+                self._views[(kind, key)] = view
+            return view
+
+
+class LiveMinerCache:
+    """Keeps a MinerIndex in sync with a Firestore collection."""
+
+    def __init__(self, db: Any, collection: str = 'miners', use_listener: bool = True,
+                 poll_interval: float = 30.0):
+        """
+        Initialize the cache. Call start() to begin syncing.
+
+        Args:
+            db: Firestore client (or emulator client / in-memory fake)
+            collection: Name of the collection holding the miners
+            use_listener: Use an on_snapshot listener. If False, or if the
+                listener cannot be attached, the collection is polled instead.
+            poll_interval: Seconds between polls in polling mode
+        """
+        self.db = db
+        self.collection = collection
+        self.use_listener = use_listener
+        self.poll_interval = poll_interval
+
+        self.index = MinerIndex()
+        self.ready = threading.Event()
+
+        self._watch = None
+        self._stop = threading.Event()
+        self._poll_thread: Optional[threading.Thread] = None
+
+    @property
+    def mode(self) -> Optional[str]:
+        """'listener', 'polling', or None if not started."""
+        if self._watch is not None:
+            return 'listener'
+        if self._poll_thread is not None:
+            return 'polling'
+        return None
+
+    def start(self, wait_timeout: Optional[float] = 10.0) -> bool:
+        """
+        Start syncing and wait for the initial load.
+
+        Args:
+            wait_timeout: Seconds to wait for the first full snapshot (None to wait forever)
+
+        Returns:
+            True if the initial load completed in time
+        """
+        if self.mode is not None:
+            return self.ready.wait(wait_timeout)
+
+        self._stop.clear()
+        if self.use_listener:
+            try:
+                self._watch = self.db.collection(self.collection).on_snapshot(self._on_snapshot)
+                logger.info(f"Listening for changes to '{self.collection}'")
+            except Exception as e:
+                logger.warning(f"Could not attach snapshot listener, falling back to polling: {e}")
+                self._watch = None
+
+        if self._watch is None:
+            self.poll_once()
+            self._poll_thread = threading.Thread(
+                target=self._poll_loop, name='miner-cache-poll', daemon=True
+            )
+            self._poll_thread.start()
+            logger.info(f"Polling '{self.collection}' every {self.poll_interval}s")
+
+        return self.ready.wait(wait_timeout)
+
+    def stop(self) -> None:
+        """Stop syncing. The index keeps its last contents."""
+        if self._watch is not None:
+            try:
+                self._watch.unsubscribe()
+            except Exception as e:
+                logger.warning(f"Error unsubscribing from '{self.collection}': {e}")
+            self._watch = None
+        self._stop.set()
+        if self._poll_thread is not None:
+            self._poll_thread.join(timeout=self.poll_interval)
+            self._poll_thread = None
+        self.ready.clear()
+
+    def poll_once(self) -> int:
+        """
+        Stream the collection once and apply the differences to the index.
+
+        Returns:
+            The number of miners added, modified or removed (0 on failure)
+        """
+        try:
+            miners = {doc.id: doc.to_dict() for doc in self.db.collection(self.collection).stream()}
+        except Exception as e:
+            logger.error(f"Error polling '{self.collection}': {e}")
+            return 0
+
+        changes = self.index.replace_all(miners)
+        self.ready.set()
+        if changes:
+            logger.debug(f"Applied {changes} miner changes from poll")
+        return changes
+
+    def _poll_loop(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self.poll_once()
+
+    def _on_snapshot(self, docs: Iterable[Any], changes: Iterable[Any], read_time: Any) -> None:
+        # Runs on the listener's thread. The first callback lists every
+        # document as ADDED; later ones only carry what changed.
+        applied = 0
+        for change in changes:
+            doc = change.document
+            if _change_type(change) == 'REMOVED':
+                applied += self.index.remove(doc.id)
+            else:
+                applied += self.index.upsert(doc.id, doc.to_dict())
+        self.ready.set()
+        if applied:
+            logger.debug(f"Applied {applied} miner changes from snapshot")
+
+
+def _change_type(change: Any) -> str:
+    change_type = change.type
+    return getattr(change_type, 'name', change_type)
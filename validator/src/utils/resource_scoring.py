@@ -9,6 +9,7 @@ import logging
 from typing import Dict, Any, List, Tuple, Optional
 
 from validator.src.config import ScoringConfig
+from validator.src.utils.gpu_catalog import get_gpu_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -55,21 +56,19 @@ def calculate_gpu_score(specs: Dict[str, Any], config: ScoringConfig) -> float:
             return 0.0
         
         total_gpu_score = 0.0
+        catalog = get_gpu_catalog(config.gpu_bonus_factors)
         
         for gpu in gpus:
             # Extract GPU details
             memory_mb = gpu.get('memory', 0)  # Memory in MB
             memory_gb = memory_mb / 1024.0  # Convert to GB
-            name = str(gpu.get('name', '')).lower()
+            name = str(gpu.get('name', ''))
             
             # Base score based on memory
             gpu_score = memory_gb * config.gpu_base_factor
             
-            # Apply bonus for specific GPU types
-            for gpu_type, bonus_factor in config.gpu_bonus_factors.items():
-                if gpu_type in name:
-                    gpu_score *= bonus_factor
-                    break
+            # Apply bonus for the most specific matching GPU model
+            gpu_score *= catalog.bonus(name)
             
             total_gpu_score += gpu_score
         
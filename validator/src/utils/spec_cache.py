@@ -0,0 +1,196 @@
+"""
+Verified compute spec cache with change detection.
+
+Miner hardware almost never changes between validation cycles. This module
+caches the last verified specs for each miner together with a cheap remote
+fingerprint (boot ID, /proc/cpuinfo hash, GPU UUIDs and MemTotal). Later
+cycles only fetch the fingerprint and skip the full hardware probe unless it
+changed or the cache entry expired. The cache is persisted to disk so it
+survives validator restarts.
+"""
+import copy
+import json
+import logging
+import os
+import shlex
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / '.polaris' / 'validator' / 'spec_cache.json'
+
+# Fields that must be present for a fingerprint to be trusted
+REQUIRED_FINGERPRINT_FIELDS = ('boot_id', 'cpuinfo', 'memtotal')
+
+# One round trip, key=value per line. "cpu MHz" lines are dropped before
+# hashing because they change continuously with frequency scaling.
+FINGERPRINT_COMMAND = "sh -c " + shlex.quote("; ".join([
+    'echo boot_id=$(cat /proc/sys/kernel/random/boot_id 2>/dev/null)',
+    'echo cpuinfo=$(grep -v MHz /proc/cpuinfo 2>/dev/null | sha256sum | cut -d " " -f 1)',
+    'echo gpus=$(nvidia-smi -L 2>/dev/null | grep -o "GPU-[0-9a-fA-F-]*" | sort | tr "\\n" ",")',
+    'echo memtotal=$(grep MemTotal /proc/meminfo 2>/dev/null | tr -s " " | cut -d " " -f 2)',
+]))
+
+
+def parse_fingerprint(output: str) -> Dict[str, str]:
+    """
+    Parse the output of FINGERPRINT_COMMAND.
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        The fingerprint fields, or an empty dict if the output is incomplete
+        (e.g. a non-Linux host), in which case the full probe must run.
+    """
+    fingerprint = {}
+    for line in (output or '').splitlines():
+        key, sep, value = line.partition('=')
+        if sep:
+            fingerprint[key.strip()] = value.strip()
+
+    if not all(fingerprint.get(field) for field in REQUIRED_FINGERPRINT_FIELDS):
+        return {}
+    return fingerprint
+
+
+class SpecCache:
+    """Disk-backed cache of verified compute specs keyed by miner ID."""
+
+    def __init__(self,
+                 path: Union[str, Path, None] = DEFAULT_CACHE_PATH,
+                 ttl: float = 86400.0,
+                 autosave_interval: float = 60.0):
+        """
+        Initialize the spec cache and load any persisted entries.
+
+        Args:
+            path: JSON file used to persist the cache, or None to keep it in memory
+            ttl: Seconds after which an entry forces a full re-probe even if the
+                fingerprint is unchanged
+            autosave_interval: Minimum seconds between automatic saves on store()
+        """
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self.autosave_interval = autosave_interval
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.time()
+
+        self.load()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def lookup(self, miner_id: str, fingerprint: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Get cached specs if the miner's fingerprint is unchanged and the entry is fresh.
+
+        Args:
+            miner_id: The ID of the miner
+            fingerprint: Fingerprint just fetched from the miner
+
+        Returns:
+            A copy of the cached specs, or None if a full probe is required
+        """
+        if not fingerprint:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(miner_id)
+            if entry is None:
+                return None
+            if time.time() - entry['verified_at'] > self.ttl:
+                logger.debug(f"Spec cache entry for miner {miner_id} expired")
+                return None
+            if entry['fingerprint'] != fingerprint:
+                logger.info(f"Hardware fingerprint changed for miner {miner_id}")
+                return None
+            return copy.deepcopy(entry['specs'])
+
+    def store(self, miner_id: str, fingerprint: Dict[str, str], specs: Dict[str, Any]) -> None:
+        """
+        Record freshly probed specs for a miner.
+
+        Entries without a usable fingerprint are not cached.
+
+        Args:
+            miner_id: The ID of the miner
+            fingerprint: Fingerprint fetched alongside the specs
+            specs: Specs returned by the full probe
+        """
+        if not fingerprint:
+            return
+
+        with self._lock:
+            self._entries[miner_id] = {
+                'fingerprint': dict(fingerprint),
+                'specs': copy.deepcopy(specs),
+                'verified_at': time.time(),
+            }
+            self._dirty = True
+            due = time.time() - self._last_save >= self.autosave_interval
+
+        if due:
+            self.save()
+
+    def invalidate(self, miner_id: str) -> None:
+        """Drop a miner's entry so its next verification runs the full probe."""
+        with self._lock:
+            if self._entries.pop(miner_id, None) is not None:
+                self._dirty = True
+
+    def load(self) -> None:
+        """Load persisted entries, ignoring a missing or corrupt cache file."""
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+            if not isinstance(entries, dict):
+                raise ValueError("cache file is not a JSON object")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable spec cache at {self.path}: {e}")
+            return
+
+        with self._lock:
+            self._entries = entries
+        logger.info(f"Loaded {len(entries)} cached miner specs from {self.path}")
+
+    def save(self) -> bool:
+        """
+        Persist the cache atomically if it changed since the last save.
+
+        Returns:
+            True if the cache is on disk and up to date, False otherwise
+        """
+        if self.path is None:
+            return False
+
+        with self._lock:
+            if not self._dirty:
+                return True
+            snapshot = json.dumps(self._entries)
+            self._dirty = False
+            self._last_save = time.time()
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix='.spec_cache.')
+            with os.fdopen(fd, 'w') as f:
+                f.write(snapshot)
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save spec cache to {self.path}: {e}")
+            with self._lock:
+                self._dirty = True
+            return False
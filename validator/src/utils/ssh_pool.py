@@ -0,0 +1,301 @@
+"""
+Pooled SSH connections for miner verification.
+
+Validators re-probe the same miners every cycle. This module keeps
+authenticated paramiko transports open between probes, keyed by
+(host, port, username, credentials), so repeat verifications skip the key
+exchange and authentication handshake. The credentials are part of the key
+so a caller only ever reuses a session that its own password or key opened.
+"""
+import hashlib
+import hmac
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import paramiko
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, int, str, str]
+
+
+class _PooledConnection:
+    """A pooled client and its bookkeeping."""
+
+    __slots__ = ('client', 'last_used', 'leases')
+
+    def __init__(self, client: paramiko.SSHClient):
+        self.client = client
+        self.last_used = time.monotonic()
+        self.leases = 0
+
+
+class SSHConnectionPool:
+    """Thread-safe LRU pool of authenticated SSH connections."""
+
+    def __init__(self,
+                 max_open: int = 64,
+                 idle_ttl: float = 300.0,
+                 keepalive_interval: int = 30,
+                 acquire_timeout: float = 30.0):
+        """
+        Initialize the connection pool.
+
+        Args:
+            max_open: Maximum number of connections kept open at once
+            idle_ttl: Seconds an unused connection is kept before it is closed
+            keepalive_interval: Transport keepalive interval in seconds (0 disables)
+            acquire_timeout: Seconds to wait for a free slot when the pool is full
+        """
+        self.max_open = max(1, int(max_open))
+        self.idle_ttl = idle_ttl
+        self.keepalive_interval = keepalive_interval
+        self.acquire_timeout = acquire_timeout
+
+        self._connections: "OrderedDict[PoolKey, _PooledConnection]" = OrderedDict()
+        self._owners: Dict[int, PoolKey] = {}
+        self._opening: set = set()
+        self._cond = threading.Condition()
+        # Per-pool secret so credential digests are not plain password hashes
+        self._secret = os.urandom(32)
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._connections)
+
+    def acquire(self,
+                host: str,
+                port: int,
+                username: str,
+                password: Optional[str] = None,
+                pkey: Optional[paramiko.PKey] = None,
+                connect_timeout: Optional[float] = 30.0) -> paramiko.SSHClient:
+        """
+        Lease a connected client for (host, port, username), opening one if needed.
+
+        A pooled connection is only reused when it was opened with the same
+        password or key. Every successful acquire must be paired with release().
+
+        Args:
+            host: Hostname or IP address of the miner
+            port: SSH port number
+            username: SSH username
+            password: SSH password (if using password authentication)
+            pkey: Private key (if using key-based authentication)
+            connect_timeout: Timeout for connect, banner and authentication in seconds
+
+        Returns:
+            A connected paramiko SSHClient
+
+        Raises:
+            paramiko.SSHException: If the pool stays full for acquire_timeout seconds,
+                or if connecting fails
+        """
+        key = (host, int(port), username, self._credential_digest(password, pkey))
+        deadline = time.monotonic() + self.acquire_timeout
+
+        while True:
+            reused = None
+            with self._cond:
+                while True:
+                    self._prune_locked()
+                    entry = self._connections.get(key)
+                    if entry is not None:
+                        # Lease before the health check so it cannot be evicted meanwhile
+                        reused = self._lease_locked(key, entry)
+                        break
+
+                    if key not in self._opening:
+                        if len(self._connections) + len(self._opening) < self.max_open or self._evict_lru_locked():
+                            self._opening.add(key)
+                            break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise paramiko.SSHException(
+                            f"SSH connection pool exhausted ({self.max_open} open) for {host}:{port}"
+                        )
+                    self._cond.wait(remaining)
+
+            if reused is None:
+                break
+            # The liveness check does socket I/O, so it runs outside the pool lock
+            if self._is_healthy(reused):
+                return reused
+            logger.debug(f"Discarding dead pooled connection to {host}:{port}")
+            with self._cond:
+                entry = self._connections.get(key)
+                if entry is not None and entry.client is reused:
+                    self._close_locked(key)
+                self._cond.notify_all()
+
+        try:
+            client = self._open(host, int(port), username, password, pkey, connect_timeout)
+        except Exception:
+            with self._cond:
+                self._opening.discard(key)
+                self._cond.notify_all()
+            raise
+
+        with self._cond:
+            self._opening.discard(key)
+            entry = _PooledConnection(client)
+            self._connections[key] = entry
+            self._owners[id(client)] = key
+            leased = self._lease_locked(key, entry)
+            self._cond.notify_all()
+            return leased
+
+    def release(self, client: paramiko.SSHClient, discard: bool = False) -> None:
+        """
+        Return a leased client to the pool.
+
+        Args:
+            client: Client obtained from acquire()
+            discard: Close the connection instead of keeping it (e.g. after an SSH error)
+        """
+        keep = not discard and self._is_healthy(client)
+        with self._cond:
+            key = self._owners.get(id(client))
+            entry = self._connections.get(key) if key else None
+            if entry is None or entry.client is not client:
+                # Not (or no longer) pooled; make sure it doesn't leak
+                client.close()
+                return
+
+            entry.leases = max(0, entry.leases - 1)
+            entry.last_used = time.monotonic()
+            if not keep:
+                self._close_locked(key)
+            self._cond.notify_all()
+
+    @contextmanager
+    def connection(self, host: str, port: int, username: str, **kwargs: Any) -> Iterator[paramiko.SSHClient]:
+        """Context manager around acquire()/release() that discards the connection on error."""
+        client = self.acquire(host, port, username, **kwargs)
+        failed = False
+        try:
+            yield client
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.release(client, discard=failed)
+
+    def prune(self) -> int:
+        """
+        Close idle-expired and dead connections.
+
+        Returns:
+            Number of connections closed
+        """
+        with self._cond:
+            closed = self._prune_locked()
+            if closed:
+                self._cond.notify_all()
+            return closed
+
+    def close_all(self) -> None:
+        """Close every pooled connection, including leased ones."""
+        with self._cond:
+            for key in list(self._connections):
+                self._close_locked(key)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        """Get a snapshot of pool usage."""
+        with self._cond:
+            return {
+                'open': len(self._connections),
+                'leased': sum(1 for entry in self._connections.values() if entry.leases),
+                'opening': len(self._opening),
+                'max_open': self.max_open,
+            }
+
+    def _open(self, host: str, port: int, username: str, password: Optional[str],
+              pkey: Optional[paramiko.PKey], connect_timeout: Optional[float]) -> paramiko.SSHClient:
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            client.connect(
+                hostname=host,
+                port=port,
+                username=username,
+                password=password,
+                pkey=pkey,
+                timeout=connect_timeout,
+                banner_timeout=connect_timeout,
+                auth_timeout=connect_timeout,
+            )
+        except Exception:
+            client.close()
+            raise
+
+        transport = client.get_transport()
+        if transport is not None and self.keepalive_interval:
+            transport.set_keepalive(self.keepalive_interval)
+        logger.debug(f"Opened pooled SSH connection to {username}@{host}:{port}")
+        return client
+
+    def _credential_digest(self, password: Optional[str], pkey: Optional[paramiko.PKey]) -> str:
+        """Keyed digest of the password and private key used to authenticate."""
+        digest = hmac.new(self._secret, digestmod=hashlib.sha256)
+        digest.update(b'password:' + (password or '').encode())
+        if pkey is not None:
+            digest.update(b'pkey:' + pkey.get_name().encode() + pkey.asbytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _is_healthy(client: paramiko.SSHClient) -> bool:
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            # Cheap liveness check: fails immediately if the socket is gone
+            transport.send_ignore()
+        except Exception:
+            return False
+        return True
+
+    def _lease_locked(self, key: PoolKey, entry: _PooledConnection) -> paramiko.SSHClient:
+        entry.leases += 1
+        entry.last_used = time.monotonic()
+        self._connections.move_to_end(key)
+        return entry.client
+
+    def _evict_lru_locked(self) -> bool:
+        for key, entry in self._connections.items():
+            if entry.leases == 0:
+                logger.debug(f"Evicting least recently used SSH connection to {key[0]}:{key[1]}")
+                self._close_locked(key)
+                return True
+        return False
+
+    def _prune_locked(self) -> int:
+        now = time.monotonic()
+        expired = [
+            key for key, entry in self._connections.items()
+            if entry.leases == 0 and (
+                now - entry.last_used > self.idle_ttl
+                or not entry.client.get_transport()
+                or not entry.client.get_transport().is_active()
+            )
+        ]
+        for key in expired:
+            self._close_locked(key)
+        return len(expired)
+
+    def _close_locked(self, key: PoolKey) -> None:
+        entry = self._connections.pop(key, None)
+        if entry is None:
+            return
+        self._owners.pop(id(entry.client), None)
+        try:
+            entry.client.close()
+        except Exception as e:
+            logger.debug(f"Error closing SSH connection to {key[0]}:{key[1]}: {e}")
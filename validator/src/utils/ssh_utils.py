@@ -13,9 +13,17 @@ from typing import Dict, Any, List, Tuple, Optional
 import paramiko
 
 from validator.src.utils.logging_utils import exception_handler
+from validator.src.utils.spec_cache import FINGERPRINT_COMMAND, SpecCache, parse_fingerprint
+from validator.src.utils.ssh_pool import SSHConnectionPool
 
 logger = logging.getLogger(__name__)
 
+# Total memory in bytes: one awk over /proc/meminfo, or free on hosts without it
+MEMORY_PROBE_COMMAND = (
+    "awk '/^MemTotal:/ {printf \"%.0f\\n\", $2 * 1024; exit}' /proc/meminfo 2>/dev/null"
+    " || free -b | grep 'Mem:' | awk '{print $2}'"
+)
+
 class SSHClient:
     """Client for connecting to miners via SSH and executing commands."""
     
@@ -27,7 +35,8 @@ class SSHClient:
                  key_path: Optional[str] = None,
                  key_passphrase: Optional[str] = None,
                  connection_timeout: int = 30,
-                 command_timeout: int = 60):
+                 command_timeout: int = 60,
+                 pool: Optional[SSHConnectionPool] = None):
         """
         Initialize SSH client for miner connection.
         
@@ -40,6 +49,8 @@ class SSHClient:
             key_passphrase: Passphrase for private key (if needed)
             connection_timeout: Timeout for SSH connection in seconds
             command_timeout: Timeout for SSH commands in seconds
+            pool: Optional connection pool; when set, connections are leased
+                from the pool and returned to it on close() instead of being torn down
         """
         self.host = host
         self.username = username
@@ -49,11 +60,12 @@ class SSHClient:
         self.key_passphrase = key_passphrase
         self.connection_timeout = connection_timeout
         self.command_timeout = command_timeout
+        self.pool = pool
         
         self.client = None
         self.connected = False
     
-    @exception_handler(fallback_return=False)
+    @exception_handler(logger, "Error connecting to miner", fallback_value=False)
     def connect(self) -> bool:
         """
         Establish SSH connection to the miner.
@@ -66,10 +78,6 @@ class SSHClient:
             return True
         
         try:
-            # Initialize SSH client
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
             connect_kwargs = {
                 'hostname': self.host,
                 'port': self.port,
@@ -92,6 +100,24 @@ class SSHClient:
                 logger.error("No authentication method provided (password or key)")
                 return False
             
+            if self.pool is not None:
+                # Reuse an authenticated transport when one is available
+                self.client = self.pool.acquire(
+                    self.host,
+                    self.port,
+                    self.username,
+                    password=connect_kwargs.get('password'),
+                    pkey=connect_kwargs.get('pkey'),
+                    connect_timeout=self.connection_timeout
+                )
+                self.connected = True
+                logger.debug(f"Leased pooled connection to miner at {self.host}")
+                return True
+            
+            # Initialize SSH client
+            self.client = paramiko.SSHClient()
+            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            
             # Connect to server
             logger.info(f"Connecting to miner at {self.host}:{self.port}")
             self.client.connect(**connect_kwargs)
@@ -110,7 +136,7 @@ class SSHClient:
             logger.error(f"Failed to connect to {self.host}: {e}")
             return False
     
-    @exception_handler(fallback_return=('', '', -1))
+    @exception_handler(logger, "Error executing command", fallback_value=('', '', -1))
     def execute_command(self, command: str) -> Tuple[str, str, int]:
         """
         Execute a command on the miner via SSH.
@@ -148,14 +174,25 @@ class SSHClient:
             
         except paramiko.SSHException as e:
             logger.error(f"SSH error during command execution on {self.host}: {e}")
+            if self.pool is not None:
+                # Don't hand a broken transport to the next caller
+                self.pool.release(self.client, discard=True)
+                self.client = None
+                self.connected = False
             return '', str(e), 1
         except Exception as e:
             logger.error(f"Error executing command on {self.host}: {e}")
             return '', str(e), 1
     
     def close(self):
-        """Close the SSH connection."""
+        """Close the SSH connection, or return it to the pool if pooled."""
         if self.client:
+            if self.pool is not None:
+                self.pool.release(self.client)
+                self.client = None
+                self.connected = False
+                logger.debug(f"Returned SSH connection to {self.host} to the pool")
+                return
             self.client.close()
             self.connected = False
             logger.debug(f"Closed SSH connection to {self.host}")
@@ -170,42 +207,68 @@ class SSHClient:
         self.close()
 
 
-@exception_handler(fallback_return={})
-def get_cpu_info(ssh_client: SSHClient) -> Dict[str, Any]:
+# Probing is split into two phases: collect_* functions only run commands on
+# the miner and return their raw output, and parse_* functions turn that
+# output into specs. The parse functions are pure and picklable, so large
+# batches can be parsed in a process pool (see utils/execution.py) while the
+# SSH I/O stays with the caller.
+
+def _classify_gpu_vendor(line: str) -> str:
+    """Guess the GPU vendor from an lspci line."""
+    lowered = line.lower()
+    if 'nvidia' in lowered:
+        return 'NVIDIA'
+    elif 'amd' in lowered or 'radeon' in lowered or 'ati' in lowered:
+        return 'AMD'
+    elif 'intel' in lowered:
+        return 'Intel'
+    return 'Unknown'
+
+
+def collect_cpu_info(ssh_client: SSHClient) -> Dict[str, str]:
     """
-    Retrieve CPU information from the miner.
+    Run the CPU probe commands on the miner.
     
     Args:
         ssh_client: Connected SSH client
     
     Returns:
-        Dictionary with CPU information
+        Raw command output for parse_cpu_info
     """
-    # Get CPU model
-    stdout, _, _ = ssh_client.execute_command("lscpu | grep 'Model name'")
+    return {
+        'model': ssh_client.execute_command("lscpu | grep 'Model name'")[0],
+        'nproc': ssh_client.execute_command("nproc")[0],
+        'mhz': ssh_client.execute_command("lscpu | grep 'CPU MHz' | awk '{print $3}'")[0],
+    }
+
+
+def parse_cpu_info(raw: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Parse the output of collect_cpu_info.
+    
+    Args:
+        raw: Raw command output
     
+    Returns:
+        Dictionary with CPU information
+    """
     cpu_model = ""
+    stdout = raw.get('model')
     if stdout:
         model_match = re.search(r'Model name:\s+(.*)', stdout)
         if model_match:
             cpu_model = model_match.group(1).strip()
     
-    # Get CPU count
-    stdout, _, _ = ssh_client.execute_command("nproc")
-    
     cpu_count = 0
+    stdout = raw.get('nproc')
     if stdout:
         try:
             cpu_count = int(stdout.strip())
         except ValueError:
             logger.warning(f"Could not parse CPU count: {stdout}")
     
-    # Get CPU speed
-    stdout, _, _ = ssh_client.execute_command(
-        "lscpu | grep 'CPU MHz' | awk '{print $3}'"
-    )
-    
     cpu_speed = 0.0
+    stdout = raw.get('mhz')
     if stdout:
         try:
             cpu_speed_mhz = float(stdout.strip())
@@ -220,29 +283,73 @@ def get_cpu_info(ssh_client: SSHClient) -> Dict[str, Any]:
     }
 
 
-@exception_handler(fallback_return=[])
-def get_gpu_info(ssh_client: SSHClient) -> List[Dict[str, Any]]:
+def collect_gpu_info(ssh_client: SSHClient) -> Dict[str, Any]:
     """
-    Retrieve GPU information from the miner.
-    This function detects NVIDIA, AMD, and Intel GPUs.
+    Run the NVIDIA, AMD and lspci GPU probe commands on the miner.
     
     Args:
         ssh_client: Connected SSH client
     
     Returns:
-        List of dictionaries with GPU information
+        Raw command output for parse_gpu_info
     """
-    gpus = []
+    raw: Dict[str, Any] = {}
     
-    # 1. Try NVIDIA detection first
-    stdout, _, exit_code = ssh_client.execute_command("which nvidia-smi")
+    # 1. NVIDIA, in one round trip; exit code 127 means nvidia-smi is not installed
+    result = ssh_client.execute_command(
+        "nvidia-smi --query-gpu=name,memory.total,utilization.gpu --format=csv,noheader"
+    )
+    if result[2] != 127:
+        raw['nvidia'] = result
     
+    # 2. AMD, plus the product name of every listed GPU
+    _, _, exit_code = ssh_client.execute_command("which rocm-smi")
     if exit_code == 0:
-        # Get GPU information in CSV format
-        stdout, stderr, exit_code = ssh_client.execute_command(
-            "nvidia-smi --query-gpu=name,memory.total,utilization.gpu --format=csv,noheader"
+        stdout, stderr, exit_code = ssh_client.execute_command("rocm-smi --showmeminfo vram --csv")
+        raw['rocm'] = (stdout, stderr, exit_code)
+        raw['rocm_names'] = {}
+        if exit_code == 0:
+            for line in stdout.strip().split('\n')[1:]:
+                parts = line.split(',')
+                if len(parts) >= 3:
+                    gpu_id = parts[0].strip()
+                    raw['rocm_names'][gpu_id] = ssh_client.execute_command(
+                        f"rocm-smi -d {gpu_id} --showproductname"
+                    )[0]
+    
+    # 3. lspci, which also sees Intel and otherwise undetected GPUs
+    _, _, exit_code = ssh_client.execute_command("which lspci")
+    if exit_code == 0:
+        raw['lspci'] = ssh_client.execute_command("lspci -v -nn | grep -E 'VGA|3D|Display'")
+    
+    # 4. A broader lspci search, only used when nothing else found a GPU
+    found_any = any(
+        raw.get(key) and raw[key][2] == 0 and raw[key][0].strip()
+        for key in ('nvidia', 'rocm', 'lspci')
+    )
+    if not found_any:
+        raw['lspci_fallback'] = ssh_client.execute_command(
+            "lspci | grep -i 'vga\\|3d\\|display\\|graphic'"
         )
-        
+    
+    return raw
+
+
+def parse_gpu_info(raw: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Parse the output of collect_gpu_info.
+    
+    Args:
+        raw: Raw command output
+    
+    Returns:
+        List of dictionaries with GPU information
+    """
+    gpus = []
+    
+    # 1. NVIDIA
+    if 'nvidia' in raw:
+        stdout, stderr, exit_code = raw['nvidia']
         if exit_code == 0:
             # Parse CSV output
             for line in stdout.strip().split('\n'):
@@ -278,14 +385,11 @@ def get_gpu_info(ssh_client: SSHClient) -> List[Dict[str, Any]]:
         else:
             logger.warning(f"Error getting NVIDIA GPU info: {stderr}")
     
-    # 2. Try AMD detection
-    stdout, _, exit_code = ssh_client.execute_command("which rocm-smi")
-    
-    if exit_code == 0:
-        # AMD GPU detection via rocm-smi
-        stdout, stderr, exit_code = ssh_client.execute_command("rocm-smi --showmeminfo vram --csv")
-        
+    # 2. AMD
+    if 'rocm' in raw:
+        stdout, stderr, exit_code = raw['rocm']
         if exit_code == 0:
+            names = raw.get('rocm_names', {})
             lines = stdout.strip().split('\n')
             # Skip header row
             if len(lines) > 1:
@@ -297,9 +401,7 @@ def get_gpu_info(ssh_client: SSHClient) -> List[Dict[str, Any]]:
                             # Memory is usually in bytes, convert to MB
                             memory_mb = int(int(parts[2].strip()) / (1024 * 1024))
                             
-                            # Get GPU name from additional command
-                            name_cmd = f"rocm-smi -d {gpu_id} --showproductname"
-                            name_stdout, _, _ = ssh_client.execute_command(name_cmd)
+                            name_stdout = names.get(gpu_id)
                             gpu_name = name_stdout.strip() if name_stdout else f"AMD GPU {gpu_id}"
                             
                             gpus.append({
@@ -315,13 +417,9 @@ def get_gpu_info(ssh_client: SSHClient) -> List[Dict[str, Any]]:
         else:
             logger.warning(f"Error getting AMD GPU info: {stderr}")
     
-    # 3. Use lspci as a fallback to detect any GPUs not captured above
-    stdout, stderr, exit_code = ssh_client.execute_command("which lspci")
-    
-    if exit_code == 0:
-        # Use lspci to detect GPUs (will detect all types, including Intel)
-        stdout, stderr, exit_code = ssh_client.execute_command("lspci -v -nn | grep -E 'VGA|3D|Display'")
-        
+    # 3. lspci, for any GPUs not captured above
+    if 'lspci' in raw:
+        stdout, _, exit_code = raw['lspci']
         if exit_code == 0:
             # Extract GPU names and check if they're already in our list
             existing_gpu_names = {gpu['name'].lower() for gpu in gpus}
@@ -330,71 +428,54 @@ def get_gpu_info(ssh_client: SSHClient) -> List[Dict[str, Any]]:
                 if not line:
                     continue
                 
-                # Extract GPU type and name
-                gpu_type = 'Unknown'
-                if 'nvidia' in line.lower():
-                    gpu_type = 'NVIDIA'
-                elif 'amd' in line.lower() or 'radeon' in line.lower() or 'ati' in line.lower():
-                    gpu_type = 'AMD'
-                elif 'intel' in line.lower():
-                    gpu_type = 'Intel'
-                
                 # Check if we already have this GPU type in our list
-                gpu_name = line.strip()
+                gpu_type = _classify_gpu_vendor(line)
                 if not any(gpu_type.lower() in existing_name for existing_name in existing_gpu_names):
                     gpus.append({
-                        'name': gpu_name,
+                        'name': line.strip(),
                         'memory': 0,  # Unknown memory
                         'utilization': 0,
                         'type': gpu_type
                     })
             
-            logger.info(f"Total GPUs found with lspci: {len(stdout.strip().split('\n'))}")
+            lspci_lines = stdout.strip().split('\n')
+            logger.info(f"Total GPUs found with lspci: {len(lspci_lines)}")
     
-    # If still no GPUs found, try a more aggressive lspci search
-    if not gpus:
-        stdout, stderr, exit_code = ssh_client.execute_command("lspci | grep -i 'vga\\|3d\\|display\\|graphic'")
-        
+    # If still no GPUs found, use the more aggressive lspci search
+    if not gpus and 'lspci_fallback' in raw:
+        stdout, _, exit_code = raw['lspci_fallback']
         if exit_code == 0 and stdout.strip():
             for line in stdout.strip().split('\n'):
                 if not line:
                     continue
                 
-                gpu_type = 'Unknown'
-                if 'nvidia' in line.lower():
-                    gpu_type = 'NVIDIA'
-                elif 'amd' in line.lower() or 'radeon' in line.lower() or 'ati' in line.lower():
-                    gpu_type = 'AMD'
-                elif 'intel' in line.lower():
-                    gpu_type = 'Intel'
-                
                 gpus.append({
                     'name': line.strip(),
                     'memory': 0,  # Unknown memory
                     'utilization': 0,
-                    'type': gpu_type
+                    'type': _classify_gpu_vendor(line)
                 })
     
     return gpus
 
 
-@exception_handler(fallback_return={})
-def get_memory_info(ssh_client: SSHClient) -> Dict[str, Any]:
+def collect_memory_info(ssh_client: SSHClient) -> Dict[str, str]:
+    """Run the memory probe command on the miner."""
+    return {'total': ssh_client.execute_command(MEMORY_PROBE_COMMAND)[0]}
+
+
+def parse_memory_info(raw: Dict[str, str]) -> Dict[str, Any]:
     """
-    Retrieve memory information from the miner.
+    Parse the output of collect_memory_info.
     
     Args:
-        ssh_client: Connected SSH client
+        raw: Raw command output
     
     Returns:
         Dictionary with memory information
     """
-    # Get total memory
-    stdout, _, _ = ssh_client.execute_command(
-        "free -b | grep 'Mem:' | awk '{print $2}'"
-    )
-    
     total_memory_bytes = 0
+    stdout = raw.get('total')
     if stdout:
         try:
             total_memory_bytes = int(stdout.strip())
@@ -409,23 +490,23 @@ def get_memory_info(ssh_client: SSHClient) -> Dict[str, Any]:
     }
 
 
-@exception_handler(fallback_return={})
-def get_storage_info(ssh_client: SSHClient) -> Dict[str, Any]:
+def collect_storage_info(ssh_client: SSHClient) -> Dict[str, str]:
+    """Run the storage probe command on the miner."""
+    return {'total': ssh_client.execute_command("df -BG --total | grep 'total' | awk '{print $2}'")[0]}
+
+
+def parse_storage_info(raw: Dict[str, str]) -> Dict[str, Any]:
     """
-    Retrieve storage information from the miner.
+    Parse the output of collect_storage_info.
     
     Args:
-        ssh_client: Connected SSH client
+        raw: Raw command output
     
     Returns:
         Dictionary with storage information
     """
-    # Get total storage
-    stdout, _, _ = ssh_client.execute_command(
-        "df -BG --total | grep 'total' | awk '{print $2}'"
-    )
-    
     total_storage_gb = 0
+    stdout = raw.get('total')
     if stdout:
         try:
             # Remove the 'G' suffix and convert to number
@@ -439,31 +520,41 @@ def get_storage_info(ssh_client: SSHClient) -> Dict[str, Any]:
     }
 
 
-@exception_handler(fallback_return={})
-def get_network_info(ssh_client: SSHClient) -> Dict[str, Any]:
+def collect_network_info(ssh_client: SSHClient) -> Dict[str, Any]:
     """
-    Retrieve network information from the miner.
+    Run a speed test on the miner, installing speedtest-cli if needed.
     
     Args:
         ssh_client: Connected SSH client
     
     Returns:
-        Dictionary with network information
+        Raw command output for parse_network_info
     """
     # This is a simplified approach - in reality, you might want to use
     # speedtest-cli or a similar tool to measure actual bandwidth
     
     # Check if speedtest-cli is available and install if not
-    stdout, _, exit_code = ssh_client.execute_command("which speedtest-cli")
+    _, _, exit_code = ssh_client.execute_command("which speedtest-cli")
     
     if exit_code != 0:
         logger.info("speedtest-cli not found, attempting to install...")
         ssh_client.execute_command("pip install speedtest-cli")
     
     # Run a speed test (this may take a while)
-    stdout, stderr, exit_code = ssh_client.execute_command(
-        "speedtest-cli --simple"
-    )
+    return {'speedtest': ssh_client.execute_command("speedtest-cli --simple")}
+
+
+def parse_network_info(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse the output of collect_network_info.
+    
+    Args:
+        raw: Raw command output
+    
+    Returns:
+        Dictionary with network information
+    """
+    stdout, stderr, exit_code = raw.get('speedtest', ('', '', -1))
     
     if exit_code != 0:
         logger.warning(f"Error running speed test: {stderr}")
@@ -491,35 +582,50 @@ def get_network_info(ssh_client: SSHClient) -> Dict[str, Any]:
     }
 
 
-@exception_handler(fallback_return={})
-def get_docker_info(ssh_client: SSHClient) -> Dict[str, Any]:
+def collect_docker_info(ssh_client: SSHClient) -> Dict[str, Any]:
     """
-    Retrieve Docker information from the miner.
+    Run the Docker probe commands on the miner.
     
     Args:
         ssh_client: Connected SSH client
     
     Returns:
-        Dictionary with Docker information
+        Raw command output for parse_docker_info
     """
     # Check if Docker is installed
-    stdout, _, exit_code = ssh_client.execute_command("which docker")
+    _, _, exit_code = ssh_client.execute_command("which docker")
     
     if exit_code != 0:
         logger.info("Docker not found on miner")
         return {'installed': False}
     
-    # Get Docker version
-    stdout, _, _ = ssh_client.execute_command("docker --version")
+    return {
+        'installed': True,
+        'version': ssh_client.execute_command("docker --version")[0],
+        'containers': ssh_client.execute_command(
+            "docker ps --format '{{.ID}}|{{.Image}}|{{.Status}}|{{.Names}}'"
+        )[0],
+    }
+
+
+def parse_docker_info(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse the output of collect_docker_info.
     
-    docker_version = stdout.strip() if stdout else "Unknown"
+    Args:
+        raw: Raw command output
     
-    # Get running containers
-    stdout, _, _ = ssh_client.execute_command(
-        "docker ps --format '{{.ID}}|{{.Image}}|{{.Status}}|{{.Names}}'"
-    )
+    Returns:
+        Dictionary with Docker information
+    """
+    if not raw.get('installed'):
+        return {'installed': False}
+    
+    stdout = raw.get('version')
+    docker_version = stdout.strip() if stdout else "Unknown"
     
     containers = []
+    stdout = raw.get('containers')
     if stdout:
         for line in stdout.strip().split('\n'):
             if not line:
@@ -542,12 +648,201 @@ def get_docker_info(ssh_client: SSHClient) -> Dict[str, Any]:
     }
 
 
-def get_hardware_specifications(ssh_client: SSHClient) -> Dict[str, Any]:
+@exception_handler(logger, "Error retrieving CPU info", fallback_value={})
+def get_cpu_info(ssh_client: SSHClient) -> Dict[str, Any]:
+    """
+    Retrieve CPU information from the miner.
+    
+    Args:
+        ssh_client: Connected SSH client
+    
+    Returns:
+        Dictionary with CPU information
+    """
+    return parse_cpu_info(collect_cpu_info(ssh_client))
+
+
+@exception_handler(logger, "Error retrieving GPU info", fallback_value=[])
+def get_gpu_info(ssh_client: SSHClient) -> List[Dict[str, Any]]:
+    """
+    Retrieve GPU information from the miner.
+    This function detects NVIDIA, AMD, and Intel GPUs.
+    
+    Args:
+        ssh_client: Connected SSH client
+    
+    Returns:
+        List of dictionaries with GPU information
+    """
+    return parse_gpu_info(collect_gpu_info(ssh_client))
+
+
+@exception_handler(logger, "Error retrieving memory info", fallback_value={})
+def get_memory_info(ssh_client: SSHClient) -> Dict[str, Any]:
+    """
+    Retrieve memory information from the miner.
+    
+    Args:
+        ssh_client: Connected SSH client
+    
+    Returns:
+        Dictionary with memory information
+    """
+    return parse_memory_info(collect_memory_info(ssh_client))
+
+
+@exception_handler(logger, "Error retrieving storage info", fallback_value={})
+def get_storage_info(ssh_client: SSHClient) -> Dict[str, Any]:
+    """
+    Retrieve storage information from the miner.
+    
+    Args:
+        ssh_client: Connected SSH client
+    
+    Returns:
+        Dictionary with storage information
+    """
+    return parse_storage_info(collect_storage_info(ssh_client))
+
+
+@exception_handler(logger, "Error retrieving network info", fallback_value={})
+def get_network_info(ssh_client: SSHClient) -> Dict[str, Any]:
+    """
+    Retrieve network information from the miner.
+    
+    Args:
+        ssh_client: Connected SSH client
+    
+    Returns:
+        Dictionary with network information
+    """
+    return parse_network_info(collect_network_info(ssh_client))
+
+
+@exception_handler(logger, "Error retrieving Docker info", fallback_value={})
+def get_docker_info(ssh_client: SSHClient) -> Dict[str, Any]:
+    """
+    Retrieve Docker information from the miner.
+    
+    Args:
+        ssh_client: Connected SSH client
+    
+    Returns:
+        Dictionary with Docker information
+    """
+    return parse_docker_info(collect_docker_info(ssh_client))
+
+
+# Component name -> (collector, parser); components that fail to collect
+# or parse are reported as empty, like the get_*_info wrappers above
+SPEC_COMPONENTS = {
+    'cpu': (collect_cpu_info, parse_cpu_info),
+    'gpus': (collect_gpu_info, parse_gpu_info),
+    'memory': (collect_memory_info, parse_memory_info),
+    'storage': (collect_storage_info, parse_storage_info),
+    'network': (collect_network_info, parse_network_info),
+    'docker': (collect_docker_info, parse_docker_info),
+}
+
+
+def collect_raw_specs(ssh_client: SSHClient) -> Dict[str, Any]:
+    """
+    Run every hardware probe command on the miner without parsing the output.
+    
+    Args:
+        ssh_client: Connected SSH client
+    
+    Returns:
+        Raw output per component, for parse_raw_specs. Components whose
+        commands failed are None.
+    """
+    raw: Dict[str, Any] = {}
+    for component, (collect, _) in SPEC_COMPONENTS.items():
+        try:
+            raw[component] = collect(ssh_client)
+        except Exception as e:
+            logger.error(f"Error collecting {component} info: {e}")
+            raw[component] = None
+    return raw
+
+
+def parse_raw_specs(raw: Dict[str, Any], timestamp: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Turn the output of collect_raw_specs into hardware specifications.
+    
+    This does no I/O, so it can run in a worker process.
+    
+    Args:
+        raw: Raw output per component
+        timestamp: Time the raw output was collected (default: now)
+    
+    Returns:
+        Dictionary with all hardware specifications
+    """
+    parsed: Dict[str, Any] = {}
+    for component, (_, parse) in SPEC_COMPONENTS.items():
+        fallback = [] if component == 'gpus' else {}
+        if raw.get(component) is None:
+            parsed[component] = fallback
+            continue
+        try:
+            parsed[component] = parse(raw[component])
+        except Exception as e:
+            logger.error(f"Error parsing {component} info: {e}")
+            parsed[component] = fallback
+    
+    return {
+        **parsed['cpu'],
+        'gpus': parsed['gpus'],
+        **parsed['memory'],
+        **parsed['storage'],
+        **parsed['network'],
+        'docker': parsed['docker'],
+        'timestamp': timestamp if timestamp is not None else time.time()
+    }
+
+
+def parse_raw_specs_chunk(chunk: List[Tuple[str, Dict[str, Any], float]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Parse the raw output of many miners.
+    
+    Args:
+        chunk: (miner_id, raw, collected_at) triples
+    
+    Returns:
+        (miner_id, specs) pairs
+    """
+    return [(miner_id, parse_raw_specs(raw, collected_at)) for miner_id, raw, collected_at in chunk]
+
+
+def get_spec_fingerprint(ssh_client: SSHClient) -> Dict[str, str]:
+    """
+    Retrieve the cheap hardware fingerprint used for spec cache change detection.
+    
+    Args:
+        ssh_client: Connected SSH client
+    
+    Returns:
+        Fingerprint fields, or an empty dict if they could not be read
+    """
+    stdout, _, _ = ssh_client.execute_command(FINGERPRINT_COMMAND)
+    return parse_fingerprint(stdout)
+
+
+def get_hardware_specifications(ssh_client: SSHClient,
+                                cache: Optional[SpecCache] = None,
+                                miner_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Retrieve comprehensive hardware specifications from the miner.
     
+    When a spec cache and miner ID are given, only the hardware fingerprint is
+    fetched; cached specs are returned if it is unchanged and the entry has not
+    expired, otherwise the full probe runs and its result is cached.
+    
     Args:
         ssh_client: Connected SSH client
+        cache: Optional cache of previously verified specs
+        miner_id: ID of the miner, used as the cache key
     
     Returns:
         Dictionary with all hardware specifications
@@ -557,10 +852,18 @@ def get_hardware_specifications(ssh_client: SSHClient) -> Dict[str, Any]:
         logger.error("Failed to connect to miner for hardware verification")
         return {}
     
+    fingerprint = {}
+    if cache is not None and miner_id:
+        fingerprint = get_spec_fingerprint(ssh_client)
+        cached_specs = cache.lookup(miner_id, fingerprint)
+        if cached_specs is not None:
+            logger.info(f"Hardware fingerprint unchanged for miner {miner_id}, using cached specs")
+            return cached_specs
+    
     try:
         # Get CPU info
         cpu_info = get_cpu_info(ssh_client)
-        logger.info(f"Retrieved CPU info: {cpu_count} cores")
+        logger.info(f"Retrieved CPU info: {cpu_info.get('cpu_count', 0)} cores")
         
         # Get GPU info
         gpus = get_gpu_info(ssh_client)
@@ -588,7 +891,7 @@ def get_hardware_specifications(ssh_client: SSHClient) -> Dict[str, Any]:
         logger.info(f"Docker installed: {docker_installed}, Running containers: {container_count}")
         
         # Combine all information
-        return {
+        specs = {
             **cpu_info,
             'gpus': gpus,
             **memory_info,
@@ -598,6 +901,11 @@ def get_hardware_specifications(ssh_client: SSHClient) -> Dict[str, Any]:
             'timestamp': time.time()
         }
         
+        if cache is not None and miner_id:
+            cache.store(miner_id, fingerprint, specs)
+        
+        return specs
+        
     except Exception as e:
         logger.error(f"Error getting hardware specifications: {e}")
         return {}
@@ -605,7 +913,8 @@ def get_hardware_specifications(ssh_client: SSHClient) -> Dict[str, Any]:
 
 def create_ssh_client_from_miner_data(miner_data: Dict[str, Any], 
                                     connection_timeout: int = 30,
-                                    command_timeout: int = 60) -> Optional[SSHClient]:
+                                    command_timeout: int = 60,
+                                    pool: Optional[SSHConnectionPool] = None) -> Optional[SSHClient]:
     """
     Create an SSH client from miner registration data.
     
@@ -613,6 +922,7 @@ def create_ssh_client_from_miner_data(miner_data: Dict[str, Any],
         miner_data: Miner data from registration
         connection_timeout: SSH connection timeout in seconds
         command_timeout: SSH command timeout in seconds
+        pool: Optional connection pool to lease connections from
     
     Returns:
         SSHClient instance if successful, None otherwise
@@ -651,7 +961,8 @@ def create_ssh_client_from_miner_data(miner_data: Dict[str, Any],
             key_path=key_path,
             key_passphrase=key_passphrase,
             connection_timeout=connection_timeout,
-            command_timeout=command_timeout
+            command_timeout=command_timeout,
+            pool=pool
         )
         
         return ssh_client
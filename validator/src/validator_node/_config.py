@@ -11,3 +11,10 @@ class ValidatorSettings(PolarisBaseSettings):
     max_allowed_weights: int=420
     subnet_name: str ="mosaic"
     logging_level: str ="INFO"
+    score_uptime_bucket_size: float = 0.001  # uptime score change that triggers a re-score
+    score_max_age: int = 21600
+    metagraph_sync_mode: str = "incremental"  # "incremental" or "full"
+    metagraph_sync_interval: int = 60
+    metagraph_full_resync_interval: int = 3600
+    module_cache_refresh_interval: float = 60.0
+    module_cache_full_refresh_interval: float = 3600.0
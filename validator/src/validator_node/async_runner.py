@@ -0,0 +1,187 @@
+"""
+Async Runner
+
+This module keeps one long-lived asyncio event loop per validator process,
+running on a dedicated thread. Synchronous code (validation threads, the CLI)
+submits coroutines to it instead of calling asyncio.run() each cycle, so
+aiohttp sessions, connection pools and other loop-bound state survive from
+one validation cycle to the next. On shutdown the runner drains in-flight
+work, runs registered cleanup callbacks, and closes the loop.
+"""
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, List, Optional, Set
+
+from loguru import logger
+
+CleanupCallback = Callable[[], Any]
+
+
+class AsyncRunner:
+    """Owns an event loop on a background thread for the life of the process."""
+
+    def __init__(self, name: str = "validator-loop"):
+        """Initialize the runner. The loop starts on first use.
+
+        Args:
+            name: Name of the loop thread
+        """
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._pending: Set[Future] = set()
+        self._stop_hooks: List[Callable[[], Any]] = []
+        self._cleanups: List[CleanupCallback] = []
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if needed and return the loop."""
+        with self._lock:
+            if self._closing:
+                raise RuntimeError(f"{self.name} is shut down")
+            if not self.running:
+                self.loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run_loop, args=(ready,), name=self.name, daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+                logger.debug(f"Started event loop thread {self.name}")
+            return self.loop
+
+    def submit(self, coro: Awaitable[Any]) -> Future:
+        """Schedule a coroutine on the loop.
+
+        Returns:
+            Future: A concurrent future for the coroutine's result
+        """
+        loop = self.start()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and wait for its result.
+
+        Must not be called from the loop thread itself.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait; on timeout the coroutine is cancelled
+
+        Returns:
+            Any: The coroutine's result
+        """
+        if self.loop is not None and threading.current_thread() is self._thread:
+            raise RuntimeError("AsyncRunner.run() called from its own event loop; await the coroutine instead")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Call a plain function on the loop thread."""
+        loop = self.loop if self.running else self.start()
+        loop.call_soon_threadsafe(callback, *args)
+
+    def add_stop_hook(self, callback: Callable[[], Any]) -> None:
+        """Register a function called on the loop when shutdown begins.
+
+        Stop hooks ask long-running work (such as a validation loop) to wind
+        down so that it can finish within the drain timeout.
+        """
+        self._stop_hooks.append(callback)
+
+    def add_cleanup(self, callback: CleanupCallback) -> None:
+        """Register a function or coroutine function to run on shutdown.
+
+        Cleanups run in reverse registration order, on the loop, after
+        in-flight work has drained (e.g. closing an aiohttp session or an
+        SSH connection pool).
+        """
+        self._cleanups.append(callback)
+
+    def shutdown(self, drain_timeout: float = 30.0) -> None:
+        """Drain in-flight work, run cleanups, and stop the loop.
+
+        Args:
+            drain_timeout: Seconds to let submitted coroutines finish before
+                they are cancelled
+        """
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+        if not self.running:
+            return
+
+        for hook in self._stop_hooks:
+            self.loop.call_soon_threadsafe(hook)
+
+        pending = list(self._pending)
+        if pending:
+            logger.info(f"Waiting up to {drain_timeout}s for {len(pending)} task(s) to finish")
+            for future in pending:
+                try:
+                    future.result(drain_timeout)
+                except FutureTimeoutError:
+                    logger.warning("Task did not finish in time, cancelling it")
+                    future.cancel()
+                except Exception:
+                    # Failures are reported to whoever awaited the future
+                    pass
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._finalize(), self.loop).result(drain_timeout)
+        except Exception as e:
+            logger.error(f"Error during event loop shutdown: {e}")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(drain_timeout)
+        logger.debug(f"Stopped event loop thread {self.name}")
+
+    async def _finalize(self) -> None:
+        for callback in reversed(self._cleanups):
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error in shutdown cleanup {callback!r}: {e}")
+        await self.loop.shutdown_asyncgens()
+        await self.loop.shutdown_default_executor()
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+
+_runner: Optional[AsyncRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_async_runner() -> AsyncRunner:
+    """Get the process-wide runner, creating it on first use."""
+    global _runner
+    with _runner_lock:
+        if _runner is None or _runner._closing:
+            _runner = AsyncRunner()
+        return _runner
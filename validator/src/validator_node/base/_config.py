@@ -6,3 +6,12 @@ from validator.src.validator_node.base.config import PolarisBaseSettings
 class ValidatorNodeSettings(PolarisBaseSettings):
     host: str
     port: int
+    verification_concurrency: int = 32
+    verification_miner_timeout: float = 60.0
+    verification_cycle_timeout: float = 600.0
+    ssh_pool_max_open: int = 64
+    ssh_pool_idle_ttl: float = 1800.0
+    spec_cache_ttl: float = 86400.0
+    orchestrator_snapshot_max_age: float = 60.0
+    container_fetch_concurrency: int = 16
+    module_cache_refresh_interval: float = 60.0
@@ -0,0 +1,43 @@
+"""
+Miner resolution index
+
+Maps miner IDs to their orchestrator resources and hotkeys to UIDs for one
+validation cycle, so looking up a miner's UID costs a dictionary access
+instead of an API request and a chain query.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable
+
+
+@dataclass
+class ResolutionIndex:
+    """Per-cycle lookups from miner IDs to resources and from hotkeys to UIDs.
+
+    Built once per validation cycle from a single resources fetch and a
+    single metagraph snapshot, so scoring resolves miners without further
+    API or chain calls. Weight submission reuses the resources but rebuilds
+    the index from a fresh snapshot, since UIDs can be re-registered in
+    between.
+    """
+    resources: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    hotkey_to_uid: Dict[str, int] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        miner_resources: Dict[str, Dict[str, Any]],
+        hotkeys: Iterable[str],
+        uids: Iterable[Any],
+    ) -> "ResolutionIndex":
+        """Build the index from a resources fetch and metagraph columns."""
+        return cls(
+            resources=dict(miner_resources),
+            hotkey_to_uid={hotkey: int(uid) for hotkey, uid in zip(hotkeys, uids)},
+        )
+
+    def uid_for_hotkey(self, hotkey: str) -> int:
+        """Get the UID of a hotkey, or -1 if it was not registered in the snapshot."""
+        return self.hotkey_to_uid.get(hotkey, -1)
@@ -0,0 +1,86 @@
+"""
+Weight selection helpers
+
+This module turns a score dictionary into the weights submitted on chain in
+a single pass over NumPy arrays: normalization, scaling to the weight range
+and trimming to the maximum allowed number of weights. Trimming uses an
+O(n) partition instead of sorting every score.
+"""
+
+from typing import Dict, Hashable, Optional, TypeVar
+
+import numpy as np
+
+K = TypeVar("K", bound=Hashable)
+
+
+def top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Select the indices of the k largest values.
+
+    Matches a stable descending sort truncated to k: ties keep their original
+    order, and the result is ordered by value (descending).
+
+    Args:
+        values: 1-D array of values
+        k: Number of indices to keep
+
+    Returns:
+        np.ndarray: Selected indices, largest value first
+    """
+    n = len(values)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        selected = np.arange(n)
+    else:
+        threshold = np.partition(values, n - k)[n - k]
+        above = np.flatnonzero(values > threshold)
+        ties = np.flatnonzero(values == threshold)[:k - len(above)]
+        selected = np.concatenate([above, ties])
+    return selected[np.lexsort((selected, -values[selected]))]
+
+
+def select_top_weights(
+    scores: Dict[K, float],
+    max_allowed_weights: int,
+    normalization: Optional[str] = "minmax",
+    scale: Optional[float] = None,
+) -> Dict[K, float]:
+    """Normalize, scale and trim scores in one pass.
+
+    Args:
+        scores: Raw scores keyed by miner ID
+        max_allowed_weights: Maximum number of weights to keep
+        normalization: "minmax" to map scores to 0-1 (all equal scores map to 1.0),
+            "max" to divide by the highest score, or None to keep raw scores
+        scale: If set, weights are int(normalized_score * scale)
+
+    Returns:
+        Dict: At most max_allowed_weights weights keyed by miner ID. Untrimmed
+        results keep the input order; trimmed results are ordered by weight.
+    """
+    if not scores:
+        return {}
+
+    ids = list(scores)
+    values = np.fromiter(scores.values(), dtype=np.float64, count=len(ids))
+
+    if normalization == "minmax":
+        low, high = values.min(), values.max()
+        if high == low:
+            values = np.ones_like(values)
+        else:
+            values = (values - low) / (high - low)
+    elif normalization == "max":
+        values = values / values.max()
+    elif normalization is not None:
+        raise ValueError(f"Unknown normalization: {normalization}")
+
+    if scale is not None:
+        values = (values * scale).astype(np.int64)
+
+    if len(ids) <= max_allowed_weights:
+        return dict(zip(ids, values.tolist()))
+
+    selected = top_k_indices(values, max_allowed_weights)
+    return {ids[i]: value for i, value in zip(selected.tolist(), values[selected].tolist())}
@@ -8,8 +8,10 @@ scoring miners, and setting weights.
 
 import time
 import traceback
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple
 
+import numpy as np
 from loguru import logger
 from substrateinterface import Keypair
 
@@ -23,9 +25,22 @@ except ImportError:
 
 from validator.src.validator_node._config import ValidatorSettings
 from validator.src.validator_node.core_validator import CoreValidator
+from validator.src.validator_node.metagraph_sync import MetagraphSync
+from validator.src.validator_node.miner_table import MinerTable
 from validator.src.validator_node.pog import compare_compute_resources, fetch_compute_specs
 
 
+@dataclass
+class TableScores:
+    """Score inputs and results per metagraph row from the last scoring pass."""
+    hotkeys: np.ndarray
+    stake: np.ndarray
+    axon_keys: np.ndarray
+    uptime_bucket: np.ndarray
+    score: np.ndarray
+    scored_at: np.ndarray
+
+
 class BittensorValidator(CoreValidator):
     """Bittensor-specific validator implementation."""
     
@@ -42,6 +57,11 @@ class BittensorValidator(CoreValidator):
         self._subtensor = None
         self._wallet = None
         self._metagraph = None
+        self._miner_table: Optional[MinerTable] = None
+        self._table_scores: Optional[TableScores] = None
+        self._metagraph_sync: Optional[MetagraphSync] = None
+        self._last_metagraph_update = 0.0
+        self._rng = np.random.default_rng()
         self.netuid = getattr(settings, 'bittensor_netuid', 49)  # Default to 49 (Polaris)
         self.network = getattr(settings, 'bittensor_network', 'finney')  # Default to mainnet
         
@@ -68,13 +88,48 @@ class BittensorValidator(CoreValidator):
     
     @property
     def metagraph(self):
-        """Get the subnet metagraph."""
-        if self._metagraph is None or time.time() - self._last_metagraph_update > 600:  # Refresh every 10 minutes
+        """Get the subnet metagraph.
+        
+        In "incremental" sync mode the miner table is brought up to date every
+        metagraph_sync_interval seconds by patching only the neurons that
+        changed, and the metagraph object itself is only replaced on full
+        reloads (its UIDs do not change in between). In "full" mode both are
+        reloaded every metagraph_full_resync_interval seconds.
+        """
+        if self.settings.metagraph_sync_mode == "incremental":
+            interval = self.settings.metagraph_sync_interval
+        else:
+            interval = self.settings.metagraph_full_resync_interval
+        if self._metagraph is None or time.time() - self._last_metagraph_update > interval:
             logger.debug(f"Updating metagraph for netuid {self.netuid}")
-            self._metagraph = self.subtensor.metagraph(netuid=self.netuid)
-            self._last_metagraph_update = time.time()
+            self._refresh_metagraph()
         return self._metagraph
     
+    @property
+    def miner_table(self) -> MinerTable:
+        """Get the array-backed view of the current metagraph."""
+        metagraph = self.metagraph
+        if self._miner_table is None:
+            self._miner_table = MinerTable.from_metagraph(metagraph)
+        return self._miner_table
+    
+    def _refresh_metagraph(self) -> None:
+        """Sync the cached metagraph and miner table with the chain."""
+        if self.settings.metagraph_sync_mode == "incremental":
+            if self._metagraph_sync is None:
+                self._metagraph_sync = MetagraphSync(
+                    self.subtensor,
+                    self.netuid,
+                    full_resync_interval=self.settings.metagraph_full_resync_interval,
+                )
+            self._metagraph_sync.sync()
+            self._metagraph = self._metagraph_sync.metagraph
+            self._miner_table = self._metagraph_sync.table
+        else:
+            self._metagraph = self.subtensor.metagraph(netuid=self.netuid)
+            self._miner_table = MinerTable.from_metagraph(self._metagraph)
+        self._last_metagraph_update = time.time()
+    
     async def initialize_network(self) -> bool:
         """Initialize Bittensor network connection and wallet.
         
@@ -114,10 +169,10 @@ class BittensorValidator(CoreValidator):
                 
             # Initialize metagraph
             logger.info(f"Loading metagraph for subnet {self.netuid}")
-            self._metagraph = self.subtensor.metagraph(netuid=self.netuid)
-            self._last_metagraph_update = time.time()
+            self._metagraph_sync = None
+            self._refresh_metagraph()
             
-            logger.info(f"Found {len(self._metagraph.uids)} miners on subnet {self.netuid}")
+            logger.info(f"Found {len(self._miner_table)} miners on subnet {self.netuid}")
             
             self._initialized = True
             return True
@@ -178,34 +233,26 @@ class BittensorValidator(CoreValidator):
             logger.info("Starting Bittensor validation cycle")
             
             # 1. Get miners to validate
-            miners = await self.get_miners()
-            if not miners:
+            table = self.miner_table
+            rows = table.rows(exclude_hotkey=self.wallet.hotkey.ss58_address)
+            if not len(rows):
                 logger.info("No miners found to validate")
                 return
                 
-            logger.info(f"Found {len(miners)} miners to validate")
+            logger.info(f"Found {len(rows)} miners to validate")
             
             # 2. Score miners
-            scores = await self.score_miners(miners)
+            scores = await self.score_miner_table(table)
             if not scores:
                 logger.info("No valid scores, skipping weight update")
                 return
                 
             logger.info(f"Scored {len(scores)} miners")
             
-            # 3. Normalize scores
-            normalized_scores = self.normalize_scores(scores)
-            
-            # 4. Convert to weights
-            weights_dict = {
-                uid: self.assign_weight(score)
-                for uid, score in normalized_scores.items()
-            }
+            # 3. Normalize, convert to weights and trim to maximum allowed weights
+            weights_dict = self.compute_weights(scores)
             
-            # 5. Trim to maximum allowed weights
-            weights_dict = self.cut_to_max_allowed_weights(weights_dict)
-            
-            # 6. Set weights on network
+            # 4. Set weights on network
             success = await self.set_weights(weights_dict)
             if success:
                 logger.info(f"Successfully set weights for {len(weights_dict)} miners")
@@ -223,128 +270,101 @@ class BittensorValidator(CoreValidator):
             Dict: Dictionary of miners by UID
         """
         try:
-            # Refresh metagraph if needed
-            metagraph = self.metagraph
-            
-            miners = {}
-            for uid in metagraph.uids.tolist():
-                # Skip our own validator UID if it's in the metagraph
-                if metagraph.hotkeys[uid] == self.wallet.hotkey.ss58_address:
-                    logger.debug(f"Skipping our own validator UID: {uid}")
-                    continue
-                    
-                # Skip miners with no axon info
-                if not metagraph.axons[uid]:
-                    logger.debug(f"Skipping miner {uid}: No axon info")
-                    continue
-                
-                # Extract miner information
-                miner_info = {
-                    'uid': uid,
-                    'hotkey': metagraph.hotkeys[uid],
-                    'axon_info': metagraph.axons[uid],
-                    'stake': float(metagraph.stake[uid]),
-                    'trust': float(metagraph.trust[uid]),
-                    'consensus': float(metagraph.consensus[uid]),
-                    'active': bool(metagraph.active[uid]),
-                }
-                
-                miners[str(uid)] = miner_info
-                
-            return miners
+            table = self.miner_table
+            # Skip our own validator hotkey and miners with no axon info
+            rows = table.rows(exclude_hotkey=self.wallet.hotkey.ss58_address)
+            return table.to_miners(rows)
             
         except Exception as e:
             logger.error(f"Error getting miners from Bittensor: {e}")
             return {}
     
-    async def score_miners(self, miners: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
-        """Score miners based on their resources and performance.
+    async def score_miner_table(self, table: MinerTable) -> Dict[str, float]:
+        """Score all eligible miners in a table with array operations.
+        
+        Eligible miners are active, have axon info and are not this validator.
+        A miner's previous score is reused while its hotkey, stake, axon info
+        and uptime bucket are unchanged and the score is younger than
+        score_max_age; the others are re-scored.
         
         Args:
-            miners: Dictionary of miners to score
+            table: Miner table to score
             
         Returns:
             Dict: Dictionary mapping miner UIDs to their scores
         """
-        scores = {}
+        rows = table.rows(exclude_hotkey=self.wallet.hotkey.ss58_address, active_only=True)
+        now = time.time()
+        n = len(table)
         
-        for uid, miner in miners.items():
-            try:
-                # Skip inactive miners
-                if not miner.get('active', False):
-                    logger.debug(f"Skipping inactive miner {uid}")
-                    continue
-                
-                # Get axon info
-                axon_info = miner.get('axon_info')
-                if not axon_info:
-                    logger.debug(f"Skipping miner {uid}: No axon info")
-                    continue
-                
-                # Try to fetch compute specs via axon
-                # This would be a custom request to the miner's axon
-                # For now, we'll use a placeholder scoring method
-                spec_score = await self._score_miner_specs(uid, miner)
-                uptime_score = self._score_miner_uptime(miner)
-                
-                # Combine scores
-                final_score = 0.7 * spec_score + 0.3 * uptime_score
-                scores[uid] = final_score
-                
-                logger.debug(f"Scored miner {uid}: {final_score:.4f} (specs: {spec_score:.4f}, uptime: {uptime_score:.4f})")
-                
-            except Exception as e:
-                logger.warning(f"Error scoring miner {uid}: {e}")
+        hotkeys = np.array(table.hotkeys, dtype=object)
+        # Trust and consensus are the uptime proxy; changes within one
+        # score_uptime_bucket_size step don't trigger a re-score
+        uptime = table.uptime_scores()
+        uptime_bucket = np.floor(uptime / self.settings.score_uptime_bucket_size).astype(np.int64)
         
-        return scores
-    
-    async def _score_miner_specs(self, uid: str, miner: Dict[str, Any]) -> float:
-        """Score a miner based on their hardware specifications.
+        score = np.full(n, np.nan)
+        scored_at = np.zeros(n)
         
-        This would normally interact with the miner's axon to get specs.
-        For now, it uses a placeholder scoring method.
+        previous = self._table_scores
+        reuse = np.zeros(len(rows), dtype=bool)
+        if previous is not None:
+            comparable = rows < len(previous.score)
+            prev_rows = rows[comparable]
+            reuse[comparable] = (
+                (previous.hotkeys[prev_rows] == hotkeys[prev_rows])
+                & (previous.stake[prev_rows] == table.stake[prev_rows])
+                & (previous.axon_keys[prev_rows] == table.axon_keys[prev_rows])
+                & (previous.uptime_bucket[prev_rows] == uptime_bucket[prev_rows])
+                & ~np.isnan(previous.score[prev_rows])
+                & (now - previous.scored_at[prev_rows] < self.settings.score_max_age)
+            )
+            kept = rows[reuse]
+            score[kept] = previous.score[kept]
+            scored_at[kept] = previous.scored_at[kept]
         
-        Args:
-            uid: Miner UID
-            miner: Miner information dictionary
-            
-        Returns:
-            float: Score from 0.0 to 1.0
-        """
-        # TODO: Implement real spec verification via axon
-        # For now, we'll use stake as a proxy for specs
-        # In a real implementation, you'd query the miner's axon
+        fresh = rows[~reuse]
+        if len(fresh):
+            spec_score = self._score_specs(table.stake[fresh])
+            score[fresh] = 0.7 * spec_score + 0.3 * uptime[fresh]
+            scored_at[fresh] = now
         
-        stake = miner.get('stake', 0.0)
-        max_stake = 100.0  # Assuming 100 TAO is a good amount
+        self._table_scores = TableScores(
+            hotkeys=hotkeys,
+            stake=table.stake.copy(),
+            axon_keys=table.axon_keys.copy(),
+            uptime_bucket=uptime_bucket,
+            score=score,
+            scored_at=scored_at,
+        )
         
-        # Normalize stake to a 0-1 range
-        score = min(stake / max_stake, 1.0)
+        logger.info(f"Re-scored {len(fresh)} of {len(rows)} miners; {len(rows) - len(fresh)} unchanged")
+        return dict(zip(table.uids[rows].astype(str).tolist(), score[rows].tolist()))
+    
+    def _score_specs(self, stake: np.ndarray) -> np.ndarray:
+        """Score miner specs from stake, a placeholder until specs are fetched via the axon."""
+        max_stake = 100.0  # Assuming 100 TAO is a good amount
+        score = np.minimum(stake / max_stake, 1.0)
         
         # Add some randomness for testing
-        import random
-        random_factor = random.uniform(0.8, 1.2)
-        score = min(score * random_factor, 1.0)
-        
-        return score
+        random_factor = self._rng.uniform(0.8, 1.2, size=len(stake))
+        return np.minimum(score * random_factor, 1.0)
     
-    def _score_miner_uptime(self, miner: Dict[str, Any]) -> float:
-        """Score a miner based on their uptime/reliability.
+    async def score_miners(self, miners: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
+        """Score miners based on their resources and performance.
+        
+        Scoring runs over the whole miner table (see score_miner_table), which
+        keeps its own per-row reuse state; the result is limited to the given
+        miners.
         
         Args:
-            miner: Miner information dictionary
+            miners: Dictionary of miners to score
             
         Returns:
-            float: Score from 0.0 to 1.0
+            Dict: Dictionary mapping miner UIDs to their scores
         """
-        # Use the trust score from the metagraph as a proxy for uptime
-        trust = miner.get('trust', 0.0)
-        consensus = miner.get('consensus', 0.0)
-        
-        # Combine trust and consensus for an uptime score
-        uptime_score = 0.5 * trust + 0.5 * consensus
-        
-        return min(uptime_score, 1.0)
+        scores = await self.score_miner_table(self.miner_table)
+        return {uid: score for uid, score in scores.items() if uid in miners}
     
     async def set_weights(self, weights: Dict[str, float]) -> bool:
         """Set weights for miners on the Bittensor network.
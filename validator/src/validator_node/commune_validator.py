@@ -15,8 +15,9 @@ from loguru import logger
 from substrateinterface import Keypair
 
 from validator.src.validator_node._config import ValidatorSettings
-from validator.src.validator_node.core_validator import CoreValidator
+from validator.src.validator_node.core_validator import CoreValidator, ScoreInputs
 from validator.src.validator_node.base.utils import get_netuid
+from validator.src.validator_node.module_cache import ModuleMapCache
 from validator.src.validator_node.pog import compute_resource_score, compare_compute_resources
 
 
@@ -35,6 +36,7 @@ class CommuneValidator(CoreValidator):
         # Commune-specific attributes
         self._c_client = None
         self.netuid = None
+        self.module_cache: Optional[ModuleMapCache] = None
         self.miner_data = {}
         self.container_start_times = {}
         
@@ -82,6 +84,13 @@ class CommuneValidator(CoreValidator):
             self.netuid = get_netuid(self._c_client)
             logger.info(f"Using Commune netuid: {self.netuid}")
             
+            self.module_cache = ModuleMapCache(
+                self._c_client,
+                self.netuid,
+                refresh_interval=self.settings.module_cache_refresh_interval,
+                full_refresh_interval=self.settings.module_cache_full_refresh_interval,
+            )
+            
             # Get validator ss58 address
             validator_ss58 = self.key.ss58_address
             
@@ -120,17 +129,8 @@ class CommuneValidator(CoreValidator):
                 
             logger.info(f"Found scores for {len(scores)} miners")
             
-            # Normalize scores
-            normalized_scores = self.normalize_scores(scores)
-            
-            # Convert to weights
-            weights_dict = {
-                uid: self.assign_weight(score)
-                for uid, score in normalized_scores.items()
-            }
-            
-            # Trim to maximum allowed weights
-            weights_dict = self.cut_to_max_allowed_weights(weights_dict)
+            # Normalize, convert to weights and trim to maximum allowed weights
+            weights_dict = self.compute_weights(scores)
             
             # Set weights on network
             success = await self.set_weights(weights_dict)
@@ -152,30 +152,16 @@ class CommuneValidator(CoreValidator):
         try:
             miners = {}
             
-            # Get modules from subnet
-            modules = self.c_client.query_map_modules(self.netuid)
+            # Get modules from the cached module map; only changed modules are re-pulled
+            modules = self.module_cache.get()
             
-            # Extract module information
             for uid, module in modules.items():
                 # Skip our own validator UID
                 if module.get('key') == self.key.ss58_address:
                     logger.debug(f"Skipping our own validator UID: {uid}")
                     continue
                 
-                # Extract miner information
-                miner_info = {
-                    'uid': uid,
-                    'key': module.get('key'),
-                    'address': module.get('address'),
-                    'stake': module.get('stake', 0),
-                    'trust': module.get('trust', 0),
-                    'consensus': module.get('consensus', 0),
-                    'incentive': module.get('incentive', 0),
-                    'dividends': module.get('dividends', 0),
-                    'last_update': module.get('last_update', 0),
-                }
-                
-                miners[str(uid)] = miner_info
+                miners[uid] = module
             
             return miners
             
@@ -287,34 +273,9 @@ class CommuneValidator(CoreValidator):
                 
             logger.debug(f"Verified {len(verified_miners)} miners")
             
-            # 3. For each verified miner, check containers and score
-            for uid, miner in verified_miners.items():
-                try:
-                    # Get miner SSH info from address
-                    # This would extract IP and credentials from the miner's address
-                    # Placeholder implementation
-                    ssh_info = self._extract_ssh_info(miner.get('address', ''))
-                    if not ssh_info:
-                        logger.debug(f"Could not extract SSH info for miner {uid}")
-                        continue
-                    
-                    # Fetch compute specs via SSH
-                    # This would connect to the miner via SSH and get hardware specs
-                    # Placeholder implementation
-                    compute_specs = self._fetch_compute_specs(ssh_info)
-                    if not compute_specs:
-                        logger.debug(f"Could not fetch compute specs for miner {uid}")
-                        continue
-                    
-                    # Score based on compute specs
-                    score = compute_resource_score(compute_specs)
-                    
-                    # Update miner_data with score
-                    self.miner_data[uid] = score
-                    logger.debug(f"Scored miner {uid}: {score}")
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing miner {uid}: {e}")
+            # 3. Score verified miners whose specs or containers changed
+            scores = await self.score_incrementally(verified_miners, self._score_verified_miner)
+            self.miner_data.update(scores)
             
             logger.info(f"Updated scores for {len(self.miner_data)} miners")
             
@@ -322,6 +283,56 @@ class CommuneValidator(CoreValidator):
             logger.error(f"Error tracking miner containers: {e}")
             logger.error(traceback.format_exc())
     
+    def score_inputs(self, uid: str, miner: Dict[str, Any]) -> ScoreInputs:
+        """Describe the inputs a Commune miner's score depends on.
+        
+        Specs are probed from the miner's registered address, so the spec
+        fingerprint follows the module key and address. Scores don't depend
+        on uptime.
+        
+        Args:
+            uid: Miner UID
+            miner: Miner information dictionary
+            
+        Returns:
+            ScoreInputs: Input versions for the miner
+        """
+        return ScoreInputs(
+            spec_fingerprint=self.fingerprint({'key': miner.get('key'), 'address': miner.get('address')}),
+            container_version=self.fingerprint(self.container_start_times.get(uid)),
+        )
+    
+    async def _score_verified_miner(self, uid: str, miner: Dict[str, Any]) -> Optional[float]:
+        """Probe a verified miner's compute specs and score them.
+        
+        Args:
+            uid: Miner UID
+            miner: Miner information dictionary
+            
+        Returns:
+            float: Resource score, or None if the specs could not be fetched
+        """
+        # Get miner SSH info from address
+        # This would extract IP and credentials from the miner's address
+        # Placeholder implementation
+        ssh_info = self._extract_ssh_info(miner.get('address', ''))
+        if not ssh_info:
+            logger.debug(f"Could not extract SSH info for miner {uid}")
+            return None
+        
+        # Fetch compute specs via SSH
+        # This would connect to the miner via SSH and get hardware specs
+        # Placeholder implementation
+        compute_specs = self._fetch_compute_specs(ssh_info)
+        if not compute_specs:
+            logger.debug(f"Could not fetch compute specs for miner {uid}")
+            return None
+        
+        # Score based on compute specs
+        score = compute_resource_score(compute_specs)
+        logger.debug(f"Scored miner {uid}: {score}")
+        return score
+    
     async def verify_miners(self, miners: Dict[str, Any]) -> Dict[str, Any]:
         """Verify miners before scoring them.
         
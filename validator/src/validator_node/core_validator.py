@@ -6,20 +6,26 @@ and shared functionality for all network-specific validator implementations.
 """
 
 import asyncio
+import hashlib
+import json
 import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
 from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Callable, Dict, List, Any, NamedTuple, Optional
 
+import numpy as np
 from loguru import logger
 from pydantic import BaseModel
 from substrateinterface import Keypair
 
 from validator.src.validator_node._config import ValidatorSettings
+from validator.src.validator_node.async_runner import AsyncRunner, get_async_runner
 from validator.src.validator_node.base import BaseValidator
+from validator.src.validator_node.base.weights import select_top_weights, top_k_indices
 
 
 class WeightHistory(BaseModel):
@@ -29,6 +35,21 @@ class WeightHistory(BaseModel):
     network: str  # Which network these weights were for
 
 
+class ScoreInputs(NamedTuple):
+    """Versions of the inputs a miner's score was computed from"""
+    spec_fingerprint: str
+    container_version: str = ""
+    uptime_bucket: int = 0
+
+
+@dataclass
+class MinerScoreState:
+    """Last computed score for a miner and the inputs it was computed from"""
+    score: float
+    inputs: ScoreInputs
+    scored_at: float
+
+
 class CoreValidator(ABC):
     """Base Validator class that defines the interface for all validator implementations.
     
@@ -46,6 +67,15 @@ class CoreValidator(ABC):
         self.key = key
         self.settings = settings or ValidatorSettings()
         self.weights_histories = deque(maxlen=10)
+        self.score_states: Dict[str, MinerScoreState] = {}
+        
+        # One event loop per process, kept across validation cycles so that
+        # sessions, pools and caches bound to it stay alive
+        self.runner: AsyncRunner = get_async_runner()
+        self.runner.add_stop_hook(self.stop_validation_loop)
+        self.runner.add_cleanup(self.close)
+        self._stopping = False
+        self._wakeup = asyncio.Event()
         
         # Initialize logging
         logger.info(f"Initializing {self.__class__.__name__}")
@@ -107,6 +137,89 @@ class CoreValidator(ABC):
         """
         pass
     
+    @staticmethod
+    def fingerprint(value: Any) -> str:
+        """Compute a stable fingerprint of a JSON-like value.
+        
+        Args:
+            value: Value to fingerprint (dict keys are sorted, unknown types are stringified)
+            
+        Returns:
+            str: Hex digest identifying the value
+        """
+        encoded = json.dumps(value, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()[:16]
+    
+    def score_inputs(self, uid: str, miner: Dict[str, Any]) -> ScoreInputs:
+        """Describe the inputs a miner's score depends on.
+        
+        Subclasses should override this with the spec fingerprint, container set
+        version and uptime bucket that their scoring actually uses. By default a
+        miner is re-scored whenever its miner record changes.
+        
+        Args:
+            uid: Miner ID
+            miner: Miner information dictionary
+            
+        Returns:
+            ScoreInputs: Input versions for the miner
+        """
+        return ScoreInputs(spec_fingerprint=self.fingerprint(miner))
+    
+    async def score_incrementally(
+        self,
+        miners: Dict[str, Any],
+        score_miner: Callable[[str, Dict[str, Any]], Awaitable[Optional[float]]],
+    ) -> Dict[str, float]:
+        """Score miners, re-using previous scores for miners whose inputs are unchanged.
+        
+        Only miners with new or changed inputs, or with a score older than
+        settings.score_max_age, are passed to score_miner. Miners that are no
+        longer present are dropped from the score state. A None result (e.g. a
+        failed probe) is not cached, so that miner is retried next cycle.
+        
+        Args:
+            miners: Dictionary of miners to score
+            score_miner: Coroutine function scoring a single (uid, miner)
+            
+        Returns:
+            Dict: Dictionary mapping miner IDs to their scores
+        """
+        now = time.time()
+        scores = {}
+        rescored = 0
+        
+        for uid in set(self.score_states) - set(miners):
+            del self.score_states[uid]
+        
+        for uid, miner in miners.items():
+            try:
+                inputs = self.score_inputs(uid, miner)
+                state = self.score_states.get(uid)
+                if (
+                    state is not None
+                    and state.inputs == inputs
+                    and now - state.scored_at <= self.settings.score_max_age
+                ):
+                    scores[uid] = state.score
+                    continue
+                
+                rescored += 1
+                score = await score_miner(uid, miner)
+                if score is None:
+                    self.score_states.pop(uid, None)
+                    continue
+                
+                self.score_states[uid] = MinerScoreState(score=score, inputs=inputs, scored_at=now)
+                scores[uid] = score
+                
+            except Exception as e:
+                self.score_states.pop(uid, None)
+                logger.warning(f"Error scoring miner {uid}: {e}")
+        
+        logger.info(f"Re-scored {rescored} of {len(miners)} miners ({len(miners) - rescored} unchanged)")
+        return scores
+    
     def normalize_scores(self, score_dict: Dict[str, float]) -> Dict[str, float]:
         """Normalize scores to a range of 0-1.
         
@@ -160,25 +273,64 @@ class CoreValidator(ABC):
         max_allowed_weights = self.settings.max_allowed_weights
         
         if len(score_dict) > max_allowed_weights:
-            sorted_scores = sorted(score_dict.items(), key=lambda x: x[1], reverse=True)
-            trimmed = dict(sorted_scores[:max_allowed_weights])
+            uids = list(score_dict)
+            values = np.fromiter(score_dict.values(), dtype=np.float64, count=len(uids))
+            trimmed = {uids[i]: score_dict[uids[i]] for i in top_k_indices(values, max_allowed_weights).tolist()}
             logger.info(f"Trimmed scores from {len(score_dict)} to max allowed: {len(trimmed)}")
             return trimmed
         return score_dict
     
-    def validation_loop(self):
-        """Continuously validate miners."""
+    def compute_weights(self, score_dict: Dict[str, float]) -> Dict[str, int]:
+        """Convert raw scores to trimmed network weights in a single pass.
+        
+        Equivalent to normalize_scores, then assign_weight for every miner,
+        then cut_to_max_allowed_weights, without the intermediate dictionaries.
+        
+        Args:
+            score_dict: Dictionary of raw scores
+            
+        Returns:
+            Dict: Weights (0-5000) for at most max_allowed_weights miners
+        """
+        weights = select_top_weights(
+            score_dict,
+            self.settings.max_allowed_weights,
+            normalization="minmax",
+            scale=5000,
+        )
+        if len(weights) < len(score_dict):
+            logger.info(f"Trimmed scores from {len(score_dict)} to max allowed: {len(weights)}")
+        return weights
+    
+    async def run_validation_loop(self) -> None:
+        """Validate miners every iteration_interval seconds until stop_validation_loop() is called.
+        
+        A validation step that is in progress when the loop is stopped is
+        allowed to finish.
+        """
         logger.info(f"Starting validation loop for {self.__class__.__name__}")
-        while True:
+        while not self._stopping:
             try:
-                asyncio.run(self.validate_step())
-                logger.debug(f"Completed validation step, sleeping for {self.settings.iteration_interval}s")
-                time.sleep(self.settings.iteration_interval)
+                await self.validate_step()
+                delay = self.settings.iteration_interval
+                logger.debug(f"Completed validation step, sleeping for {delay}s")
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in validation loop: {e}")
                 logger.error(traceback.format_exc())
                 # Brief pause to avoid rapid-fire errors in case of persistent issues
-                time.sleep(5)
+                delay = 5
+            
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        logger.info(f"Validation loop for {self.__class__.__name__} stopped")
+    
+    def validation_loop(self):
+        """Continuously validate miners on the shared event loop (blocks until stopped)."""
+        self.runner.run(self.run_validation_loop())
 
     def start_validation_loop(self):
         """Start the validation loop in a separate thread."""
@@ -187,6 +339,28 @@ class CoreValidator(ABC):
         thread.start()
         return thread
     
+    def stop_validation_loop(self) -> None:
+        """Ask the validation loop to stop after the current step. Safe to call from any thread."""
+        self._stopping = True
+        self.runner.call_soon(self._wakeup.set)
+    
+    async def close(self) -> None:
+        """Release network clients and other loop-bound resources.
+        
+        Runs on the event loop during shutdown(). Subclasses holding sessions
+        or pools should override this.
+        """
+        pass
+    
+    def shutdown(self, drain_timeout: float = 30.0) -> None:
+        """Stop the validation loop, let in-flight work finish, and close the event loop.
+        
+        Args:
+            drain_timeout: Seconds to wait for in-flight work before cancelling it
+        """
+        logger.info(f"Shutting down {self.__class__.__name__}")
+        self.runner.shutdown(drain_timeout)
+    
     def add_weights_history(self, uids: List[str], weights: List[float], network: str):
         """Add a weight history entry.
         
@@ -1,6 +1,7 @@
 import argparse
+import asyncio
 import logging
-import time
+import signal
 import sys
 from typing import List, Optional
 
@@ -9,6 +10,7 @@ from bittensor import Keypair
 from validator.src.validator_node.settings import ValidatorNodeSettings
 from validator.src.validator_node.validator_factory import ValidatorFactory
 from validator.src.validator_node.base.validator_base import BaseValidator
+from validator.src.validator_node.scheduler import NetworkScheduler, PeriodicJob
 
 # Configure logging
 logging.basicConfig(
@@ -48,6 +50,13 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('--max_weight', type=float, default=1.0, help='Maximum weight to assign to any miner')
     parser.add_argument('--validation_interval', type=int, default=900, help='Interval between validations in seconds')
     parser.add_argument('--submission_interval', type=int, default=3600, help='Interval between weight submissions in seconds')
+    parser.add_argument(
+        '--overlap_policy',
+        type=str,
+        default='skip',
+        choices=['skip', 'queue'],
+        help='What to do when a cycle is still running at its next deadline'
+    )
     
     return parser.parse_args()
 
@@ -82,6 +91,59 @@ def submit_weights(validators: List[BaseValidator], cycle_count: int) -> None:
     
     logger.info(f"Completed weight submission cycle {cycle_count}")
 
+def network_name(validator: BaseValidator) -> str:
+    """Get the short network name of a validator (e.g. 'bittensor')."""
+    return type(validator).__name__.replace('Validator', '').lower() or 'validator'
+
+def build_scheduler(validators: List[BaseValidator], args: argparse.Namespace) -> NetworkScheduler:
+    """
+    Create a scheduler with independent validation and submission jobs per network.
+    
+    Jobs of different networks run concurrently. A network's validation and
+    submission share a lock, so weights are never submitted from a
+    half-updated cycle.
+    """
+    scheduler = NetworkScheduler()
+    
+    for validator in validators:
+        network = network_name(validator)
+        network_lock = asyncio.Lock()
+        scheduler.add_job(PeriodicJob(
+            f"{network}.validation",
+            lambda cycle, v=validator: run_validation_cycle([v], cycle),
+            args.validation_interval,
+            overlap=args.overlap_policy,
+            lock=network_lock,
+        ))
+        scheduler.add_job(PeriodicJob(
+            f"{network}.submission",
+            lambda cycle, v=validator: submit_weights([v], cycle),
+            args.submission_interval,
+            overlap=args.overlap_policy,
+            lock=network_lock,
+        ))
+    
+    return scheduler
+
+async def run_scheduler(scheduler: NetworkScheduler) -> None:
+    """Run the scheduler until SIGINT/SIGTERM, then let running cycles finish."""
+    loop = asyncio.get_running_loop()
+    
+    def request_stop(sig: signal.Signals) -> None:
+        logger.info(f"Received {sig.name}, waiting for running cycles to finish (repeat to force)")
+        scheduler.stop()
+        # A second signal falls through to the default handler
+        loop.remove_signal_handler(sig)
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_stop, sig)
+        except (NotImplementedError, RuntimeError):
+            # Not supported on this platform; KeyboardInterrupt still stops the loop
+            pass
+    
+    await scheduler.run()
+
 def main() -> None:
     """Main entry point for the validator."""
     args = parse_args()
@@ -133,36 +195,18 @@ def main() -> None:
     
     logger.info(f"Starting validation with {len(active_validators)} validator(s)")
     
-    # Main loop
-    validation_cycle = 0
-    submission_cycle = 0
-    last_validation_time = 0
-    last_submission_time = 0
-    
+    scheduler = build_scheduler(active_validators, args)
     try:
-        while True:
-            current_time = time.time()
-            
-            # Run validation cycle if interval has passed
-            if current_time - last_validation_time >= args.validation_interval:
-                validation_cycle += 1
-                run_validation_cycle(active_validators, validation_cycle)
-                last_validation_time = current_time
-            
-            # Submit weights if interval has passed
-            if current_time - last_submission_time >= args.submission_interval:
-                submission_cycle += 1
-                submit_weights(active_validators, submission_cycle)
-                last_submission_time = current_time
-            
-            # Sleep to avoid busy waiting
-            time.sleep(10)
-    
+        asyncio.run(run_scheduler(scheduler))
     except KeyboardInterrupt:
         logger.info("Received interrupt, shutting down...")
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
     finally:
+        for name, metrics in scheduler.metrics().items():
+            logger.info(f"{name}: {metrics['runs']} runs, {metrics['failures']} failures, "
+                        f"{metrics['skipped']} skipped, {metrics['queued']} queued, "
+                        f"avg {metrics['average_duration']:.1f}s")
         logger.info("Validator shutting down")
 
 if __name__ == "__main__":
@@ -0,0 +1,189 @@
+"""
+Incremental Metagraph Sync
+
+Reloading the full metagraph fetches every neuron of the subnet, although
+between epochs only a handful of neurons change (new registrations, axon
+updates, weight setting). MetagraphSync keeps a MinerTable current by reading
+small per-UID change markers each sync (LastUpdate, BlockAtRegistration and
+the block of each axon's last serve) and re-fetching only the neurons whose
+markers moved. The rows are patched in place. A full reload still happens on
+the first sync, when an epoch boundary has passed (trust, consensus and stake
+are updated for every neuron by the epoch), when the subnet size changes,
+when too many neurons changed for patching to pay off, when patching fails,
+and every full_resync_interval seconds as a safety net.
+
+Staleness: stake moved by add_stake or unstake does not touch any of the
+change markers, so between full reloads MinerTable.stake (and the trust and
+consensus columns) can lag the chain. The lag is bounded by the next epoch
+boundary or full_resync_interval, whichever comes first, i.e. at most one
+tempo (tempo + 1 blocks). Score reuse in BittensorValidator compares
+against this stake, so a stake change is picked up within the same bound.
+"""
+
+import time
+from typing import Any, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from validator.src.validator_node.miner_table import MinerTable
+
+
+def _value(result: Any) -> Any:
+    """Unwrap a substrate query result (ScaleType objects carry .value)."""
+    return getattr(result, "value", result)
+
+
+class MetagraphSync:
+    """Keeps a metagraph snapshot and its MinerTable in sync with the chain."""
+
+    def __init__(
+        self,
+        subtensor: Any,
+        netuid: int,
+        full_resync_interval: float = 3600.0,
+        max_patch_fraction: float = 0.05,
+    ):
+        """Initialize the sync. Nothing is fetched until the first sync().
+
+        Args:
+            subtensor: Subtensor client (or a stub with the same methods)
+            netuid: Subnet to track
+            full_resync_interval: Maximum seconds between full reloads
+            max_patch_fraction: Reload instead of patching when more than this
+                fraction of the neurons changed (one RPC per patched neuron
+                costs more than a reload beyond that point)
+        """
+        self.subtensor = subtensor
+        self.netuid = netuid
+        self.full_resync_interval = full_resync_interval
+        self.max_patch_fraction = max_patch_fraction
+
+        self.metagraph: Any = None
+        self.table: Optional[MinerTable] = None
+        self.last_block: Optional[int] = None
+
+        self._tempo: Optional[int] = None
+        self._epoch: Optional[int] = None
+        self._last_update: Optional[np.ndarray] = None
+        self._registered_at: Optional[np.ndarray] = None
+        self._axon_blocks: Optional[np.ndarray] = None
+        self._last_full_sync = 0.0
+
+        self.full_syncs = 0
+        self.incremental_syncs = 0
+        self.patched_rows = 0
+
+    def sync(self) -> List[int]:
+        """Bring the table up to date with the current block.
+
+        Returns:
+            List[int]: Rows that changed (every row after a full reload)
+        """
+        if self.table is None or time.time() - self._last_full_sync > self.full_resync_interval:
+            return self.full_sync()
+
+        try:
+            block = int(self.subtensor.get_current_block())
+            if block == self.last_block:
+                return []
+            if self._epoch_of(block) != self._epoch:
+                logger.debug(f"Epoch boundary passed at block {block}, reloading metagraph")
+                return self.full_sync(block)
+
+            last_update = self._query_last_update()
+            registered_at = self._query_registrations(len(last_update))
+            if len(last_update) != len(self.table):
+                logger.debug(f"Subnet size changed ({len(self.table)} -> {len(last_update)}), reloading metagraph")
+                return self.full_sync(block)
+
+            changed = np.flatnonzero(
+                (last_update != self._last_update) | (registered_at != self._registered_at)
+            )
+            if len(changed) > self.max_patch_fraction * len(self.table):
+                logger.debug(f"{len(changed)} neurons changed, reloading metagraph")
+                return self.full_sync(block)
+            self._patch(changed)
+
+            # Axon blocks are keyed by hotkey, so read them after re-registered rows are patched
+            axon_blocks = self._query_axon_blocks()
+            served = np.setdiff1d(np.flatnonzero(axon_blocks != self._axon_blocks), changed)
+            self._patch(served)
+            changed = np.union1d(changed, served)
+
+            self._last_update = last_update
+            self._registered_at = registered_at
+            self._axon_blocks = axon_blocks
+            self.last_block = block
+            self.table.block = block
+            self.incremental_syncs += 1
+            self.patched_rows += len(changed)
+            if len(changed):
+                logger.debug(f"Patched {len(changed)} neurons at block {block}")
+            return changed.tolist()
+
+        except Exception as e:
+            logger.warning(f"Incremental metagraph sync failed, reloading: {e}")
+            return self.full_sync()
+
+    def full_sync(self, block: Optional[int] = None) -> List[int]:
+        """Reload the whole metagraph and rebuild the table.
+
+        Returns:
+            List[int]: Every row
+        """
+        self.metagraph = self.subtensor.metagraph(netuid=self.netuid)
+        self.table = MinerTable.from_metagraph(self.metagraph)
+        n = len(self.table)
+
+        if self._tempo is None:
+            self._tempo = int(_value(self.subtensor.tempo(self.netuid)))
+        if block is None:
+            block = self.table.block if self.table.block is not None else int(self.subtensor.get_current_block())
+
+        last_update = getattr(self.metagraph, "last_update", None)
+        self._last_update = (
+            np.asarray(last_update, dtype=np.int64).reshape(-1) if last_update is not None
+            else self._query_last_update()
+        )
+        self._registered_at = self._query_registrations(n)
+        self._axon_blocks = self._query_axon_blocks()
+
+        self.last_block = block
+        self.table.block = block
+        self._epoch = self._epoch_of(block)
+        self._last_full_sync = time.time()
+        self.full_syncs += 1
+        logger.debug(f"Loaded full metagraph for netuid {self.netuid} at block {block} ({n} neurons)")
+        return list(range(n))
+
+    def _patch(self, rows: np.ndarray) -> None:
+        for row in rows.tolist():
+            neuron = self.subtensor.neuron_for_uid_lite(uid=int(self.table.uids[row]), netuid=self.netuid)
+            self.table.update_row(row, neuron)
+
+    def _epoch_of(self, block: int) -> int:
+        # Same epoch numbering as the chain's blocks_until_next_epoch
+        return (block + self.netuid + 1) // (self._tempo + 1)
+
+    def _query_last_update(self) -> np.ndarray:
+        values = _value(self.subtensor.query_subtensor("LastUpdate", params=[self.netuid]))
+        return np.asarray(values or [], dtype=np.int64)
+
+    def _query_registrations(self, n: int) -> np.ndarray:
+        registered_at = np.zeros(n, dtype=np.int64)
+        for uid, block in self.subtensor.query_map_subtensor("BlockAtRegistration", params=[self.netuid]):
+            uid = int(_value(uid))
+            if uid < n:
+                registered_at[uid] = int(_value(block))
+        return registered_at
+
+    def _query_axon_blocks(self) -> np.ndarray:
+        axon_blocks = np.zeros(len(self.table), dtype=np.int64)
+        for hotkey, axon in self.subtensor.query_map_subtensor("Axons", params=[self.netuid]):
+            row = self.table.hotkey_to_row.get(str(_value(hotkey)))
+            if row is not None:
+                axon = _value(axon)
+                block = axon.get("block", 0) if isinstance(axon, dict) else getattr(axon, "block", 0)
+                axon_blocks[row] = int(block)
+        return axon_blocks
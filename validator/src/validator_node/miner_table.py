@@ -0,0 +1,161 @@
+"""
+Miner Table
+
+This module holds a columnar, NumPy-backed view of a Bittensor metagraph.
+The table is built once per metagraph refresh; filtering (active, serving
+an axon, not our own hotkey) and scoring then operate on whole arrays
+instead of indexing the metagraph and building a dict for every UID.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+def _column(values: Any, dtype: Any, size: int) -> np.ndarray:
+    """Convert a metagraph attribute (NumPy array, torch tensor or list) to a 1-D array."""
+    if values is None:
+        return np.zeros(size, dtype=dtype)
+    if hasattr(values, "detach"):
+        values = values.detach().cpu().numpy()
+    return np.asarray(values, dtype=dtype).reshape(-1)
+
+
+@dataclass
+class MinerTable:
+    """Columnar snapshot of the neurons in a subnet.
+
+    Row i describes the neuron at position i of the metagraph. hotkeys,
+    axons and axon_keys are Python lists aligned with the arrays.
+    """
+    uids: np.ndarray
+    hotkeys: List[str]
+    axons: List[Any]
+    axon_keys: np.ndarray
+    stake: np.ndarray
+    trust: np.ndarray
+    consensus: np.ndarray
+    active: np.ndarray
+    has_axon: np.ndarray
+    block: Optional[int] = None
+    hotkey_to_row: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.hotkey_to_row:
+            self.hotkey_to_row = {hotkey: row for row, hotkey in enumerate(self.hotkeys)}
+
+    def __len__(self) -> int:
+        return len(self.uids)
+
+    @classmethod
+    def from_metagraph(cls, metagraph: Any) -> "MinerTable":
+        """Build the table from a metagraph.
+
+        Args:
+            metagraph: A bittensor metagraph (or any object with the same attributes)
+
+        Returns:
+            MinerTable: The snapshot
+        """
+        uids = _column(metagraph.uids, np.int64, 0)
+        n = len(uids)
+        hotkeys = list(metagraph.hotkeys)
+        axons = list(metagraph.axons)
+        block = getattr(metagraph, "block", None)
+
+        return cls(
+            uids=uids,
+            hotkeys=hotkeys,
+            axons=axons,
+            axon_keys=np.array([str(axon) if axon else "" for axon in axons], dtype=object),
+            stake=_column(getattr(metagraph, "stake", None), np.float64, n),
+            trust=_column(getattr(metagraph, "trust", None), np.float64, n),
+            consensus=_column(getattr(metagraph, "consensus", None), np.float64, n),
+            active=_column(getattr(metagraph, "active", None), bool, n),
+            has_axon=np.fromiter((bool(axon) for axon in axons), dtype=bool, count=n),
+            block=int(block) if block is not None else None,
+        )
+
+    def update_row(self, row: int, neuron: Any) -> None:
+        """Overwrite one row in place from a neuron record.
+
+        Args:
+            row: Row to patch
+            neuron: A NeuronInfoLite (or any object with the same attributes)
+        """
+        old_hotkey = self.hotkeys[row]
+        if self.hotkey_to_row.get(old_hotkey) == row:
+            del self.hotkey_to_row[old_hotkey]
+
+        axon = getattr(neuron, "axon_info", None)
+        self.uids[row] = int(neuron.uid)
+        self.hotkeys[row] = neuron.hotkey
+        self.axons[row] = axon
+        self.axon_keys[row] = str(axon) if axon else ""
+        self.stake[row] = float(getattr(neuron, "stake", 0.0))
+        self.trust[row] = float(getattr(neuron, "trust", 0.0))
+        self.consensus[row] = float(getattr(neuron, "consensus", 0.0))
+        self.active[row] = bool(getattr(neuron, "active", False))
+        self.has_axon[row] = bool(axon)
+        self.hotkey_to_row[neuron.hotkey] = row
+
+    def row_of_hotkey(self, hotkey: str) -> Optional[int]:
+        """Get the row of a hotkey, or None if it is not registered."""
+        return self.hotkey_to_row.get(hotkey)
+
+    def uid_of_hotkey(self, hotkey: str) -> Optional[int]:
+        """Get the UID of a hotkey, or None if it is not registered."""
+        row = self.hotkey_to_row.get(hotkey)
+        return int(self.uids[row]) if row is not None else None
+
+    def mask(
+        self,
+        exclude_hotkey: Optional[str] = None,
+        require_axon: bool = True,
+        active_only: bool = False,
+    ) -> np.ndarray:
+        """Build a boolean row filter.
+
+        Args:
+            exclude_hotkey: Hotkey to leave out (normally our own)
+            require_axon: Keep only neurons with axon info
+            active_only: Keep only active neurons
+
+        Returns:
+            np.ndarray: Boolean mask over the rows
+        """
+        keep = np.ones(len(self), dtype=bool)
+        if require_axon:
+            keep &= self.has_axon
+        if active_only:
+            keep &= self.active
+        if exclude_hotkey is not None:
+            row = self.hotkey_to_row.get(exclude_hotkey)
+            if row is not None:
+                keep[row] = False
+        return keep
+
+    def rows(self, **filters: Any) -> np.ndarray:
+        """Get the indices of the rows passing mask(**filters)."""
+        return np.flatnonzero(self.mask(**filters))
+
+    def uptime_scores(self) -> np.ndarray:
+        """Trust/consensus uptime proxy for every row, in the range 0.0-1.0."""
+        return np.minimum(0.5 * self.trust + 0.5 * self.consensus, 1.0)
+
+    def miner(self, row: int) -> Dict[str, Any]:
+        """Get one row in the dictionary form returned by get_miners()."""
+        return {
+            'uid': int(self.uids[row]),
+            'hotkey': self.hotkeys[row],
+            'axon_info': self.axons[row],
+            'stake': float(self.stake[row]),
+            'trust': float(self.trust[row]),
+            'consensus': float(self.consensus[row]),
+            'active': bool(self.active[row]),
+        }
+
+    def to_miners(self, rows: np.ndarray) -> Dict[str, Dict[str, Any]]:
+        """Get rows as miner dictionaries keyed by UID string."""
+        return {str(int(self.uids[row])): self.miner(row) for row in rows.tolist()}
@@ -0,0 +1,154 @@
+"""
+Module Map Cache
+
+Keeps a Commune subnet's module map between validation cycles. Each refresh
+queries only the fields needed to filter miners (key, address and this
+subnet's last_update) and diffs them against the cached entries. Full module
+records (stake, trust, consensus, ...) are pulled only when a module was
+registered or changed key or address, or the full refresh interval has
+elapsed. Modules whose last_update alone moved (validators do on every vote)
+only get their last_update patched; unchanged modules keep their parsed
+objects. Detail fields can therefore lag by up to full_refresh_interval.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+
+from loguru import logger
+
+# Fields of a parsed module entry that come from the full module map
+DETAIL_FIELDS = ('stake', 'trust', 'consensus', 'incentive', 'dividends')
+
+Projection = Tuple[Any, Any, Any]
+
+
+class ModuleMapCache:
+    """Cached, incrementally refreshed view of the modules of one subnet."""
+
+    def __init__(
+        self,
+        client: Any,
+        netuid: int,
+        refresh_interval: float = 60.0,
+        full_refresh_interval: float = 3600.0,
+        with_details: bool = True,
+    ):
+        """Initialize the cache. Nothing is queried until the first get().
+
+        Args:
+            client: CommuneClient (or any object with the same query methods)
+            netuid: Subnet to track
+            refresh_interval: Seconds a cached map is served without querying
+            full_refresh_interval: Maximum seconds between full module map pulls
+            with_details: Pull the full module map for changed modules; when
+                False, entries only hold uid, key, address and last_update
+        """
+        self.client = client
+        self.netuid = netuid
+        self.refresh_interval = refresh_interval
+        self.full_refresh_interval = full_refresh_interval
+        self.with_details = with_details
+
+        self._modules: Dict[str, Dict[str, Any]] = {}
+        self._projections: Dict[str, Projection] = {}
+        self._last_refresh = 0.0
+        self._last_full_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Get the module map keyed by UID string, refreshing it if stale.
+
+        Returns:
+            Dict: A new dictionary over the cached module entries
+        """
+        with self._lock:
+            if force or not self._modules or time.time() - self._last_refresh > self.refresh_interval:
+                try:
+                    self._refresh()
+                except Exception as e:
+                    if not self._modules:
+                        raise
+                    logger.warning(f"Module map refresh failed, serving cached map: {e}")
+            return dict(self._modules)
+
+    def invalidate(self) -> None:
+        """Force the next get() to query the chain."""
+        with self._lock:
+            self._last_refresh = 0.0
+
+    def _refresh(self) -> Set[str]:
+        projections = self._query_projections()
+        now = time.time()
+
+        changed = {uid for uid, projection in projections.items() if self._projections.get(uid) != projection}
+        removed = self._projections.keys() - projections.keys()
+        # A moved last_update alone does not change the module's details
+        moved = {
+            uid for uid in changed
+            if uid in self._modules and self._projections[uid][:2] == projections[uid][:2]
+        }
+        registered = changed - moved
+        full_due = now - self._last_full_refresh > self.full_refresh_interval
+        full = self.with_details and (registered or full_due)
+
+        if full:
+            details = self.client.query_map_modules(self.netuid)
+            details = {str(uid): module for uid, module in details.items()}
+            if full_due:
+                # Stake, trust and consensus move without touching last_update
+                registered |= {uid for uid in projections if self._details_changed(uid, details.get(uid))}
+                self._last_full_refresh = now
+        else:
+            details = {}
+
+        for uid in moved - registered:
+            self._modules[uid] = {**self._modules[uid], 'last_update': projections[uid][2]}
+        for uid in removed:
+            self._modules.pop(uid, None)
+        for uid in registered:
+            self._modules[uid] = self._parse(uid, projections[uid], details.get(uid))
+
+        self._projections = projections
+        self._last_refresh = now
+        if changed or removed:
+            logger.debug(
+                f"Module map for netuid {self.netuid}: {len(registered)} changed, "
+                f"{len(moved - registered)} last_update only, {len(removed)} removed, "
+                f"{len(projections)} total{' (full pull)' if full else ''}"
+            )
+        return changed
+
+    def _query_projections(self) -> Dict[str, Projection]:
+        keys = self.client.query_map_key(self.netuid)
+        addresses = self.client.query_map_address(self.netuid)
+        # LastUpdate is keyed by netuid; read this subnet's vector only
+        last_updates = self.client.query("LastUpdate", params=[self.netuid]) or []
+        return {
+            str(uid): (
+                key,
+                addresses.get(uid),
+                last_updates[uid] if uid < len(last_updates) else 0,
+            )
+            for uid, key in keys.items()
+        }
+
+    def _details_changed(self, uid: str, module: Optional[Dict[str, Any]]) -> bool:
+        cached = self._modules.get(uid)
+        if cached is None or module is None:
+            return True
+        return any(cached.get(field) != module.get(field, 0) for field in DETAIL_FIELDS)
+
+    @staticmethod
+    def _parse(uid: str, projection: Projection, module: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        key, address, last_update = projection
+        entry = {
+            'uid': int(uid),
+            'key': key,
+            'address': address,
+            'last_update': last_update,
+        }
+        if module is not None:
+            for field in DETAIL_FIELDS:
+                entry[field] = module.get(field, 0)
+        return entry
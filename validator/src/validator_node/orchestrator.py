@@ -0,0 +1,130 @@
+"""
+Orchestrator Snapshot Fetcher
+
+This module fetches list endpoints from the Polaris orchestrator API (such as
+the full miner list) over one pooled HTTP session. Each payload is parsed once
+and cached with its ETag / Last-Modified validators. Repeat reads within
+max_age seconds are served from memory. Later reads send a conditional
+request, so an unchanged list costs a 304 instead of a full download and
+JSON parse.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+
+ORCHESTRATOR_API_URL = "https://orchestrator-gekh.onrender.com/api/v1"
+
+
+@dataclass
+class Snapshot:
+    """A parsed payload and the validators needed to revalidate it."""
+    payload: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+
+class OrchestratorSnapshotFetcher:
+    """Fetches and caches orchestrator list endpoints over a pooled session."""
+
+    def __init__(
+        self,
+        base_url: str = ORCHESTRATOR_API_URL,
+        max_age: float = 60.0,
+        timeout: float = 30.0,
+        pool_maxsize: int = 32,
+    ):
+        """Initialize the fetcher.
+
+        Args:
+            base_url: Base URL of the orchestrator API
+            max_age: Seconds a snapshot is reused without contacting the server
+            timeout: HTTP request timeout in seconds
+            pool_maxsize: Maximum number of pooled connections to the orchestrator
+        """
+        self.base_url = base_url.rstrip("/")
+        self.max_age = max_age
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get(self, path: str, force: bool = False) -> Optional[Any]:
+        """Get the parsed payload of an endpoint.
+
+        Args:
+            path: Endpoint path relative to base_url (e.g. "/miners")
+            force: Revalidate with the server even if the snapshot is fresh
+
+        Returns:
+            The parsed JSON payload, or None if it could not be fetched
+        """
+        with self._lock_for(path):
+            snapshot = self._snapshots.get(path)
+            if snapshot is not None and not force and time.time() - snapshot.fetched_at < self.max_age:
+                return snapshot.payload
+
+            headers = {}
+            if snapshot is not None:
+                if snapshot.etag:
+                    headers["If-None-Match"] = snapshot.etag
+                if snapshot.last_modified:
+                    headers["If-Modified-Since"] = snapshot.last_modified
+
+            url = f"{self.base_url}{path}"
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+
+            if response.status_code == 304 and snapshot is not None:
+                logger.debug(f"{path} unchanged since last fetch")
+                snapshot.fetched_at = time.time()
+                return snapshot.payload
+
+            if response.status_code != 200:
+                logger.warning(f"Failed to fetch {url}. Status code: {response.status_code}")
+                return None
+
+            try:
+                payload = response.json()
+            except ValueError as e:
+                logger.error(f"Invalid JSON from {url}: {e}")
+                return None
+
+            self._snapshots[path] = Snapshot(
+                payload=payload,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                fetched_at=time.time(),
+            )
+            return payload
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Force the next get() to revalidate one endpoint, or all of them."""
+        for key in ([path] if path is not None else list(self._snapshots)):
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                snapshot.fetched_at = 0.0
+
+    def close(self) -> None:
+        """Close the pooled session."""
+        self.session.close()
+
+    def _lock_for(self, path: str) -> threading.Lock:
+        # One fetch per endpoint at a time; concurrent callers share its result
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
@@ -2,6 +2,9 @@ import paramiko
 import json
 import re
 import logging
+import shlex
+
+from validator.src.utils.spec_cache import FINGERPRINT_COMMAND, parse_fingerprint
 
 logger = logging.getLogger("remote_access")
 
@@ -180,11 +183,102 @@ def parse_ngrok_ssh(ssh_string):
 #         client.close()
 
 
-def execute_remote_command(client, command):
-    """Executes a command on the remote server via SSH."""
+# Commands issued by the get_remote_* helpers on Linux, keyed by section name.
+# The batched probe runs all of them in a single exec_command round trip.
+LINUX_PROBE_COMMANDS = {
+    "os": "uname",
+    "cpu": "lscpu",
+    "gpu": "nvidia-smi --query-gpu=name,memory.total --format=csv,noheader",
+    "ram": "grep -m 1 MemTotal /proc/meminfo 2>/dev/null || free -h | grep Mem",
+    "storage": "lsblk -o NAME,TYPE,SIZE | grep disk",
+}
+
+# Seconds a remote command may go without producing output before its read
+# is abandoned; connect and auth are bounded separately by the probe timeout.
+REMOTE_COMMAND_TIMEOUT = 30
+
+PROBE_SECTION_MARKER = "@@polaris-probe:{}@@"
+PROBE_SECTION_RE = re.compile(r"^@@polaris-probe:(\w+)@@$")
+
+
+class BatchedProbeOutput:
+    """Pre-fetched probe output that stands in for an SSH client.
+
+    ``execute_remote_command`` answers commands from the captured sections
+    instead of opening a new channel, so the get_remote_* parsers consume a
+    batched probe without changes.
+    """
+
+    def __init__(self, sections, commands=LINUX_PROBE_COMMANDS):
+        self.sections = sections
+        self._by_command = {command: sections.get(name, "") for name, command in commands.items()}
+
+    def output_for(self, command):
+        return self._by_command.get(command)
+
+
+def build_batched_probe_script(commands=LINUX_PROBE_COMMANDS):
+    """Builds a POSIX shell script that runs every probe command and delimits each section."""
+    parts = []
+    for name, command in commands.items():
+        parts.append(f"echo {PROBE_SECTION_MARKER.format(name)}")
+        parts.append(f"{{ {command}; }} 2>/dev/null")
+    return "sh -c " + shlex.quote("; ".join(parts))
+
+
+def parse_batched_probe_output(stdout):
+    """Splits batched probe output into a dict of section name to stripped output."""
+    sections = {}
+    current = None
+    lines = []
+    for line in stdout.splitlines():
+        match = PROBE_SECTION_RE.match(line.strip())
+        if match:
+            if current is not None:
+                sections[current] = "\n".join(lines).strip()
+            current, lines = match.group(1), []
+        elif current is not None:
+            lines.append(line)
+    if current is not None:
+        sections[current] = "\n".join(lines).strip()
+    return sections
+
+
+def run_batched_probe(client, commands=LINUX_PROBE_COMMANDS, timeout=REMOTE_COMMAND_TIMEOUT):
+    """Runs every Linux probe command in one round trip.
+
+    Returns:
+        BatchedProbeOutput, or None if the remote host is not Linux or the
+        batched script failed, in which case callers probe command by command.
+    """
+    stdout, stderr = execute_remote_command(client, build_batched_probe_script(commands), timeout=timeout)
+    if not stdout:
+        logger.warning(f"Batched probe returned no output: {stderr}")
+        return None
+    sections = parse_batched_probe_output(stdout)
+    if "Linux" not in sections.get("os", ""):
+        return None
+    return BatchedProbeOutput(sections, commands)
+
+
+def execute_remote_command(client, command, timeout=REMOTE_COMMAND_TIMEOUT):
+    """Executes a command on the remote server via SSH.
+
+    ``timeout`` is set on the command's channel, so a stalled read raises
+    TimeoutError instead of blocking forever. The TimeoutError is re-raised
+    so the probe gives up on the miner rather than trying further commands.
+    """
+    if isinstance(client, BatchedProbeOutput):
+        output = client.output_for(command)
+        if output is None:
+            return None, f"Command not captured by batched probe: {command}"
+        return output, ""
     try:
-        stdin, stdout, stderr = client.exec_command(command)
+        stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
         return stdout.read().decode().strip(), stderr.read().decode().strip()
+    except TimeoutError:
+        logger.error(f"Remote command timed out after {timeout}s: {command}")
+        raise
     except Exception as e:
         logger.error(f"Failed to execute remote command: {command}. Error: {e}")
         return None, str(e)
@@ -198,6 +292,8 @@ def get_remote_os(client):
         stdout, _ = execute_remote_command(client, "systeminfo | findstr /B /C:\"OS Name\"")
         if "Windows" in stdout:
             return "Windows"
+    except TimeoutError:
+        raise
     except Exception as e:
         logger.error(f"Failed to detect remote OS. Error: {e}")
     return "Unknown"
@@ -276,11 +372,21 @@ def get_remote_gpu_info(client, os_type):
         ]
     return []
 
+def parse_remote_ram(stdout):
+    """Parses a /proc/meminfo MemTotal line, or a `free -h` Mem line on hosts without /proc."""
+    if not stdout:
+        return "Unknown"
+    fields = stdout.split()
+    if fields[0] == "MemTotal:" and len(fields) > 1 and fields[1].isdigit():
+        # Same format as the miner's own report (psutil total in GiB)
+        return f"{int(fields[1]) * 1024 / (1024**3):.2f}GB"
+    return fields[1] if len(fields) > 1 else "Unknown"
+
 def get_remote_ram_info(client, os_type):
     """Fetches RAM info from the remote machine."""
     if os_type == "Linux":
-        stdout, _ = execute_remote_command(client, "free -h | grep Mem")
-        return stdout.split()[1] if stdout else "Unknown"
+        stdout, _ = execute_remote_command(client, LINUX_PROBE_COMMANDS["ram"])
+        return parse_remote_ram(stdout)
     elif os_type == "Windows":
         cmd = """powershell -Command "Get-CimInstance Win32_ComputerSystem | Select-Object TotalPhysicalMemory | ConvertTo-Json" """
         stdout, _ = execute_remote_command(client, cmd)
@@ -309,22 +415,67 @@ def get_remote_storage_info(client, os_type):
         return {"name": "Disk", "type": primary_storage.get("MediaType", "Unknown"), "capacity": f"{capacity_gb:.2f} GB"}
     return {"name": "Unknown", "type": "Unknown", "capacity": "Unknown"}
 
-def fetch_compute_specs(ssh_string, password):
-    """Fetches system specifications from a remote machine via SSH."""
+def fetch_spec_fingerprint(client, timeout=REMOTE_COMMAND_TIMEOUT):
+    """Fetches the cheap hardware fingerprint used for spec cache change detection."""
+    stdout, _ = execute_remote_command(client, FINGERPRINT_COMMAND, timeout=timeout)
+    return parse_fingerprint(stdout)
+
+def fetch_compute_specs(ssh_string, password, timeout=None, batched=True, pool=None,
+                        cache=None, cache_key=None):
+    """Fetches system specifications from a remote machine via SSH.
+
+    ``timeout`` bounds the TCP connect, SSH banner and authentication phases,
+    and the reads of the fingerprint and batched probe commands (other
+    commands use REMOTE_COMMAND_TIMEOUT), so that an unresponsive miner cannot
+    hold a worker indefinitely. With
+    ``batched`` set, Linux hosts are probed with a single composite script
+    (one channel, one round trip); other hosts fall back to one command per
+    round trip. When an ``SSHConnectionPool`` is passed, the connection is
+    leased from it and kept open for the next cycle instead of being closed.
+
+    With a ``SpecCache`` and ``cache_key`` (the miner ID), only the hardware
+    fingerprint is fetched; the cached specs are returned when it matches
+    and the entry is fresh, otherwise the full probe runs and is cached.
+    """
     username, hostname, port = parse_ngrok_ssh(ssh_string)
-    client = paramiko.SSHClient()
-    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    command_timeout = timeout or REMOTE_COMMAND_TIMEOUT
+    client = None
+    failed = False
 
     try:
-        client.connect(hostname=hostname, port=port, username=username, password=password)
-        os_type = get_remote_os(client)
-
-        cpu_specs = get_remote_cpu_info(client, os_type)
-        gpu_specs = get_remote_gpu_info(client, os_type)
-        ram = get_remote_ram_info(client, os_type)
-        storage = get_remote_storage_info(client, os_type)
-
-        return {
+        if pool is not None:
+            client = pool.acquire(hostname, port, username, password=password, connect_timeout=timeout)
+        else:
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            client.connect(
+                hostname=hostname,
+                port=port,
+                username=username,
+                password=password,
+                timeout=timeout,
+                banner_timeout=timeout,
+                auth_timeout=timeout,
+            )
+        fingerprint = {}
+        if cache is not None and cache_key is not None:
+            fingerprint = fetch_spec_fingerprint(client, timeout=command_timeout)
+            cached = cache.lookup(cache_key, fingerprint)
+            if cached is not None:
+                logger.info(f"Hardware fingerprint unchanged for {cache_key}, using cached specs")
+                return cached
+
+        source = client
+        if batched:
+            source = run_batched_probe(client, timeout=command_timeout) or client
+        os_type = get_remote_os(source)
+
+        cpu_specs = get_remote_cpu_info(source, os_type)
+        gpu_specs = get_remote_gpu_info(source, os_type)
+        ram = get_remote_ram_info(source, os_type)
+        storage = get_remote_storage_info(source, os_type)
+
+        specs = {
             "resource_type": "GPU" if gpu_specs else "CPU",
             "ram": ram,
             "storage": storage,
@@ -332,7 +483,11 @@ def fetch_compute_specs(ssh_string, password):
             "cpu_specs": cpu_specs,
             "gpu_specs": gpu_specs if gpu_specs else None,
         }
+        if cache is not None and cache_key is not None:
+            cache.store(cache_key, fingerprint, specs)
+        return specs
     except Exception as e:
+        failed = True
         logger.error(f"Failed to fetch compute specs: {e}")
         return {
             "resource_type": "Unknown",
@@ -343,7 +498,11 @@ def fetch_compute_specs(ssh_string, password):
             "gpu_specs": None,
         }
     finally:
-        client.close()
+        if client is not None:
+            if pool is not None:
+                pool.release(client, discard=failed)
+            else:
+                client.close()
 
 
 
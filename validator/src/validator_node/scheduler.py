@@ -0,0 +1,186 @@
+"""
+Network Scheduler
+
+This module runs periodic validator jobs (validation cycles and weight
+submissions for each network) as independent asyncio tasks. Every job sleeps
+until its next deadline instead of polling, so a slow Commune cycle no longer
+delays Bittensor weight setting. When a run overruns its interval, the next
+run is either skipped or queued to start as soon as the current one finishes.
+Per-job metrics are kept for monitoring.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+OVERLAP_POLICIES = ("skip", "queue")
+
+
+@dataclass
+class JobMetrics:
+    """Run statistics for a scheduled job."""
+    runs: int = 0
+    failures: int = 0
+    overruns: int = 0
+    skipped: int = 0
+    queued: int = 0
+    last_started: Optional[float] = None
+    last_duration: Optional[float] = None
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    last_error: Optional[str] = None
+
+    @property
+    def average_duration(self) -> float:
+        """Average run duration in seconds."""
+        return self.total_duration / self.runs if self.runs else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the metrics as a dictionary."""
+        return {**asdict(self), "average_duration": self.average_duration}
+
+
+class PeriodicJob:
+    """A blocking function run on a worker thread at a fixed rate."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[int], Any],
+        interval: float,
+        overlap: str = "skip",
+        lock: Optional[asyncio.Lock] = None,
+    ):
+        """Initialize the job.
+
+        Args:
+            name: Job name used in logs and metrics (e.g. "bittensor.validation")
+            func: Blocking function called with the 1-based cycle number
+            interval: Seconds between deadlines
+            overlap: What to do when a deadline arrives while the previous run
+                is still going: "skip" that run, or "queue" it to start right
+                after (at most one queued run)
+            lock: Optional lock shared with other jobs that must not run at
+                the same time as this one (e.g. jobs of the same network)
+        """
+        if overlap not in OVERLAP_POLICIES:
+            raise ValueError(f"Unknown overlap policy: {overlap}")
+
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.overlap = overlap
+        self.lock = lock
+        self.metrics = JobMetrics()
+
+        self._cycle = 0
+        self._running: Optional[asyncio.Task] = None
+        self._queued = False
+
+    async def run_forever(self, stop: asyncio.Event) -> None:
+        """Start a run at every deadline until stop is set.
+
+        The first run starts immediately. Deadlines are fixed-rate from the
+        start time, so run duration does not cause drift; deadlines missed
+        entirely (e.g. after a long stall) are not replayed.
+        """
+        deadline = time.monotonic()
+        while not stop.is_set():
+            self._on_deadline()
+
+            now = time.monotonic()
+            deadline += self.interval
+            if deadline <= now:
+                deadline += ((now - deadline) // self.interval + 1) * self.interval
+
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=deadline - now)
+            except asyncio.TimeoutError:
+                pass
+
+        await self.drain()
+
+    async def drain(self) -> None:
+        """Wait for the current run to finish and drop any queued run."""
+        self._queued = False
+        if self._running is not None:
+            await asyncio.gather(self._running, return_exceptions=True)
+
+    def _on_deadline(self) -> None:
+        if self._running is None or self._running.done():
+            self._start()
+            return
+
+        self.metrics.overruns += 1
+        if self.overlap == "queue" and not self._queued:
+            self._queued = True
+            self.metrics.queued += 1
+            logger.warning(f"{self.name} is still running, queued the next run")
+        else:
+            self.metrics.skipped += 1
+            logger.warning(f"{self.name} is still running, skipped a run")
+
+    def _start(self) -> None:
+        self._cycle += 1
+        self._running = asyncio.ensure_future(self._run(self._cycle))
+        self._running.add_done_callback(self._on_done)
+
+    def _on_done(self, _task: asyncio.Task) -> None:
+        if self._queued:
+            self._queued = False
+            self._start()
+
+    async def _run(self, cycle: int) -> None:
+        if self.lock is not None:
+            await self.lock.acquire()
+        try:
+            started = time.monotonic()
+            self.metrics.last_started = time.time()
+            logger.info(f"Starting {self.name} cycle {cycle}")
+            try:
+                await asyncio.to_thread(self.func, cycle)
+                self.metrics.last_error = None
+            except Exception as e:
+                self.metrics.failures += 1
+                self.metrics.last_error = str(e)
+                logger.error(f"Error during {self.name} cycle {cycle}: {e}")
+
+            duration = time.monotonic() - started
+            self.metrics.runs += 1
+            self.metrics.last_duration = duration
+            self.metrics.max_duration = max(self.metrics.max_duration, duration)
+            self.metrics.total_duration += duration
+            logger.info(f"Completed {self.name} cycle {cycle} in {duration:.1f}s")
+        finally:
+            if self.lock is not None:
+                self.lock.release()
+
+
+class NetworkScheduler:
+    """Runs periodic jobs concurrently on one event loop."""
+
+    def __init__(self):
+        self.jobs: List[PeriodicJob] = []
+        self._stop: Optional[asyncio.Event] = None
+
+    def add_job(self, job: PeriodicJob) -> PeriodicJob:
+        """Register a job. Jobs must be added before run()."""
+        self.jobs.append(job)
+        return job
+
+    async def run(self) -> None:
+        """Run all jobs until stop() is called, then wait for running jobs to finish."""
+        self._stop = asyncio.Event()
+        await asyncio.gather(*(job.run_forever(self._stop) for job in self.jobs))
+
+    def stop(self) -> None:
+        """Ask all jobs to stop after their current run."""
+        if self._stop is not None:
+            self._stop.set()
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get the metrics of every job, keyed by job name."""
+        return {job.name: job.metrics.to_dict() for job in self.jobs}
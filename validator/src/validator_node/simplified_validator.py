@@ -7,6 +7,8 @@ from typing import Dict, List, Any, Optional
 import bittensor as bt
 from bittensor import Keypair, wallet
 
+from validator.src.utils.gpu_catalog import GPU_BONUS_FACTORS, get_gpu_catalog
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -143,18 +145,13 @@ class SimpleValidator:
                 # Extract GPU memory (in GB) and name
                 memory = gpu.get('memory', 0)  # Memory in MB
                 memory_gb = memory / 1024.0  # Convert to GB
-                name = gpu.get('name', '').lower()
+                name = gpu.get('name', '')
                 
                 # Base score on memory
                 gpu_score = memory_gb * 0.5
                 
                 # Bonus for powerful GPUs
-                if 'a100' in name:
-                    gpu_score *= 1.5
-                elif 'h100' in name:
-                    gpu_score *= 2.0
-                elif '3090' in name or '4090' in name:
-                    gpu_score *= 1.3
+                gpu_score *= get_gpu_catalog(GPU_BONUS_FACTORS).bonus(name)
                 
                 total_gpu_score += gpu_score
             
@@ -2,6 +2,8 @@ import logging
 from typing import Dict, Any, Tuple
 import math
 
+from validator.src.utils.gpu_catalog import GPU_BONUS_FACTORS, get_gpu_catalog
+
 logger = logging.getLogger(__name__)
 
 def calculate_cpu_score(specs: Dict[str, Any]) -> float:
@@ -29,18 +31,13 @@ def calculate_gpu_score(specs: Dict[str, Any]) -> float:
             # Extract GPU memory (in GB) and name
             memory = gpu.get('memory', 0)  # Memory in MB
             memory_gb = memory / 1024.0  # Convert to GB
-            name = gpu.get('name', '').lower()
+            name = gpu.get('name', '')
             
             # Base score on memory
             gpu_score = memory_gb * 0.5
             
             # Bonus for powerful GPUs
-            if 'a100' in name:
-                gpu_score *= 1.5
-            elif 'h100' in name:
-                gpu_score *= 2.0
-            elif '3090' in name or '4090' in name:
-                gpu_score *= 1.3
+            gpu_score *= get_gpu_catalog(GPU_BONUS_FACTORS).bonus(name)
             
             total_gpu_score += gpu_score
         
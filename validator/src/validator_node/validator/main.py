@@ -3,7 +3,6 @@ import os
 import signal
 import sys
 import time
-import asyncio
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -213,7 +212,7 @@ def main(
             
             try:
                 # Initialize the network connection
-                asyncio.run(validator.initialize_network())
+                validator.runner.run(validator.initialize_network())
                 
                 # Start validator API
                 command = f'uvicorn validator.src.validator_node.api:app --host {host} --port {port} --log-level warning'
@@ -240,8 +239,11 @@ def main(
                     box=box.HEAVY
                 ))
                 
-                # Wait for termination signal
-                signal.pause()
+                # Wait for termination signal, then drain the validation loop
+                try:
+                    signal.pause()
+                finally:
+                    validator.shutdown()
                 
             except Exception as e:
                 error_msg = f"Failed to start validator: {str(e)}"
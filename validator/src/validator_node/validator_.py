@@ -1,8 +1,11 @@
 import asyncio
+import functools
 import math
 import sys
 import time
 import warnings
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List
 
@@ -15,11 +18,20 @@ from substrateinterface import Keypair
 
 from compute_subnet.src.neurons.Validator.challenges import (
     ChallengeGenerator, Verifier)
+from validator.src.utils.spec_cache import SpecCache
+from validator.src.utils.ssh_pool import SSHConnectionPool
+from validator.src.validator_node.async_runner import get_async_runner
 from validator.src.validator_node.base._config import ValidatorNodeSettings
+from validator.src.validator_node.base.weights import select_top_weights
 from validator.src.validator_node.base.comx_config import get_node_url
+from validator.src.validator_node.module_cache import ModuleMapCache
+from validator.src.validator_node.orchestrator import \
+    OrchestratorSnapshotFetcher
 from validator.src.validator_node.pog import (compare_compute_resources,
                                               compute_resource_score,
                                               fetch_compute_specs)
+from validator.src.validator_node.verification_engine import (
+    VerificationEngine, VerificationJob)
 
 
 class ValidatorNode(Module):
@@ -41,11 +53,37 @@ class ValidatorNode(Module):
             logger.error(f"Failed to get netuid: {e}")
             raise
 
+        # Miner filtering only needs module keys, so skip the full module map
+        self.module_cache = ModuleMapCache(
+            self.c_client,
+            self.netuid,
+            refresh_interval=self.settings.module_cache_refresh_interval,
+            with_details=False,
+        )
+
         # Initialize other attributes
         self.challenge_gen = ChallengeGenerator()
         self.verifier = Verifier()
         self.miner_data: Dict[str, float] = {}
         self.container_start_times: Dict[str, datetime] = {}
+        self.pending_payment_updates: Dict[str, None] = {}
+        self.ssh_pool = SSHConnectionPool(
+            max_open=self.settings.ssh_pool_max_open,
+            idle_ttl=self.settings.ssh_pool_idle_ttl,
+        )
+        self.spec_cache = SpecCache(ttl=self.settings.spec_cache_ttl)
+        self.orchestrator = OrchestratorSnapshotFetcher(max_age=self.settings.orchestrator_snapshot_max_age)
+        self.verification_engine = VerificationEngine(
+            probe=functools.partial(fetch_compute_specs, pool=self.ssh_pool, cache=self.spec_cache),
+            concurrency=self.settings.verification_concurrency,
+            miner_timeout=self.settings.verification_miner_timeout,
+            cycle_timeout=self.settings.verification_cycle_timeout,
+        )
+        # Verification runs on the process-wide event loop; release pooled
+        # connections when it shuts down
+        runner = get_async_runner()
+        runner.add_cleanup(self.ssh_pool.close_all)
+        runner.add_cleanup(self.orchestrator.close)
 
     def track_miner_containers(self):
         """Fetch and update active containers for each miner."""
@@ -66,10 +104,8 @@ class ValidatorNode(Module):
     def get_miners(self) -> List[str]:
         """Fetch miners from the network."""
         try:
-            miner_keys = self.client.query_map_key(self.netuid)
             # Extract and return the list of UIDs
-            # return list(self.client.query_map_key(self.netuid).values())
-            return list(miner_keys.keys())
+            return [int(uid) for uid in self.module_cache.get()]
         except Exception as e:
             logger.error(f"Error fetching miners: {e}")
             return []
@@ -77,7 +113,10 @@ class ValidatorNode(Module):
     def get_containers_for_miner(self, miner_uid: str) -> List[str]:
         """Fetch container IDs associated with a miner."""
         try:
-            response = requests.get(f"https://orchestrator-gekh.onrender.com/api/v1/containers/miner/{miner_uid}")
+            response = self.orchestrator.session.get(
+                f"{self.orchestrator.base_url}/containers/miner/{miner_uid}",
+                timeout=self.orchestrator.timeout,
+            )
             if response.status_code == 200:
                 return response.json()
             logger.warning(f"No containers yet for {miner_uid}")
@@ -85,23 +124,35 @@ class ValidatorNode(Module):
             logger.error(f"Error fetching containers for miner {miner_uid}: {e}")
         return []
 
+    def get_containers_for_miners(self, miner_uids: List[str]) -> Dict[str, List]:
+        """Fetch container lists for many miners concurrently over the pooled session."""
+        if not miner_uids:
+            return {}
+        workers = min(self.settings.container_fetch_concurrency, len(miner_uids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="containers") as executor:
+            return dict(zip(miner_uids, executor.map(self.get_containers_for_miner, miner_uids)))
+
     def get_filtered_miners(self, allowed_commune_uids: List[int]) -> Dict[str, str]:
         """Fetch verified miners and return only those in the allowed_commune_uids list."""
-        try:
-            response = requests.get("https://orchestrator-gekh.onrender.com/api/v1/commune/miners")
-            if response.status_code == 200:
-                miners_data = response.json()
-                # Filter miners based on allowed_commune_uids
-                filtered_miners = {
-                    miner["miner_id"]: miner["network_info"]["commune_uid"]
-                    for miner in miners_data
-                    if miner["network_info"]["commune_uid"] in map(str, allowed_commune_uids) and miner.get("miner_id")
-                }
-                return filtered_miners
+        miners_data = self.orchestrator.get("/commune/miners")
+        if miners_data is None:
+            return {}
+        if not miners_data:
             logger.warning(f"No verified miners yet on the network")
+            return {}
+        try:
+            allowed = set(map(str, allowed_commune_uids))
+            # Filter miners based on allowed_commune_uids
+            filtered_miners = {
+                miner["miner_id"]: miner["network_info"]["commune_uid"]
+                for miner in miners_data
+                if miner["network_info"]["commune_uid"] in allowed and miner.get("miner_id")
+            }
+            return filtered_miners
         except Exception as e:
             logger.error(f"Error fetching miner list: {e}")
         return {}
+
     def get_miner_list_with_resources(self, miner_commune_map: Dict[str, str]) -> Dict:
         """
         Fetch verified miners from the network along with their compute resources.
@@ -113,22 +164,19 @@ class ValidatorNode(Module):
         Returns:
             Dict: Dictionary containing miner IDs, their compute resources, and commune_uids.
         """
-        verified_miners = {}
+        miners_data = self.orchestrator.get("/miners")
+        if miners_data is None:
+            return {}
         try:
-            response = requests.get("https://orchestrator-gekh.onrender.com/api/v1/miners")
-            if response.status_code == 200:
-                miners_data = response.json()
-                verified_miners = {
-                    miner["id"]: {
-                        "compute_resources": miner["compute_resources"],
-                        "commune_uid": miner_commune_map.get(miner["id"])
-                    }
-                    for miner in miners_data
-                    if miner["status"] == "verified" and miner["id"] in miner_commune_map
+            verified_miners = {
+                miner["id"]: {
+                    "compute_resources": miner["compute_resources"],
+                    "commune_uid": miner_commune_map.get(miner["id"])
                 }
-                return verified_miners
-            else:
-                print(f"Failed to fetch miners. Status code: {response.status_code}")
+                for miner in miners_data
+                if miner["status"] == "verified" and miner["id"] in miner_commune_map
+            }
+            return verified_miners
         except Exception as e:
             print(f"Error fetching miner list: {e}")
         return {}
@@ -138,19 +186,16 @@ class ValidatorNode(Module):
         Fetch verified miners from the network along with their compute resources.
         Returns a dictionary containing miner IDs and their compute resources.
         """
-        unverified_miners={}
+        miners_data = self.orchestrator.get("/miners")
+        if miners_data is None:
+            return {}
         try:
-            response = requests.get("https://orchestrator-gekh.onrender.com/api/v1/miners")
-            if response.status_code == 200:
-                miners_data = response.json()
-                unverified_miners = {
-                    miner["id"]: miner["compute_resources"]
-                    for miner in miners_data
-                    if miner["status"] == "pending_verification"
-                }
-                return unverified_miners
-            else:
-                print(f"Failed to fetch miners. Status code: {response.status_code}")
+            unverified_miners = {
+                miner["id"]: miner["compute_resources"]
+                for miner in miners_data
+                if miner["status"] == "pending_verification"
+            }
+            return unverified_miners
         except Exception as e:
             print(f"Error fetching miner list: {e}")
         return {}
@@ -158,36 +203,50 @@ class ValidatorNode(Module):
 
     def verify_miners(self,miners):
         compute_resources = self.get_unverified_miners()
-        active_miners=list(compute_resources.keys())
-        if active_miners:
-            for miner in miners:
-                pog_scores=0
-                if miner not in [m for m in active_miners]:
-                    logger.debug(f"Miner {miner} is not active. Skipping...")
-                    continue
-                #test for proof of resources
-                miner_resources=compute_resources.get(miner, None)
-                ssh_and_password=self.extract_ssh_and_password(miner_resources)
-                if "error" not in ssh_and_password:
-                    ssh_string = ssh_and_password["ssh_string"]
-                    password = ssh_and_password["password"]
-                    # ssh_string="ssh tobius@5.tcp.eu.ngrok.io -p 19747"
-                    # password="masaka1995t"
-                    # Use the extracted SSH and password in fetch_compute_specs
-                    result = fetch_compute_specs(ssh_string, password)
-                    pog_scores =compare_compute_resources(result,miner_resources[0])
-                    logger.info(f"Miner {miner}'s results from pog {pog_scores}")
-                    pog_scores=int(pog_scores["score"])
-                    if pog_scores>=10:
-                        self.update_miner_status(miner)
-                    else:
-                        logger.info(f"Miner {miner} is unverified")
-                else:
-                    logger.info(f"Miner {miner} is unverified")
-            return logger.info(f"Pending miner verification has been executed")
-        else:
+        if not compute_resources:
             return logger.info(f"Currently no pending miners to verify")
 
+        jobs = []
+        for miner in miners:
+            if miner not in compute_resources:
+                logger.debug(f"Miner {miner} is not active. Skipping...")
+                continue
+            #test for proof of resources
+            miner_resources = compute_resources[miner]
+            ssh_and_password = self.extract_ssh_and_password(miner_resources)
+            if "error" in ssh_and_password:
+                logger.info(f"Miner {miner} is unverified")
+                continue
+            jobs.append(VerificationJob(
+                miner_id=miner,
+                ssh_string=ssh_and_password["ssh_string"],
+                password=ssh_and_password["password"],
+                claimed_resources=miner_resources[0],
+                probe_kwargs={"cache_key": miner},
+            ))
+
+        if jobs:
+            get_async_runner().run(self._verify_jobs(jobs))
+            self.spec_cache.save()
+        return logger.info(f"Pending miner verification has been executed")
+
+    async def _verify_jobs(self, jobs: List[VerificationJob]) -> None:
+        """Probe pending miners concurrently and update each as its result arrives."""
+        loop = asyncio.get_running_loop()
+        async for result in self.verification_engine.verify(jobs):
+            miner = result.miner_id
+            if not result.ok:
+                logger.info(f"Miner {miner} is unverified: {result.error}")
+                continue
+            pog_scores = compare_compute_resources(result.specs, result.job.claimed_resources)
+            logger.info(f"Miner {miner}'s results from pog {pog_scores} ({result.elapsed:.1f}s)")
+            if int(pog_scores["score"]) >= 10:
+                await loop.run_in_executor(None, self.update_miner_status, miner)
+                # The miner list changed; revalidate it on next read
+                self.orchestrator.invalidate("/miners")
+            else:
+                logger.info(f"Miner {miner} is unverified")
+
 
     def update_miner_status(self,miner_id):
         """
@@ -222,6 +281,9 @@ class ValidatorNode(Module):
         Process miners to validate their containers, calculate final scores,
         and return the results in the required format.
 
+        Container lists for all active miners are fetched concurrently, and the
+        payment status updates are queued and flushed once at the end.
+
         Args:
             miners: List of miner UIDs to check.
             active_miners: List of active miners with their details.
@@ -230,63 +292,108 @@ class ValidatorNode(Module):
             List of dictionaries with miner UID, final score, and number of rewarded containers.
         """
         results = []
-        active_miners=[int(value["commune_uid"]) for value in miner_resources.values()]
+        active_miners = {int(value["commune_uid"]) for value in miner_resources.values()}
         print(f"active miners f{active_miners}")
+
+        # Miner IDs registered under each commune UID
+        miner_ids_by_uid = defaultdict(list)
+        for key, value in miner_resources.items():
+            miner_ids_by_uid[value["commune_uid"]].append(key)
+
+        targets = []
         for miner in miners:
-            compute_score=0
+            if miner not in active_miners:
+                logger.debug(f"Miner {miner} is not active. Skipping...")
+                continue
+            targets.append(miner)
+
+        # Fetch containers for all active miners at once
+        containers_by_id = self.get_containers_for_miners(
+            [key for miner in targets for key in miner_ids_by_uid[str(miner)]]
+        )
+
+        for miner in targets:
+            compute_score = 0
             total_termination_time = 0
             total_score = 0.0
             rewarded_containers = 0
-            if miner not in [m for m in active_miners]:
-                logger.debug(f"Miner {miner} is not active. Skipping...")
-                continue
             # Getting miners scores depending on the specs
-            for key, value in miner_resources.items():
-                if value["commune_uid"] == str(miner):
-                    compute_score=compute_resource_score(value["compute_resources"])
-                    # Fetch containers for the miner
-                    containers = self.get_containers_for_miner(key)
-                    for container in containers:
+            for key in miner_ids_by_uid[str(miner)]:
+                compute_score = compute_resource_score(miner_resources[key]["compute_resources"])
+                for container in containers_by_id.get(key, []):
                     # Process only active containers with pending payment
-                        if container['status'] == 'terminated' and container['payment_status'] == 'pending':
-                            scheduled_termination = container['subnet_details'].get('scheduled_termination', 0)
-                            total_termination_time += scheduled_termination
-                            rewarded_containers += 1
-                            total_score=total_termination_time 
-                            self.update_container_payment_status(container['container_id']) 
-                        
-                         
-                        # If containers are processed, calculate the final score
-                        if rewarded_containers > 0:
-                            average_score = total_score / rewarded_containers
-                            final_score = average_score + total_termination_time + compute_score[0]
-                            results.append({
-                                'miner_uid': miner,
-                                'final_score': final_score
-                            }) 
-            return results
-
-    def update_container_payment_status(container_id: str):
+                    if container['status'] == 'terminated' and container['payment_status'] == 'pending':
+                        scheduled_termination = container['subnet_details'].get('scheduled_termination', 0)
+                        total_termination_time += scheduled_termination
+                        rewarded_containers += 1
+                        total_score = total_termination_time
+                        self.queue_container_payment_status(container['container_id'])
+
+            # If containers are processed, calculate the final score
+            if rewarded_containers > 0:
+                average_score = total_score / rewarded_containers
+                final_score = average_score + total_termination_time + compute_score[0]
+                results.append({
+                    'miner_uid': miner,
+                    'final_score': final_score
+                })
+
+        self.flush_container_payment_statuses()
+        return results
+
+    def queue_container_payment_status(self, container_id: str) -> None:
+        """Queue a container's payment status update for the next flush."""
+        self.pending_payment_updates[container_id] = None
+
+    def flush_container_payment_statuses(self) -> int:
+        """
+        Send all queued payment status updates concurrently.
+
+        Updates that fail stay queued and are retried on the next flush.
+
+        Returns:
+            int: Number of containers successfully updated.
+        """
+        container_ids = list(self.pending_payment_updates)
+        if not container_ids:
+            return 0
+
+        workers = min(self.settings.container_fetch_concurrency, len(container_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="payments") as executor:
+            outcomes = list(executor.map(self.update_container_payment_status, container_ids))
+
+        updated = 0
+        for container_id, success in zip(container_ids, outcomes):
+            if success:
+                self.pending_payment_updates.pop(container_id, None)
+                updated += 1
+        logger.info(f"Updated payment status for {updated}/{len(container_ids)} containers")
+        return updated
+
+    def update_container_payment_status(self, container_id: str):
         """
         Update the payment status of a container using the PATCH method.
 
         Args:
             container_id (str): The ID of the container to update.
-            api_url (str): The API endpoint to update the container payment status.
 
         Returns:
             bool: True if the update is successful, False otherwise.
         """
-        api_url: str = "https://orchestrator-gekh.onrender.com/api/v1/containers/{container_id}/payment"
         try:
             # Construct the full API URL
-            full_url = api_url.format(container_id=container_id)
+            full_url = f"{self.orchestrator.base_url}/containers/{container_id}/payment"
 
             # Data to be sent in the PATCH request
             data = {"status": "completed"}
 
             # Send the PATCH request
-            response = requests.patch(full_url, json=data, headers={"Content-Type": "application/json"})
+            response = self.orchestrator.session.patch(
+                full_url,
+                json=data,
+                headers={"Content-Type": "application/json"},
+                timeout=self.orchestrator.timeout,
+            )
 
             # Check for successful update
             if response.status_code == 200:
@@ -303,10 +410,7 @@ class ValidatorNode(Module):
 
     def cut_to_max_allowed_weights(self, score_dict: Dict[str, float]) -> Dict[str, float]:
         """Limit the number of weights to the max allowed."""
-        if len(score_dict) > self.max_allowed_weights:
-            sorted_scores = sorted(score_dict.items(), key=lambda x: x[1], reverse=True)
-            return dict(sorted_scores[:self.max_allowed_weights])
-        return score_dict
+        return select_top_weights(score_dict, self.max_allowed_weights, normalization=None)
 
     def normalize_scores(self, scores: Dict[str, float]) -> Dict[str, float]:
         """Normalize scores to a range of 0 to 1."""
@@ -1,10 +1,11 @@
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import time
 
 import bittensor as bt
 from bittensor import Keypair
 
+from validator.src.validator_node.base.resolution import ResolutionIndex
 from validator.src.validator_node.base.validator_base import BaseValidator
 from validator.src.validator_node.settings import ValidatorNodeSettings
 from validator.src.validator_node.utils.firebase_client import FirebaseClient
@@ -28,6 +29,8 @@ class BittensorValidator(BaseValidator):
         self.wallet = bt.wallet(name=settings.wallet_name, hotkey=settings.hotkey)
         self.client = bt.subtensor(network=settings.network)
         self.firebase_client = FirebaseClient.get_instance()
+        # Miner and UID lookups for the current cycle, rebuilt by track_miner_containers
+        self.resolution_index: Optional[ResolutionIndex] = None
         logger.info(f"Initialized Bittensor validator for netuid {self.netuid}")
     
     def get_miners(self) -> List[str]:
@@ -56,8 +59,17 @@ class BittensorValidator(BaseValidator):
             logger.error(f"Error fetching Bittensor miners: {e}")
             return []
     
+    def build_resolution_index(self, miner_resources: Dict) -> ResolutionIndex:
+        """Index this cycle's miner resources against one metagraph snapshot."""
+        metagraph = self.subtensor.metagraph(netuid=self.netuid)
+        index = ResolutionIndex.from_snapshot(miner_resources, metagraph.hotkeys, metagraph.uids.tolist())
+        logger.debug(f"Indexed {len(index.resources)} miners against {len(index.hotkey_to_uid)} hotkeys")
+        return index
+    
     def get_blockchain_uid(self, hotkey: str) -> int:
         """Get the UID of a hotkey on the blockchain."""
+        if self.resolution_index is not None:
+            return self.resolution_index.uid_for_hotkey(hotkey)
         try:
             return self.subtensor.get_uid_for_hotkey(hotkey, self.netuid)
         except Exception as e:
@@ -160,6 +172,11 @@ class BittensorValidator(BaseValidator):
         
         # Get miner details and verify them
         miner_resources = self.get_miner_list_with_resources({miner_id: miner_id for miner_id in miners})
+        try:
+            self.resolution_index = self.build_resolution_index(miner_resources)
+        except Exception as e:
+            logger.error(f"Error loading metagraph snapshot, resolving UIDs per miner: {e}")
+            self.resolution_index = None
         verified_miners = self.verify_miners(miners)
         
         # Filter to only include verified miners
@@ -187,16 +204,26 @@ class BittensorValidator(BaseValidator):
                 logger.warning("No weights to submit")
                 return False
             
-            # Convert miner IDs to UIDs and normalize
+            # Convert miner IDs to UIDs and normalize. Resources are reused from
+            # the tracking cycle, but UIDs are re-read from a fresh metagraph:
+            # a UID may have been deregistered and re-registered since then.
+            miner_resources = dict(self.resolution_index.resources) if self.resolution_index else {}
+            missing = {miner_id: miner_id for miner_id in weights if miner_id not in miner_resources}
+            if missing:
+                # Miners scored in earlier cycles are fetched together, not one request each
+                miner_resources.update(self.get_miner_list_with_resources(missing))
+            try:
+                self.resolution_index = self.build_resolution_index(miner_resources)
+            except Exception as e:
+                logger.error(f"Error loading metagraph snapshot, resolving UIDs per miner: {e}")
+                self.resolution_index = None
+            
             weights_by_uid = {}
             for miner_id, score in weights.items():
-                # Get resources for this miner
-                miner_resources = self.get_miner_list_with_resources({miner_id: miner_id})
                 if miner_id not in miner_resources:
                     logger.warning(f"No resources found for miner {miner_id}, skipping weight submission")
                     continue
                 
-                # Get hotkey and UID
                 hotkey = miner_resources[miner_id].get('hotkey')
                 if not hotkey:
                     logger.warning(f"No hotkey found for miner {miner_id}, skipping weight submission")
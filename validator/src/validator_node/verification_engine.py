@@ -0,0 +1,180 @@
+"""
+Concurrent Verification Engine
+
+This module runs proof-of-GPU probes against many miners in parallel. Each
+probe runs on a worker thread (paramiko is blocking) while an asyncio loop
+enforces a concurrency limit, a deadline per miner and a deadline for the
+whole cycle, yielding results in completion order.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+from loguru import logger
+
+from validator.src.validator_node.pog import fetch_compute_specs
+
+
+@dataclass
+class VerificationJob:
+    """A single miner to be probed."""
+    miner_id: str
+    ssh_string: str
+    password: str
+    claimed_resources: Dict[str, Any] = field(default_factory=dict)
+    probe_kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class VerificationResult:
+    """Outcome of probing a single miner."""
+    job: VerificationJob
+    specs: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def miner_id(self) -> str:
+        return self.job.miner_id
+
+    @property
+    def ok(self) -> bool:
+        return self.specs is not None and self.error is None
+
+
+class VerificationEngine:
+    """Runs miner probes concurrently under per-miner and per-cycle deadlines."""
+
+    def __init__(
+        self,
+        probe: Callable[..., Dict[str, Any]] = fetch_compute_specs,
+        concurrency: int = 32,
+        miner_timeout: float = 60.0,
+        cycle_timeout: float = 600.0,
+    ):
+        """Initialize the verification engine.
+
+        Args:
+            probe: Blocking callable taking (ssh_string, password, timeout=...,
+                **job.probe_kwargs) and returning the remote compute specs
+            concurrency: Maximum number of miners probed at the same time
+            miner_timeout: Total time allowed for a single miner's probe, in seconds
+            cycle_timeout: Total time allowed for a whole verification cycle, in seconds
+        """
+        self.probe = probe
+        self.concurrency = max(1, int(concurrency))
+        self.miner_timeout = miner_timeout
+        self.cycle_timeout = cycle_timeout
+
+    async def verify(self, jobs: Iterable[VerificationJob]) -> AsyncIterator[VerificationResult]:
+        """Probe every job concurrently and yield results as they complete.
+
+        Jobs still running when the cycle deadline expires are cancelled and
+        yielded as timed-out results, so every job produces exactly one result.
+
+        Args:
+            jobs: Miners to probe
+
+        Yields:
+            VerificationResult: One result per job, in completion order
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.cycle_timeout
+        semaphore = asyncio.Semaphore(self.concurrency)
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(jobs)),
+            thread_name_prefix="pog-probe",
+        )
+
+        tasks = {
+            asyncio.ensure_future(self._run_job(job, semaphore, executor)): job
+            for job in jobs
+        }
+        pending = set(tasks)
+        started = time.monotonic()
+        logger.info(
+            f"Verifying {len(jobs)} miners (concurrency={self.concurrency}, "
+            f"miner_timeout={self.miner_timeout}s, cycle_timeout={self.cycle_timeout}s)"
+        )
+
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                job = tasks[task]
+                logger.warning(f"Verification of miner {job.miner_id} cancelled by cycle deadline")
+                yield VerificationResult(
+                    job=job,
+                    error="Verification cycle deadline exceeded",
+                    timed_out=True,
+                    elapsed=time.monotonic() - started,
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+            # Probes that overran their deadline keep their thread until the
+            # SSH timeout fires; don't block the cycle waiting for them.
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info(f"Verification cycle finished in {time.monotonic() - started:.1f}s")
+
+    async def _run_job(
+        self,
+        job: VerificationJob,
+        semaphore: asyncio.Semaphore,
+        executor: ThreadPoolExecutor,
+    ) -> VerificationResult:
+        """Probe a single miner, bounded by the semaphore and the miner deadline.
+
+        The miner deadline starts when a worker thread picks the probe up, not
+        when it is queued: a probe that overran its deadline keeps its thread
+        until its SSH timeouts fire, and the miners queued behind it must not
+        be charged for that wait.
+        """
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            probe_started = asyncio.Event()
+
+            def run_probe():
+                loop.call_soon_threadsafe(probe_started.set)
+                return self.probe(job.ssh_string, job.password, timeout=self.miner_timeout, **job.probe_kwargs)
+
+            future = loop.run_in_executor(executor, run_probe)
+            waiter = asyncio.ensure_future(probe_started.wait())
+            try:
+                await asyncio.wait({future, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                waiter.cancel()
+
+            started = time.monotonic()
+            try:
+                specs = await asyncio.wait_for(future, timeout=self.miner_timeout)
+                return VerificationResult(job=job, specs=specs, elapsed=time.monotonic() - started)
+            except asyncio.TimeoutError:
+                logger.warning(f"Verification of miner {job.miner_id} timed out after {self.miner_timeout}s")
+                return VerificationResult(
+                    job=job,
+                    error=f"Probe exceeded {self.miner_timeout}s deadline",
+                    timed_out=True,
+                    elapsed=time.monotonic() - started,
+                )
+            except Exception as e:
+                logger.error(f"Verification of miner {job.miner_id} failed: {e}")
+                return VerificationResult(job=job, error=str(e), elapsed=time.monotonic() - started)
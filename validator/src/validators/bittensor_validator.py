@@ -4,6 +4,7 @@ Bittensor-specific validator implementation for the Polaris validator system.
 This module defines the BittensorValidator class that handles validation and
 weight submission for the Bittensor network.
 """
+import asyncio
 import logging
 import time
 import math
@@ -13,6 +14,8 @@ import bittensor as bt
 
 from validator.src.validators.base_validator import BaseValidator
 from validator.src.config import ValidatorConfig
+from validator.src.utils.execution import BatchExecutor
+from validator.src.utils.hardware_verification import verify_hardware_batch
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +55,9 @@ class BittensorValidator(BaseValidator):
         # Weight settings
         self.max_weight = config.max_weight_value
         self.min_score_for_weight = config.min_score_for_weight
+        
+        # Parsing and scoring of large batches can be moved off this thread
+        self.batch_executor = BatchExecutor.from_config(config)
     
     def _initialize_bittensor(self):
         """Initialize Bittensor components (subtensor, wallet, metagraph)."""
@@ -163,6 +169,31 @@ class BittensorValidator(BaseValidator):
             logger.error(f"Error verifying registration for miner {miner_id}: {e}")
             return False, f"Error during verification: {str(e)}"
     
+    def verify_hardware(self, miners: Dict[str, Dict[str, Any]],
+                        container_data: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Probe and score the hardware of many miners.
+        
+        SSH probes run concurrently on an event loop; parsing and scoring use
+        the configured execution strategy.
+        
+        Args:
+            miners: Miner registration data keyed by miner ID
+            container_data: Container usage data keyed by miner ID
+        
+        Returns:
+            Dictionary mapping miner IDs to {'specs': ..., 'score': ...}
+        """
+        return asyncio.run(verify_hardware_batch(
+            miners,
+            self.batch_executor,
+            self.config.scoring,
+            container_data,
+            ssh_concurrency=self.config.ssh_concurrency,
+            connection_timeout=self.config.ssh_connection_timeout,
+            command_timeout=self.config.ssh_command_timeout
+        ))
+    
     def normalize_scores(self, miner_scores: Dict[str, float]) -> Dict[str, float]:
         """
         Normalize miner scores to weights that sum to 1.0.